@@ -3,4 +3,10 @@ from django.apps import AppConfig
 
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.accounts'
\ No newline at end of file
+    name = 'apps.accounts'
+
+    def ready(self):
+        from apps.images.derivatives import track_image_derivatives
+
+        # 프로필 사진 WebP 파생본 생성
+        track_image_derivatives(self.get_model('UserProfile'), 'avatar')
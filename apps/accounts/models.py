@@ -51,6 +51,7 @@ class UserProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
     bio = models.TextField(max_length=500, blank=True)
     avatar = models.ImageField(upload_to='avatars/', blank=True, null=True)
+    avatar_derivatives = models.JSONField(default=dict, blank=True, editable=False)
     notification_enabled = models.BooleanField(default=True)
     email_notification = models.BooleanField(default=True)
     push_notification = models.BooleanField(default=True)
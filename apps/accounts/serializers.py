@@ -1,6 +1,9 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
+from django.db import transaction
+from apps.characters.models import Character
+from apps.images.serializers import ImageDerivativesField
 from .models import User, UserProfile
 
 
@@ -21,8 +24,11 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         validated_data.pop('password_confirm')
-        user = User.objects.create_user(**validated_data)
-        UserProfile.objects.create(user=user)
+        with transaction.atomic():
+            user = User.objects.create_user(**validated_data)
+            UserProfile.objects.create(user=user)
+            # 요청마다 get_or_create 하지 않도록 가입 시 캐릭터를 함께 생성
+            Character.create_for_user(user)
         return user
 
 
@@ -49,9 +55,11 @@ class UserLoginSerializer(serializers.Serializer):
 
 class UserProfileSerializer(serializers.ModelSerializer):
     """사용자 프로필 시리얼라이저"""
+    avatar_urls = ImageDerivativesField('avatar')
+
     class Meta:
         model = UserProfile
-        fields = ('bio', 'avatar', 'notification_enabled', 'email_notification',
+        fields = ('bio', 'avatar', 'avatar_urls', 'notification_enabled', 'email_notification',
                  'push_notification', 'privacy_level')
 
 
@@ -125,6 +125,8 @@ class AuthAPITest(APITestCase):
         # 사용자가 실제로 생성되었는지 확인
         user = User.objects.get(email=self.user_data['email'])
         self.assertEqual(user.nickname, self.user_data['nickname'])
+        # 캐릭터가 가입과 함께 생성되었는지 확인
+        self.assertEqual(user.character.name, f"{self.user_data['nickname']}의 캐릭터")
     
     def test_user_registration_password_mismatch(self):
         """비밀번호 불일치 회원가입 테스트"""
@@ -0,0 +1,135 @@
+"""업적 평가 엔진
+
+활성 업적을 requirement_type별로 임계값 순으로 정렬해 메모리에 올려 두고,
+캐릭터 이벤트(레벨업, 퀘스트 완료, 연속 기록 변화)가 발생하면 이전 값과
+새 값 사이에서 새로 넘어선 임계값만 bisect로 찾는다.
+업적 전체를 훑거나 COUNT 쿼리를 실행하지 않는다.
+"""
+import time
+from bisect import bisect_right
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .ledger import currency_entries
+from .models import Achievement, UserAchievement, STAT_FIELDS
+
+# 다른 프로세스에서 변경된 업적을 다시 읽어오는 주기(초)
+ACHIEVEMENT_INDEX_TTL = 300
+
+
+class AchievementIndex:
+    """requirement_type별 임계값 정렬 인덱스"""
+
+    def __init__(self, achievements):
+        self._thresholds = {}
+        self._achievements = {}
+        for achievement in sorted(achievements, key=lambda a: (a.requirement_value, a.pk)):
+            self._thresholds.setdefault(achievement.requirement_type, []).append(achievement.requirement_value)
+            self._achievements.setdefault(achievement.requirement_type, []).append(achievement)
+        self.loaded_at = time.monotonic()
+
+    @classmethod
+    def load(cls):
+        return cls(Achievement.objects.filter(is_active=True))
+
+    def crossed(self, requirement_type, old_value, new_value):
+        """old_value < 임계값 <= new_value 인 업적 목록"""
+        thresholds = self._thresholds.get(requirement_type)
+        if not thresholds or new_value <= old_value:
+            return []
+        start = bisect_right(thresholds, old_value)
+        end = bisect_right(thresholds, new_value)
+        return self._achievements[requirement_type][start:end]
+
+
+_index = None
+
+
+def get_achievement_index():
+    """프로세스 단위로 캐시된 업적 인덱스"""
+    global _index
+    if _index is None or time.monotonic() - _index.loaded_at > ACHIEVEMENT_INDEX_TTL:
+        _index = AchievementIndex.load()
+    return _index
+
+
+@receiver(post_save, sender=Achievement)
+@receiver(post_delete, sender=Achievement)
+def invalidate_achievement_index(**kwargs):
+    """업적이 변경되면 인덱스를 다시 읽도록 초기화"""
+    global _index
+    _index = None
+
+
+def achievement_progress(character, streak=None):
+    """업적 조건별 현재 값 (모두 감소하지 않는 값)"""
+    progress = {
+        'quest_count': character.quests_completed,
+        'level': character.level,
+        'stat_level': max(getattr(character, stat) for stat in STAT_FIELDS),
+    }
+    if streak is not None:
+        # 현재 연속 기록은 끊기면 다시 1부터 시작하므로 최고 기록으로 평가
+        progress['streak'] = streak.longest_streak
+    return progress
+
+
+def evaluate_achievements(user, before, after):
+    """이전/이후 진행 값 사이에서 새로 달성한 업적을 부여하고 반환"""
+    index = get_achievement_index()
+    candidates = {}
+    for requirement_type, new_value in after.items():
+        old_value = before.get(requirement_type, new_value)
+        for achievement in index.crossed(requirement_type, old_value, new_value):
+            candidates[achievement.pk] = achievement
+
+    if not candidates:
+        return []
+
+    # 관리자가 수동으로 부여했거나 값이 되돌아갔다 다시 넘은 경우 보상 중복 지급 방지
+    owned = set(
+        UserAchievement.objects.filter(
+            user=user,
+            achievement_id__in=candidates
+        ).values_list('achievement_id', flat=True)
+    )
+    granted = [achievement for pk, achievement in candidates.items() if pk not in owned]
+
+    UserAchievement.objects.bulk_create(
+        [UserAchievement(user=user, achievement=achievement) for achievement in granted],
+        ignore_conflicts=True
+    )
+    return granted
+
+
+def apply_achievement_rewards(character, achievements):
+    """업적 보상을 캐릭터에 반영 (저장하지 않음)"""
+    for achievement in achievements:
+        character.gold += achievement.reward_gold
+        character.gems += achievement.reward_gems
+        character.add_experience(achievement.reward_experience)
+
+
+def grant_achievements(user, character, before, after):
+    """새로 달성한 업적을 부여하고 보상을 캐릭터에 반영 (저장하지 않음), 부여한 업적 반환
+
+    업적 경험치로 레벨이 오르면 레벨 업적을 다시 평가한다.
+    """
+    granted = []
+    new = evaluate_achievements(user, before, after)
+    while new:
+        granted.extend(new)
+        level_before = character.level
+        apply_achievement_rewards(character, new)
+        new = evaluate_achievements(user, {'level': level_before}, {'level': character.level})
+    return granted
+
+
+def achievement_entries(user_id, achievements):
+    """업적 골드/젬 보상의 원장 기록 (저장하지 않음)"""
+    return [
+        entry for achievement in achievements
+        for entry in currency_entries(
+            user_id, 'achievement', f"업적 달성: {achievement.name}",
+            gold=achievement.reward_gold, gems=achievement.reward_gems
+        )
+    ]
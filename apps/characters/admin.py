@@ -1,9 +1,11 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from django.db.models import Count, Avg
+from .ledger import currency_entries, record_transactions
 from .models import (
-    Character, Achievement, UserAchievement, StatHistory,
-    NutritionLog, Supplement, UserSupplement, SupplementLog
+    Character, Achievement, UserAchievement, StatHistory, StatDailyRollup,
+    CurrencyTransaction, CurrencySnapshot,
+    NutritionLog, NutritionDailyRollup, Supplement, UserSupplement, SupplementLog
 )
 
 
@@ -16,12 +18,13 @@ class CharacterAdmin(admin.ModelAdmin):
     
     fieldsets = (
         ('기본 정보', {
-            'fields': ('user', 'name', 'level', 'experience_points')
+            'fields': ('user', 'name', 'level', 'experience_points', 'quests_completed')
         }),
         ('스탯', {
             'fields': (
                 'stamina', 'strength', 'mental', 'endurance',
-                'cardio', 'flexibility', 'nutrition', 'recovery'
+                'cardio', 'flexibility', 'nutrition', 'recovery',
+                'unspent_stat_points'
             )
         }),
         ('보상', {
@@ -36,6 +39,37 @@ class CharacterAdmin(admin.ModelAdmin):
         }),
     )
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change:
+            # 관리자가 직접 바꾼 골드/젬은 원장에 조정 기록으로 남김
+            record_transactions(currency_entries(
+                obj.user_id, 'adjustment', f"관리자 수정: {request.user}",
+                gold=obj.gold - form.initial.get('gold', obj.gold),
+                gems=obj.gems - form.initial.get('gems', obj.gems)
+            ))
+
+
+@admin.register(CurrencyTransaction)
+class CurrencyTransactionAdmin(admin.ModelAdmin):
+    list_display = ('user', 'currency', 'amount', 'kind', 'reason', 'created_at')
+    list_filter = ('currency', 'kind', 'created_at')
+    search_fields = ('user__nickname', 'user__email', 'reason')
+    readonly_fields = ('user', 'currency', 'amount', 'kind', 'reason', 'created_at')
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(CurrencySnapshot)
+class CurrencySnapshotAdmin(admin.ModelAdmin):
+    list_display = ('user', 'currency', 'balance', 'last_transaction_id', 'updated_at')
+    list_filter = ('currency',)
+    search_fields = ('user__nickname', 'user__email')
+
 
 @admin.register(Achievement)
 class AchievementAdmin(admin.ModelAdmin):
@@ -59,6 +93,20 @@ class StatHistoryAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at',)
 
 
+@admin.register(StatDailyRollup)
+class StatDailyRollupAdmin(admin.ModelAdmin):
+    list_display = ('character', 'stat_type', 'date', 'last_value', 'change_count', 'total_gain')
+    list_filter = ('stat_type', 'date')
+    search_fields = ('character__name',)
+
+
+@admin.register(NutritionDailyRollup)
+class NutritionDailyRollupAdmin(admin.ModelAdmin):
+    list_display = ('user', 'date', 'meal_count', 'score_sum', 'updated_at')
+    list_filter = ('date',)
+    search_fields = ('user__nickname',)
+
+
 @admin.register(NutritionLog)
 class NutritionLogAdmin(admin.ModelAdmin):
     list_display = ('user', 'date', 'meal_type', 'meal_quality', 'nutrition_score_display', 'created_at')
@@ -99,6 +147,7 @@ class NutritionLogAdmin(admin.ModelAdmin):
             color, score
         )
     nutrition_score_display.short_description = '영양 점수'
+    nutrition_score_display.admin_order_field = 'nutrition_score'
     
     def get_queryset(self, request):
         return super().get_queryset(request).select_related('user')
@@ -3,4 +3,13 @@ from django.apps import AppConfig
 
 class CharactersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.characters'
\ No newline at end of file
+    name = 'apps.characters'
+
+    def ready(self):
+        # 업적 변경 시 인덱스 초기화, 캐릭터 저장 시 스탯 캐시 무효화/리더보드 갱신,
+        # 캐릭터 생성 시 기초 잔액 기록, 영양 기록 변경 시 일일 요약 갱신 시그널 등록
+        from . import achievements, leaderboards, ledger, nutrition_rollups, stats_cache  # noqa: F401
+        from apps.images.derivatives import track_image_derivatives
+
+        # 식사 사진 WebP 파생본 생성
+        track_image_derivatives(self.get_model('NutritionLog'), 'meal_image')
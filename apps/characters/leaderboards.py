@@ -0,0 +1,114 @@
+"""레벨/스탯 리더보드 (Redis sorted set)
+
+보드마다 sorted set 하나를 두고 멤버는 사용자 id, 점수는 보드 값이다. 레벨 보드는
+같은 레벨 안에서도 순서가 갈리도록 누적 경험치를 점수로 쓴다. 캐릭터가 저장되면
+커밋 이후 모든 보드의 점수를 갱신하며, Redis 장애는 보상 처리에 영향을 주지 않도록
+기록만 하고 넘긴다 (rebuild_leaderboards로 다시 맞출 수 있다).
+"""
+import logging
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .leveling import total_experience
+from .models import Character, STAT_FIELDS
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARDS = ('level', 'total_stats', *STAT_FIELDS)
+SCORE_FIELDS = ('user_id', 'level', 'experience_points', *STAT_FIELDS)
+
+_client = None
+
+
+def get_redis():
+    global _client
+    if _client is None:
+        # 리더보드 장애가 요청을 오래 붙잡지 않도록 짧은 타임아웃 사용
+        _client = redis.Redis.from_url(settings.REDIS_URL, socket_connect_timeout=1, socket_timeout=1)
+    return _client
+
+
+def leaderboard_key(board):
+    return f'leaderboard:{board}'
+
+
+def leaderboard_scores(character):
+    """캐릭터의 보드별 점수 {board: score}"""
+    stats = {stat: getattr(character, stat) for stat in STAT_FIELDS}
+    return {
+        'level': total_experience(character.level, character.experience_points),
+        'total_stats': sum(stats.values()),
+        **stats,
+    }
+
+
+def add_to_leaderboards(pipeline, characters, key=leaderboard_key):
+    for character in characters:
+        for board, score in leaderboard_scores(character).items():
+            pipeline.zadd(key(board), {character.user_id: score})
+
+
+def sync_leaderboards(characters):
+    """캐릭터들의 모든 보드 점수 갱신 (Redis 오류는 기록만 함)"""
+    try:
+        pipeline = get_redis().pipeline(transaction=False)
+        add_to_leaderboards(pipeline, characters)
+        pipeline.execute()
+    except redis.RedisError:
+        logger.exception('리더보드 갱신 실패')
+
+
+def sync_leaderboards_on_commit(user_ids):
+    """커밋 이후 사용자들의 최신 캐릭터 값으로 보드 갱신 (bulk UPDATE 이후 사용)"""
+    user_ids = list(user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: sync_leaderboards(
+            Character.objects.filter(user_id__in=user_ids).only(*SCORE_FIELDS)
+        ))
+
+
+def leaderboard_rank(board, user_id):
+    """사용자의 순위(1부터)와 점수, 보드에 없으면 (None, None)"""
+    pipeline = get_redis().pipeline(transaction=False)
+    pipeline.zrevrank(leaderboard_key(board), user_id)
+    pipeline.zscore(leaderboard_key(board), user_id)
+    rank, score = pipeline.execute()
+    if rank is None:
+        return None, None
+    return rank + 1, score
+
+
+def leaderboard_page(board, offset, limit):
+    """상위 순위 구간 [(rank, user_id, score)]와 보드 전체 인원"""
+    pipeline = get_redis().pipeline(transaction=False)
+    pipeline.zrevrange(leaderboard_key(board), offset, offset + limit - 1, withscores=True)
+    pipeline.zcard(leaderboard_key(board))
+    entries, total = pipeline.execute()
+    return [
+        (offset + index + 1, int(member), score)
+        for index, (member, score) in enumerate(entries)
+    ], total
+
+
+@receiver(post_save, sender=Character)
+def update_saved_character_leaderboards(sender, instance, **kwargs):
+    """보상 지급 등 캐릭터 저장 시 커밋 이후 리더보드 갱신"""
+    transaction.on_commit(lambda: sync_leaderboards([instance]))
+
+
+@receiver(post_delete, sender=Character)
+def remove_deleted_character(sender, instance, **kwargs):
+    def remove():
+        try:
+            pipeline = get_redis().pipeline(transaction=False)
+            for board in LEADERBOARDS:
+                pipeline.zrem(leaderboard_key(board), instance.user_id)
+            pipeline.execute()
+        except redis.RedisError:
+            logger.exception('리더보드 삭제 실패')
+
+    transaction.on_commit(remove)
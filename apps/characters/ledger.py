@@ -0,0 +1,159 @@
+"""골드/젬 원장
+
+Character.gold/gems는 화면 표시용 잔액이고, 모든 증감은 CurrencyTransaction에
+추가만 되는 원장으로도 남긴다. 잔액 조회는 사용자/화폐별 스냅샷에 스냅샷 이후
+원장 증감만 더해 계산하므로 원장이 길어져도 비용이 늘지 않는다.
+"""
+from datetime import timedelta
+
+from django.db.models import Max, Q, Sum
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Character, CurrencySnapshot, CurrencyTransaction
+
+CURRENCIES = ('gold', 'gems')
+
+# 스냅샷에는 이 시간보다 오래된 원장만 반영한다. id는 커밋 순서와 다를 수 있으므로,
+# 늦게 커밋된 작은 id의 기록이 스냅샷 이후 범위(id > last_transaction_id)에서 빠지지 않게 한다.
+SNAPSHOT_LAG = timedelta(minutes=10)
+
+
+def currency_entries(user_id, kind, reason='', gold=0, gems=0):
+    """0이 아닌 골드/젬 증감을 원장 기록으로 생성 (저장하지 않음)"""
+    return [
+        CurrencyTransaction(user_id=user_id, currency=currency, amount=amount, kind=kind, reason=reason[:100])
+        for currency, amount in (('gold', gold), ('gems', gems))
+        if amount
+    ]
+
+
+def record_transactions(entries):
+    if entries:
+        CurrencyTransaction.objects.bulk_create(entries)
+
+
+def currency_balances(user):
+    """원장 기준 잔액 {currency: balance} (스냅샷 + 이후 증감, 쿼리 두 번)"""
+    balances = dict.fromkeys(CURRENCIES, 0)
+    marks = dict.fromkeys(CURRENCIES, 0)
+    for snapshot in CurrencySnapshot.objects.filter(user=user):
+        balances[snapshot.currency] = snapshot.balance
+        marks[snapshot.currency] = snapshot.last_transaction_id
+
+    deltas = CurrencyTransaction.objects.filter(user=user).aggregate(**{
+        currency: Sum('amount', filter=Q(currency=currency, id__gt=marks[currency]))
+        for currency in CURRENCIES
+    })
+    return {currency: balances[currency] + (deltas[currency] or 0) for currency in CURRENCIES}
+
+
+def ledger_totals(user_ids):
+    """사용자들의 원장 전체 합계 {(user_id, currency): total}"""
+    rows = (
+        CurrencyTransaction.objects.filter(user_id__in=user_ids)
+        .values('user_id', 'currency')
+        .annotate(total=Sum('amount'))
+        .order_by()
+    )
+    return {(row['user_id'], row['currency']): row['total'] for row in rows}
+
+
+def take_currency_snapshots(chunk_size=1000, now=None):
+    """스냅샷 이후 쌓인 원장을 사용자 청크 단위로 스냅샷에 합산하고 갱신한 스냅샷 수 반환"""
+    now = now or timezone.now()
+    cutoff_id = CurrencyTransaction.objects.filter(
+        created_at__lt=now - SNAPSHOT_LAG
+    ).aggregate(last_id=Max('id'))['last_id']
+    if cutoff_id is None:
+        return 0
+
+    last_id = 0
+    updated = 0
+    while True:
+        user_ids = list(
+            Character.objects.filter(user_id__gt=last_id)
+            .order_by('user_id')
+            .values_list('user_id', flat=True)[:chunk_size]
+        )
+        if not user_ids:
+            break
+        last_id = user_ids[-1]
+
+        snapshots = {
+            (snapshot.user_id, snapshot.currency): snapshot
+            for snapshot in CurrencySnapshot.objects.filter(user_id__in=user_ids)
+        }
+        new_users = [
+            user_id for user_id in user_ids
+            if any((user_id, currency) not in snapshots for currency in CURRENCIES)
+        ]
+        known_users = set(user_ids).difference(new_users)
+        oldest_mark = min(
+            (s.last_transaction_id for s in snapshots.values() if s.user_id in known_users), default=0
+        )
+
+        # 스냅샷이 모두 있는 사용자는 그중 가장 오래된 스냅샷 이후의 원장만, 스냅샷이 없는 사용자는
+        # 처음부터 읽어 사용자/화폐별로 합산
+        changed = {}
+        rows = CurrencyTransaction.objects.filter(
+            Q(user_id__in=known_users, id__gt=oldest_mark) | Q(user_id__in=new_users),
+            id__lte=cutoff_id
+        ).order_by('id').values_list('id', 'user_id', 'currency', 'amount')
+        for transaction_id, user_id, currency, amount in rows.iterator():
+            key = (user_id, currency)
+            snapshot = snapshots.get(key)
+            if snapshot is None:
+                snapshot = snapshots[key] = CurrencySnapshot(user_id=user_id, currency=currency)
+            if transaction_id <= snapshot.last_transaction_id:
+                continue
+            snapshot.balance += amount
+            snapshot.last_transaction_id = transaction_id
+            snapshot.updated_at = now
+            changed[key] = snapshot
+
+        # 기록이 없는 화폐(초기 젬 0 등)도 0원 스냅샷을 남겨 다음부터는 처음부터 읽지 않게 함
+        for user_id in new_users:
+            for currency in CURRENCIES:
+                if (user_id, currency) not in snapshots:
+                    snapshots[(user_id, currency)] = changed[(user_id, currency)] = CurrencySnapshot(
+                        user_id=user_id, currency=currency, last_transaction_id=cutoff_id, updated_at=now
+                    )
+
+        CurrencySnapshot.objects.bulk_create([s for s in changed.values() if s.pk is None])
+        CurrencySnapshot.objects.bulk_update(
+            [s for s in changed.values() if s.pk is not None],
+            ['balance', 'last_transaction_id', 'updated_at']
+        )
+        updated += len(changed)
+
+    return updated
+
+
+def record_opening_balances(user_ids):
+    """bulk_create로 만든 캐릭터의 초기 골드/젬을 기초 잔액으로 기록 (이미 기록된 사용자는 건너뜀)
+
+    bulk_create는 저장 시그널을 보내지 않아 record_opening_balance가 실행되지 않으므로
+    캐릭터를 한꺼번에 만든 곳에서 직접 호출한다.
+    """
+    opened = CurrencyTransaction.objects.filter(user_id__in=user_ids, kind='opening').values('user_id')
+    characters = (
+        Character.objects.filter(user_id__in=user_ids)
+        .exclude(user_id__in=opened)
+        .values_list('user_id', 'gold', 'gems')
+    )
+    record_transactions([
+        entry
+        for user_id, gold, gems in characters
+        for entry in currency_entries(user_id, 'opening', '캐릭터 생성', gold=gold, gems=gems)
+    ])
+
+
+@receiver(post_save, sender=Character)
+def record_opening_balance(sender, instance, created, **kwargs):
+    """새 캐릭터의 초기 골드/젬을 기초 잔액으로 기록"""
+    if created:
+        record_transactions(currency_entries(
+            instance.user_id, 'opening', '캐릭터 생성', gold=instance.gold, gems=instance.gems
+        ))
@@ -0,0 +1,35 @@
+"""캐릭터 레벨 곡선
+
+레벨 N에서 N+1로 올라가는 데 필요한 경험치는 ``int(100 * N ** 1.2)`` 이다.
+레벨별 누적 경험치를 미리 계산해 두고 bisect로 조회하므로
+경험치 총량을 (레벨, 남은 경험치)로 바꾸는 비용은 O(log n) 이다.
+"""
+from bisect import bisect_right
+
+MAX_LEVEL = 1000
+
+
+def required_exp(level):
+    """해당 레벨에서 다음 레벨까지 필요한 경험치"""
+    return int(100 * (level ** 1.2))
+
+
+# CUMULATIVE_EXP[n - 1] = 레벨 1에서 레벨 n에 도달하는 데 필요한 누적 경험치
+CUMULATIVE_EXP = [0]
+for _level in range(1, MAX_LEVEL):
+    CUMULATIVE_EXP.append(CUMULATIVE_EXP[-1] + required_exp(_level))
+del _level
+
+
+def total_experience(level, experience_points):
+    """(레벨, 현재 경험치)를 누적 경험치로 변환"""
+    return CUMULATIVE_EXP[min(level, MAX_LEVEL) - 1] + experience_points
+
+
+def level_for_experience(total):
+    """누적 경험치를 (레벨, 남은 경험치)로 변환
+
+    최대 레벨에 도달하면 초과 경험치는 남은 경험치로 계속 쌓인다.
+    """
+    level = bisect_right(CUMULATIVE_EXP, total)
+    return level, total - CUMULATIVE_EXP[level - 1]
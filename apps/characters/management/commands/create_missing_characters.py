@@ -0,0 +1,43 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.characters.ledger import record_opening_balances
+from apps.characters.models import Character
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = '캐릭터가 없는 기존 사용자에게 기본 캐릭터 생성'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000, help='한 번에 처리할 사용자 수')
+        parser.add_argument('--dry-run', action='store_true', help='대상 사용자 수만 집계하고 저장하지 않음')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        dry_run = options['dry_run']
+
+        users = User.objects.filter(character__isnull=True).order_by('id')
+        last_id = 0
+        created = 0
+
+        while True:
+            rows = list(users.filter(id__gt=last_id).values_list('id', 'nickname')[:chunk_size])
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            created += len(rows)
+
+            if not dry_run:
+                with transaction.atomic():
+                    # 그 사이 로그인 요청이 먼저 만든 캐릭터는 건너뜀
+                    Character.objects.bulk_create(
+                        [Character(user_id=user_id, name=f"{nickname}의 캐릭터") for user_id, nickname in rows],
+                        ignore_conflicts=True
+                    )
+                    # bulk_create는 저장 시그널을 보내지 않으므로 기초 잔액을 직접 기록
+                    record_opening_balances([user_id for user_id, _ in rows])
+
+        action = '생성 예정' if dry_run else '생성'
+        self.stdout.write(self.style.SUCCESS(f'캐릭터 {created}개 {action}'))
@@ -0,0 +1,38 @@
+import csv
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from apps.characters.nutrition_import import (
+    IMPORT_CHUNK_SIZE, IMPORT_FORMATS, guess_format, import_nutrition_logs
+)
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'CSV/NDJSON 파일의 영양 기록을 사용자 기록으로 가져오기 (같은 날짜/식사는 덮어씀)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='가져올 파일 경로')
+        parser.add_argument('--user', required=True, help='기록을 추가할 사용자 이메일')
+        parser.add_argument('--format', choices=IMPORT_FORMATS, help='파일 형식 (기본값: 확장자로 판단)')
+        parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE, help='한 번에 저장할 행 수')
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(email=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(f"사용자를 찾을 수 없습니다: {options['user']}")
+
+        file_format = options['format'] or guess_format(options['path'])
+        with open(options['path'], encoding='utf-8-sig', newline='') as stream:
+            try:
+                report = import_nutrition_logs(user, stream, file_format, options['chunk_size'])
+            except csv.Error as error:
+                raise CommandError(f'CSV 헤더를 해석할 수 없습니다: {error}')
+
+        for error in report['errors']:
+            self.stdout.write(self.style.WARNING(f"{error['row']}행: {error['errors']}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"{report['rows']}행 중 {report['imported']}건 저장, 실패 {report['failed']}건 "
+            f"({report['elapsed_seconds']:.2f}초, {report['rows_per_second']}행/초)"
+        ))
@@ -0,0 +1,68 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from apps.characters.partitions import (
+    add_months, archive_table, create_partition, detach_partition, drop_table,
+    is_supported, list_partitions, month_start, partition_name
+)
+
+
+class Command(BaseCommand):
+    help = 'stat_history 미래 월 파티션 생성 및 보관 기간이 지난 파티션 분리/아카이브'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=3, help='미리 만들어 둘 미래 파티션 수')
+        parser.add_argument(
+            '--retention-months', type=int, default=settings.STAT_HISTORY_RETENTION_MONTHS,
+            help='DB에 남겨 둘 최근 개월 수 (이번 달 포함)'
+        )
+        parser.add_argument(
+            '--archive-dir', default=settings.STAT_HISTORY_ARCHIVE_DIR,
+            help='분리한 파티션을 저장할 디렉터리'
+        )
+        parser.add_argument('--dry-run', action='store_true', help='작업 대상만 출력하고 변경하지 않음')
+
+    def handle(self, *args, **options):
+        if not is_supported(connection):
+            raise CommandError('stat_history 파티션은 PostgreSQL에서만 지원합니다.')
+        if options['retention_months'] < 1:
+            raise CommandError('--retention-months는 1 이상이어야 합니다.')
+
+        dry_run = options['dry_run']
+        current = month_start(timezone.localdate())
+
+        # 1. 이번 달부터 미래 파티션 생성 (기본 파티션에 들어간 해당 월 행은 새 파티션으로 이동)
+        for offset in range(options['months_ahead'] + 1):
+            month = add_months(current, offset)
+            moved = None
+            if not dry_run:
+                with transaction.atomic(), connection.cursor() as cursor:
+                    moved = create_partition(cursor, month)
+            suffix = f' (생성, 기본 파티션에서 {moved}행 이동)' if moved is not None else ''
+            self.stdout.write(f'파티션 확인: {partition_name(month)}{suffix}')
+
+        # 2. 보관 기간이 지난 파티션 분리 → 아카이브 → 삭제
+        cutoff = add_months(current, -(options['retention_months'] - 1))
+        with connection.cursor() as cursor:
+            expired = [name for month, name in list_partitions(cursor) if month < cutoff]
+
+        for name in expired:
+            if dry_run:
+                self.stdout.write(f'아카이브 예정: {name}')
+                continue
+
+            with transaction.atomic(), connection.cursor() as cursor:
+                detach_partition(cursor, name)
+
+            path, rows = archive_table(connection, name, options['archive_dir'])
+            with connection.cursor() as cursor:
+                cursor.execute(f'SELECT COUNT(*) FROM "{name}"')
+                if cursor.fetchone()[0] != rows:
+                    raise CommandError(f'{name} 아카이브 행 수가 일치하지 않아 테이블을 남겨 둡니다: {path}')
+                drop_table(cursor, name)
+
+            self.stdout.write(self.style.SUCCESS(f'{name}: {rows}행 아카이브 → {path}'))
+
+        if not expired:
+            self.stdout.write(self.style.SUCCESS('보관 기간이 지난 파티션이 없습니다.'))
@@ -0,0 +1,77 @@
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.characters.leaderboards import (
+    LEADERBOARDS, SCORE_FIELDS, add_to_leaderboards, get_redis, leaderboard_key
+)
+from apps.characters.models import Character
+
+# 재구축 시작 전에 저장됐지만 늦게 커밋된 변경까지 다시 반영하도록 여유를 둔다
+REPLAY_MARGIN = timedelta(minutes=1)
+
+
+def rebuild_key(board):
+    return f'{leaderboard_key(board)}:rebuild'
+
+
+class Command(BaseCommand):
+    help = '모든 캐릭터를 청크 단위로 읽어 리더보드 재구축 (재구축 중 바뀐 캐릭터는 교체 후 다시 반영)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000, help='한 번에 처리할 캐릭터 수')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        client = get_redis()
+        client.delete(*[rebuild_key(board) for board in LEADERBOARDS])
+
+        started = time.monotonic()
+        started_at = timezone.now()
+        total = 0
+        for characters in self._chunks(Character.objects.all(), chunk_size):
+            total += len(characters)
+            pipeline = client.pipeline(transaction=False)
+            add_to_leaderboards(pipeline, characters, key=rebuild_key)
+            pipeline.execute()
+
+        # 새 보드로 원자적으로 교체 (재구축 중에도 기존 보드는 계속 조회 가능)
+        pipeline = client.pipeline(transaction=True)
+        for board in LEADERBOARDS:
+            if total:
+                pipeline.rename(rebuild_key(board), leaderboard_key(board))
+            else:
+                pipeline.delete(leaderboard_key(board))
+        pipeline.execute()
+
+        # 재구축 중 기존 보드에 반영된 점수 갱신은 교체로 덮였으므로, 그동안 저장된 캐릭터를 다시 반영
+        # (교체 이후의 갱신은 저장 시 커밋 훅이 새 보드에 반영한다)
+        replayed = 0
+        changed = Character.objects.filter(updated_at__gte=started_at - REPLAY_MARGIN)
+        for characters in self._chunks(changed, chunk_size):
+            replayed += len(characters)
+            pipeline = client.pipeline(transaction=False)
+            add_to_leaderboards(pipeline, characters)
+            pipeline.execute()
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'캐릭터 {total}명으로 리더보드 {len(LEADERBOARDS)}개 재구축, '
+                f'재구축 중 변경 {replayed}명 재반영 ({elapsed:.2f}초)'
+            )
+        )
+
+    def _chunks(self, queryset, chunk_size):
+        """id 기준 키셋 페이지네이션으로 점수 계산에 필요한 필드만 청크 단위 조회"""
+        last_id = 0
+        while True:
+            characters = list(
+                queryset.filter(id__gt=last_id)
+                .order_by('id')
+                .only('id', *SCORE_FIELDS)[:chunk_size]
+            )
+            if not characters:
+                return
+            last_id = characters[-1].id
+            yield characters
@@ -0,0 +1,38 @@
+import time
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from apps.characters.nutrition_rollups import rebuild_daily_rollups
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = '영양 기록으로 일일 영양 요약 테이블 재구축'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help='한 번에 처리할 사용자 수')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+
+        started = time.monotonic()
+        last_id = 0
+        users = 0
+        rollups = 0
+
+        while True:
+            user_ids = list(
+                User.objects.filter(id__gt=last_id)
+                .order_by('id')
+                .values_list('id', flat=True)[:chunk_size]
+            )
+            if not user_ids:
+                break
+            last_id = user_ids[-1]
+            users += len(user_ids)
+            rollups += rebuild_daily_rollups(user_ids)
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(f'사용자 {users}명, 일일 영양 요약 {rollups}개 생성 ({elapsed:.2f}초)')
+        )
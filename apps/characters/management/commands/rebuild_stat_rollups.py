@@ -0,0 +1,86 @@
+import time
+from datetime import date, datetime
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from apps.characters.models import Character, StatDailyRollup, StatHistory
+from apps.characters.partitions import retained_since
+from apps.characters.rollups import fold_entry
+
+
+class Command(BaseCommand):
+    help = '스탯 변화 기록으로 일일 스탯 요약 테이블 재구축 (기록이 남아 있는 기간만)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help='한 번에 처리할 캐릭터 수')
+        parser.add_argument(
+            '--since', help='이 날짜(YYYY-MM-DD)부터 재구축 (기본: 가장 오래된 stat_history 파티션의 첫날)'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        # 보관 기간이 지나 아카이브된 기록으로 만든 요약은 다시 만들 수 없으므로 그 이전 요약은 그대로 둔다
+        since = self._since(options['since'])
+        rollups_qs = StatDailyRollup.objects.all()
+        if since is not None:
+            rollups_qs = rollups_qs.filter(date__gte=since)
+
+        started = time.monotonic()
+        last_id = 0
+        characters = 0
+        rollups = 0
+
+        while True:
+            with transaction.atomic():
+                # 처리 중인 캐릭터는 보상 지급(요약 증분 갱신)과 겹치지 않도록 잠금
+                character_ids = list(
+                    Character.objects.select_for_update()
+                    .filter(id__gt=last_id)
+                    .order_by('id')
+                    .values_list('id', flat=True)[:chunk_size]
+                )
+                if not character_ids:
+                    break
+                last_id = character_ids[-1]
+                characters += len(character_ids)
+
+                built = self._build(character_ids, since)
+                rollups_qs.filter(character_id__in=character_ids).delete()
+                StatDailyRollup.objects.bulk_create(built, batch_size=1000)
+                rollups += len(built)
+
+        elapsed = time.monotonic() - started
+        period = f'{since} 이후 ' if since else ''
+        self.stdout.write(
+            self.style.SUCCESS(f'캐릭터 {characters}명, {period}일일 요약 {rollups}개 생성 ({elapsed:.2f}초)')
+        )
+
+    def _since(self, value):
+        if value is None:
+            return retained_since(connection)
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise CommandError('--since는 YYYY-MM-DD 형식이어야 합니다.')
+
+    def _build(self, character_ids, since=None):
+        """캐릭터들의 스탯 기록을 시간 순으로 한 번 읽어 일일 요약 생성 (since가 있으면 그날부터)"""
+        rollups = {}
+        history = StatHistory.objects.filter(character_id__in=character_ids)
+        if since is not None:
+            history = history.filter(
+                created_at__gte=timezone.make_aware(datetime.combine(since, datetime.min.time()))
+            )
+        history = (
+            history.order_by('character_id', 'created_at', 'id')
+            .only('character_id', 'stat_type', 'old_value', 'new_value', 'created_at')
+        )
+        for entry in history.iterator(chunk_size=5000):
+            key = (entry.character_id, entry.stat_type, timezone.localdate(entry.created_at))
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollup = rollups[key] = StatDailyRollup(
+                    character_id=key[0], stat_type=key[1], date=key[2], last_value=entry.new_value
+                )
+            fold_entry(rollup, entry)
+        return list(rollups.values())
@@ -0,0 +1,78 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from apps.characters.leveling import MAX_LEVEL, level_for_experience, total_experience
+from apps.characters.models import Character, STAT_POINTS_PER_LEVEL
+from apps.characters.leaderboards import sync_leaderboards_on_commit
+from apps.characters.stats_cache import invalidate_character_stats
+
+FIELDS = ('level', 'experience_points', 'unspent_stat_points')
+
+
+class Command(BaseCommand):
+    help = '누적 경험치 기준으로 모든 캐릭터의 레벨/경험치 재계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000, help='한 번에 처리할 캐릭터 수')
+        parser.add_argument('--dry-run', action='store_true', help='변경 대상만 집계하고 저장하지 않음')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        dry_run = options['dry_run']
+
+        started = time.monotonic()
+        last_id = 0
+        scanned = 0
+        changed = 0
+
+        while True:
+            with transaction.atomic():
+                # id 기준 키셋 페이지네이션, 처리 중인 청크는 보상 지급과 겹치지 않도록 잠금
+                rows = list(
+                    Character.objects.select_for_update()
+                    .filter(id__gt=last_id)
+                    .order_by('id')
+                    .values_list('id', 'user_id', *FIELDS)[:chunk_size]
+                )
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                scanned += len(rows)
+
+                updates = self._recompute(rows)
+                changed += len(updates)
+                if updates and not dry_run:
+                    # 청크당 CASE WHEN 기반 UPDATE 한 번 (updated_at은 리더보드 재구축의 재반영 기준)
+                    Character.objects.bulk_update(updates, (*FIELDS, 'updated_at'), batch_size=chunk_size)
+                    user_ids = [character.user_id for character in updates]
+                    invalidate_character_stats(user_ids)
+                    sync_leaderboards_on_commit(user_ids)
+
+        elapsed = time.monotonic() - started
+        action = '변경 예정' if dry_run else '변경'
+        self.stdout.write(
+            self.style.SUCCESS(f'캐릭터 {scanned}명 검사, {changed}명 {action} ({elapsed:.2f}초)')
+        )
+
+    def _recompute(self, rows):
+        """레벨/경험치가 달라지는 캐릭터만 골라 갱신할 객체 생성"""
+        updates = []
+        now = timezone.now()
+        for pk, user_id, level, experience_points, unspent_stat_points in rows:
+            if level >= MAX_LEVEL:
+                continue
+            new_level, remainder = level_for_experience(total_experience(level, experience_points))
+            if (new_level, remainder) == (level, experience_points):
+                continue
+            # 레벨업 보상은 add_experience와 동일하게 레벨당 스탯 포인트 적립
+            gained = new_level - level
+            updates.append(Character(
+                id=pk,
+                user_id=user_id,
+                level=new_level,
+                experience_points=remainder,
+                unspent_stat_points=unspent_stat_points + STAT_POINTS_PER_LEVEL * gained,
+                updated_at=now,
+            ))
+        return updates
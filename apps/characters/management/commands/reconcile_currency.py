@@ -0,0 +1,65 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.characters.ledger import CURRENCIES, currency_entries, ledger_totals, record_transactions
+from apps.characters.models import Character
+
+
+class Command(BaseCommand):
+    help = '원장 합계와 캐릭터 골드/젬 잔액 대조'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000, help='한 번에 대조할 캐릭터 수')
+        parser.add_argument(
+            '--fix', action='store_true',
+            help='차이만큼 조정 기록을 추가해 원장을 캐릭터 잔액에 맞춤'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        fix = options['fix']
+
+        started = time.monotonic()
+        last_id = 0
+        scanned = 0
+        mismatched = 0
+
+        while True:
+            with transaction.atomic():
+                # 대조 중에는 보상 지급과 겹치지 않도록 청크 잠금
+                rows = list(
+                    Character.objects.select_for_update()
+                    .filter(id__gt=last_id)
+                    .order_by('id')
+                    .values_list('id', 'user_id', *CURRENCIES)[:chunk_size]
+                )
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                scanned += len(rows)
+
+                totals = ledger_totals([user_id for _, user_id, *_ in rows])
+                adjustments = []
+                for _, user_id, *balances in rows:
+                    differences = {
+                        currency: balance - totals.get((user_id, currency), 0)
+                        for currency, balance in zip(CURRENCIES, balances)
+                    }
+                    if not any(differences.values()):
+                        continue
+                    mismatched += 1
+                    self.stdout.write(self.style.WARNING(
+                        f'사용자 {user_id}: ' + ', '.join(
+                            f'{currency} {difference:+d}' for currency, difference in differences.items() if difference
+                        )
+                    ))
+                    adjustments += currency_entries(user_id, 'adjustment', '원장 대조 보정', **differences)
+
+                if fix:
+                    record_transactions(adjustments)
+
+        elapsed = time.monotonic() - started
+        action = ' (보정 완료)' if fix and mismatched else ''
+        self.stdout.write(self.style.SUCCESS(
+            f'캐릭터 {scanned}명 대조, 불일치 {mismatched}명{action} ({elapsed:.2f}초)'
+        ))
@@ -0,0 +1,25 @@
+from django.utils.functional import SimpleLazyObject
+from .models import Character
+
+
+def get_request_character(request):
+    """요청 사용자의 캐릭터 (요청당 한 번만 조회)"""
+    if not hasattr(request, '_cached_character'):
+        request._cached_character = Character.for_user(request.user)
+    return request._cached_character
+
+
+class CharacterMiddleware:
+    """request.character를 지연 로딩 객체로 설정
+
+    DRF는 인증 후 request.user를 원래 HttpRequest에도 반영하므로, 뷰 안에서
+    처음 접근할 때 인증된 사용자의 캐릭터를 읽는다. 캐릭터를 쓰지 않는 요청은
+    쿼리가 발생하지 않는다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.character = SimpleLazyObject(lambda: get_request_character(request))
+        return self.get_response(request)
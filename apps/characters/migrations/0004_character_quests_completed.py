@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:32
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_quests_completed(apps, schema_editor):
+    """기존 완료 기록 수로 카운터 채우기 (UPDATE 한 번)"""
+    Character = apps.get_model('characters', 'Character')
+    QuestCompletion = apps.get_model('quests', 'QuestCompletion')
+
+    completed = QuestCompletion.objects.filter(
+        quest__user_id=OuterRef('user_id')
+    ).values('quest__user_id').annotate(total=Count('id')).values('total')
+
+    Character.objects.update(quests_completed=Coalesce(Subquery(completed), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0003_alter_nutritionlog_date'),
+        ('quests', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='character',
+            name='quests_completed',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_quests_completed, migrations.RunPython.noop),
+    ]
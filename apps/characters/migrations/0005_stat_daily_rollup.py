@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:42
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0004_character_quests_completed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stat_type', models.CharField(choices=[('stamina', '체력'), ('strength', '근력'), ('mental', '정신력'), ('endurance', '지구력'), ('cardio', '심폐'), ('flexibility', '유연성'), ('nutrition', '영양'), ('recovery', '회복')], max_length=20)),
+                ('date', models.DateField()),
+                ('last_value', models.PositiveIntegerField(help_text='그날 마지막 스탯 값')),
+                ('change_count', models.PositiveIntegerField(default=0, help_text='그날 스탯 변화 횟수')),
+                ('total_gain', models.IntegerField(default=0, help_text='그날 스탯 증가량 합계')),
+            ],
+            options={
+                'verbose_name': '일일 스탯 요약',
+                'verbose_name_plural': '일일 스탯 요약들',
+                'db_table': 'stat_daily_rollups',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='stathistory',
+            index=models.Index(fields=['character', 'created_at'], name='stat_history_char_created_idx'),
+        ),
+        migrations.AddField(
+            model_name='statdailyrollup',
+            name='character',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stat_rollups', to='characters.character'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='statdailyrollup',
+            unique_together={('character', 'stat_type', 'date')},
+        ),
+    ]
@@ -0,0 +1,97 @@
+from datetime import date, datetime
+
+from django.db import migrations
+from django.utils import timezone
+
+# 마이그레이션은 적용 시점의 코드에 묶여야 하므로 apps.characters.partitions를 쓰지 않고 필요한 SQL만 둔다
+PARENT_TABLE = 'stat_history'
+DEFAULT_PARTITION = f'{PARENT_TABLE}_default'
+
+# 마이그레이션 시점에 미리 만들어 둘 미래 파티션 수 (이후는 manage_stat_history_partitions가 관리)
+MONTHS_AHEAD = 3
+
+
+def month_start(day):
+    return date(day.year, day.month, 1)
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def local_midnight(day):
+    return timezone.make_aware(datetime.combine(day, datetime.min.time()))
+
+
+def partition_stat_history(apps, schema_editor):
+    """stat_history를 created_at 기준 월별 RANGE 파티션 테이블로 전환
+
+    파티션 테이블의 기본 키는 파티션 키를 포함해야 하므로 (id, created_at)로 바뀐다.
+    Django 모델의 기본 키는 그대로 id이며, 기존 인덱스와 외래 키는 이름 그대로 다시 만든다.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    staging = f'{PARENT_TABLE}_partitioned'
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s AND indexname NOT LIKE %s",
+            [PARENT_TABLE, '%_pkey']
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+            WHERE conrelid = %s::regclass AND contype = 'f'
+            """,
+            [PARENT_TABLE]
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(f'SELECT MIN(created_at) FROM "{PARENT_TABLE}"')
+        oldest = cursor.fetchone()[0]
+
+        cursor.execute(
+            f'CREATE TABLE "{staging}" (LIKE "{PARENT_TABLE}" INCLUDING DEFAULTS INCLUDING IDENTITY) '
+            f'PARTITION BY RANGE (created_at)'
+        )
+        cursor.execute(f'ALTER TABLE "{staging}" ADD PRIMARY KEY (id, created_at)')
+        cursor.execute(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{staging}" DEFAULT')
+
+        # 기존 데이터가 있는 달부터 미래 몇 달까지 파티션 생성 (구간은 현지 시간 기준 [월초, 다음 달 월초))
+        cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" RENAME TO "{PARENT_TABLE}_legacy"')
+        cursor.execute(f'ALTER TABLE "{staging}" RENAME TO "{PARENT_TABLE}"')
+
+        current = month_start(timezone.localdate())
+        month = month_start(timezone.localtime(oldest).date()) if oldest else current
+        while month <= add_months(current, MONTHS_AHEAD):
+            cursor.execute(
+                f'CREATE TABLE "{PARENT_TABLE}_{month:%Y%m}" '
+                f'PARTITION OF "{PARENT_TABLE}" FOR VALUES FROM (%s) TO (%s)',
+                [local_midnight(month), local_midnight(add_months(month, 1))]
+            )
+            month = add_months(month, 1)
+
+        cursor.execute(f'INSERT INTO "{PARENT_TABLE}" SELECT * FROM "{PARENT_TABLE}_legacy"')
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence('\"{PARENT_TABLE}\"', 'id'), "
+            f'COALESCE((SELECT MAX(id) FROM "{PARENT_TABLE}"), 0) + 1, false)'
+        )
+        cursor.execute(f'DROP TABLE "{PARENT_TABLE}_legacy"')
+
+        for name, definition in indexes:
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" ADD CONSTRAINT "{name}" {definition}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0005_stat_daily_rollup'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_stat_history, migrations.RunPython.noop, elidable=False),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0006_partition_stat_history'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='character',
+            name='unspent_stat_points',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
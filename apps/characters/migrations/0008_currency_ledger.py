@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:50
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('characters', '0007_character_unspent_stat_points'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CurrencyTransaction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('currency', models.CharField(choices=[('gold', '골드'), ('gems', '젬')], max_length=10)),
+                ('amount', models.IntegerField(help_text='증감량 (지출은 음수)')),
+                ('kind', models.CharField(choices=[('opening', '기초 잔액'), ('quest', '퀘스트 보상'), ('achievement', '업적 보상'), ('purchase', '구매'), ('adjustment', '조정')], max_length=20)),
+                ('reason', models.CharField(blank=True, max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='currency_transactions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '화폐 거래 기록',
+                'verbose_name_plural': '화폐 거래 기록들',
+                'db_table': 'currency_transactions',
+                'indexes': [models.Index(fields=['user', 'currency', 'id'], name='currency_tx_user_currency_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='CurrencySnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('currency', models.CharField(choices=[('gold', '골드'), ('gems', '젬')], max_length=10)),
+                ('balance', models.BigIntegerField(default=0)),
+                ('last_transaction_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='currency_snapshots', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '화폐 잔액 스냅샷',
+                'verbose_name_plural': '화폐 잔액 스냅샷들',
+                'db_table': 'currency_snapshots',
+                'unique_together': {('user', 'currency')},
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations
+
+CHUNK_SIZE = 2000
+
+
+def record_opening_balances(apps, schema_editor):
+    """기존 캐릭터의 현재 골드/젬을 원장의 기초 잔액으로 기록"""
+    Character = apps.get_model('characters', 'Character')
+    CurrencyTransaction = apps.get_model('characters', 'CurrencyTransaction')
+
+    last_id = 0
+    while True:
+        rows = list(
+            Character.objects.filter(id__gt=last_id)
+            .order_by('id')
+            .values_list('id', 'user_id', 'gold', 'gems')[:CHUNK_SIZE]
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        CurrencyTransaction.objects.bulk_create([
+            CurrencyTransaction(user_id=user_id, currency=currency, amount=amount, kind='opening', reason='원장 도입')
+            for _, user_id, gold, gems in rows
+            for currency, amount in (('gold', gold), ('gems', gems))
+            if amount
+        ])
+
+
+def remove_opening_balances(apps, schema_editor):
+    CurrencyTransaction = apps.get_model('characters', 'CurrencyTransaction')
+    CurrencyTransaction.objects.filter(kind='opening', reason='원장 도입').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0008_currency_ledger'),
+    ]
+
+    operations = [
+        migrations.RunPython(record_opening_balances, remove_opening_balances),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0009_currency_opening_balances'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='nutritionlog',
+            name='nutrition_score',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,70 @@
+from django.db import migrations, models
+from django.db.models import Case, IntegerField, Value, When
+
+CHUNK_SIZE = 5000
+
+# 마이그레이션 작성 시점의 점수표 (이후 apps.characters.nutrition의 점수표가 바뀌어도 이 백필은 그대로)
+QUALITY_SCORES = {
+    'excellent': 40,
+    'good': 30,
+    'fair': 20,
+    'poor': 10,
+}
+CHECKLIST_FIELDS = ('included_vegetables', 'included_protein', 'included_grains', 'proper_portion')
+CHECKLIST_SCORE = 15
+
+
+def nutrition_score_expression():
+    score = Case(
+        *[When(meal_quality=quality, then=Value(points)) for quality, points in QUALITY_SCORES.items()],
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    for field in CHECKLIST_FIELDS:
+        score += Case(
+            When(**{field: True}, then=Value(CHECKLIST_SCORE)),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    return score
+
+
+def fill_nutrition_scores(apps, schema_editor):
+    """기존 영양 기록의 점수를 id 구간별 UPDATE로 채움
+
+    트랜잭션 없이 실행되는 마이그레이션이므로 청크마다 따로 커밋되어 잠금이 길게 이어지지 않는다.
+    중간에 실패해도 다시 실행하면 같은 값으로 덮어쓴다.
+    """
+    NutritionLog = apps.get_model('characters', 'NutritionLog')
+
+    last_id = 0
+    while True:
+        ids = list(
+            NutritionLog.objects.filter(id__gt=last_id)
+            .order_by('id')
+            .values_list('id', flat=True)[:CHUNK_SIZE]
+        )
+        if not ids:
+            break
+        NutritionLog.objects.filter(id__gte=ids[0], id__lte=ids[-1]).update(
+            nutrition_score=nutrition_score_expression()
+        )
+        last_id = ids[-1]
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('characters', '0010_nutritionlog_nutrition_score'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_nutrition_scores, migrations.RunPython.noop),
+        # 점수를 채운 뒤 인덱스 생성 (백필 UPDATE마다 인덱스를 갱신하지 않도록)
+        migrations.AddIndex(
+            model_name='nutritionlog',
+            index=models.Index(fields=['user', 'date', 'nutrition_score'], name='nutrition_user_date_score_idx'),
+        ),
+    ]
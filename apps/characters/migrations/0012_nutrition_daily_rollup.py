@@ -0,0 +1,82 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:59
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+import django.db.models.deletion
+
+CHUNK_SIZE = 500
+
+# 마이그레이션 작성 시점의 집계 대상 (apps.characters.nutrition의 정의가 바뀌어도 이 백필은 그대로)
+QUALITIES = ('excellent', 'good', 'fair', 'poor')
+CHECKLIST_COUNTS = {
+    'vegetables_count': 'included_vegetables',
+    'protein_count': 'included_protein',
+    'grains_count': 'included_grains',
+    'proper_portion_count': 'proper_portion',
+}
+
+
+def build_nutrition_rollups(apps, schema_editor):
+    """기존 영양 기록으로 일일 요약 생성 (사용자 청크 단위)"""
+    NutritionLog = apps.get_model('characters', 'NutritionLog')
+    NutritionDailyRollup = apps.get_model('characters', 'NutritionDailyRollup')
+
+    last_id = 0
+    while True:
+        user_ids = list(
+            NutritionLog.objects.filter(user_id__gt=last_id)
+            .order_by('user_id')
+            .values_list('user_id', flat=True)
+            .distinct()[:CHUNK_SIZE]
+        )
+        if not user_ids:
+            break
+        last_id = user_ids[-1]
+        rows = NutritionLog.objects.filter(user_id__in=user_ids).values('user_id', 'date').annotate(
+            meal_count=Count('id'),
+            score_sum=Sum('nutrition_score'),
+            **{f'{quality}_meals': Count('id', filter=Q(meal_quality=quality)) for quality in QUALITIES},
+            **{name: Count('id', filter=Q(**{field: True})) for name, field in CHECKLIST_COUNTS.items()},
+        ).order_by()
+        NutritionDailyRollup.objects.bulk_create(
+            [NutritionDailyRollup(**row) for row in rows],
+            batch_size=1000
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('characters', '0011_fill_nutrition_scores'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NutritionDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('meal_count', models.PositiveIntegerField(default=0)),
+                ('score_sum', models.PositiveIntegerField(default=0, help_text='그날 식사 영양 점수 합계')),
+                ('excellent_meals', models.PositiveIntegerField(default=0)),
+                ('good_meals', models.PositiveIntegerField(default=0)),
+                ('fair_meals', models.PositiveIntegerField(default=0)),
+                ('poor_meals', models.PositiveIntegerField(default=0)),
+                ('vegetables_count', models.PositiveIntegerField(default=0)),
+                ('protein_count', models.PositiveIntegerField(default=0)),
+                ('grains_count', models.PositiveIntegerField(default=0)),
+                ('proper_portion_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='nutrition_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '일일 영양 요약',
+                'verbose_name_plural': '일일 영양 요약들',
+                'db_table': 'nutrition_daily_rollups',
+                'unique_together': {('user', 'date')},
+            },
+        ),
+        migrations.RunPython(build_nutrition_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0012_nutrition_daily_rollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='nutritionlog',
+            name='meal_image_derivatives',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
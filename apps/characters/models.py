@@ -1,8 +1,31 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from datetime import date
+from .leveling import MAX_LEVEL, level_for_experience, total_experience
+from .nutrition import CHECKLIST_FIELDS, CHECKLIST_SCORE, QUALITY_SCORES
+
+
+# 캐릭터의 8개 핵심 스탯 필드
+STAT_FIELDS = (
+    'stamina', 'strength', 'mental', 'endurance',
+    'cardio', 'flexibility', 'nutrition', 'recovery',
+)
+
+# 레벨업마다 지급되는 배분 가능 스탯 포인트
+STAT_POINTS_PER_LEVEL = 2
+
+STAT_CHOICES = [
+    ('stamina', '체력'),
+    ('strength', '근력'),
+    ('mental', '정신력'),
+    ('endurance', '지구력'),
+    ('cardio', '심폐'),
+    ('flexibility', '유연성'),
+    ('nutrition', '영양'),
+    ('recovery', '회복'),
+]
 
 
 class Character(models.Model):
@@ -22,6 +45,12 @@ class Character(models.Model):
     nutrition = models.PositiveIntegerField(default=10, help_text="영양 - 균형잡힌 식단")
     recovery = models.PositiveIntegerField(default=10, help_text="회복 - 수면, 휴식")
     
+    # 레벨업으로 받았지만 아직 배분하지 않은 스탯 포인트
+    unspent_stat_points = models.PositiveIntegerField(default=0)
+    
+    # 누적 퀘스트 완료 수 (업적 평가용 카운터)
+    quests_completed = models.PositiveIntegerField(default=0)
+    
     # 게임 화폐 및 보상
     gold = models.PositiveIntegerField(default=100)
     gems = models.PositiveIntegerField(default=0)
@@ -41,6 +70,25 @@ class Character(models.Model):
     def __str__(self):
         return f"{self.user.nickname}의 {self.name} (Lv.{self.level})"
 
+    @classmethod
+    def create_for_user(cls, user):
+        """사용자의 기본 캐릭터 생성 (회원가입 시 호출)"""
+        return cls.objects.create(user=user, name=f"{user.nickname}의 캐릭터")
+
+    @classmethod
+    def for_user(cls, user):
+        """사용자의 캐릭터 조회, 없으면 생성 (가입 이전 사용자 대비)"""
+        try:
+            return cls.objects.get(user=user)
+        except cls.DoesNotExist:
+            pass
+        try:
+            with transaction.atomic():
+                return cls.create_for_user(user)
+        except IntegrityError:
+            # 동시 요청이 먼저 생성한 경우
+            return cls.objects.get(user=user)
+
     @property
     def total_stats(self):
         """전체 스탯 합계"""
@@ -54,29 +102,25 @@ class Character(models.Model):
 
     def gain_experience(self, points):
         """경험치 획득 및 레벨업 처리"""
-        self.experience_points += points
-        
-        # 레벨업 계산 (100 * level^1.2)
-        required_exp = int(100 * (self.level ** 1.2))
-        
-        while self.experience_points >= required_exp:
-            self.experience_points -= required_exp
-            self.level += 1
-            # 레벨업 시 스탯 포인트 자동 배분 (나중에 사용자가 직접 배분하도록 변경 가능)
-            self.distribute_stat_points(2)
-            required_exp = int(100 * (self.level ** 1.2))
-        
+        self.add_experience(points)
         self.save()
 
-    def distribute_stat_points(self, points):
-        """스탯 포인트 자동 배분 (균등 분배)"""
-        stats = ['stamina', 'strength', 'mental', 'endurance', 
-                'cardio', 'flexibility', 'nutrition', 'recovery']
-        
-        for i in range(points):
-            stat = stats[i % len(stats)]
-            current_value = getattr(self, stat)
-            setattr(self, stat, current_value + 1)
+    def add_experience(self, points):
+        """경험치 반영 및 레벨업 계산 (저장하지 않음)"""
+        if self.level >= MAX_LEVEL:
+            self.experience_points += points
+            return 0
+
+        # 누적 경험치 테이블에서 레벨 조회 (레벨업 필요 경험치: 100 * level^1.2)
+        old_level = self.level
+        self.level, self.experience_points = level_for_experience(
+            total_experience(self.level, self.experience_points + points)
+        )
+
+        # 레벨업 스탯 포인트는 적립해 두고 사용자가 직접 배분
+        levels_gained = self.level - old_level
+        self.unspent_stat_points += STAT_POINTS_PER_LEVEL * levels_gained
+        return levels_gained
 
 
 class Achievement(models.Model):
@@ -140,19 +184,7 @@ class UserAchievement(models.Model):
 class StatHistory(models.Model):
     """스탯 변화 기록"""
     character = models.ForeignKey(Character, on_delete=models.CASCADE, related_name='stat_history')
-    stat_type = models.CharField(
-        max_length=20,
-        choices=[
-            ('stamina', '체력'),
-            ('strength', '근력'),
-            ('mental', '정신력'),
-            ('endurance', '지구력'),
-            ('cardio', '심폐'),
-            ('flexibility', '유연성'),
-            ('nutrition', '영양'),
-            ('recovery', '회복'),
-        ]
-    )
+    stat_type = models.CharField(max_length=20, choices=STAT_CHOICES)
     old_value = models.PositiveIntegerField()
     new_value = models.PositiveIntegerField()
     change_reason = models.CharField(max_length=100, help_text="변화 사유")
@@ -163,11 +195,96 @@ class StatHistory(models.Model):
         verbose_name = '스탯 변화 기록'
         verbose_name_plural = '스탯 변화 기록들'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['character', 'created_at'], name='stat_history_char_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.character.name} {self.stat_type}: {self.old_value} → {self.new_value}"
 
 
+class StatDailyRollup(models.Model):
+    """캐릭터/스탯별 일일 스탯 변화 요약 (그래프용)"""
+    character = models.ForeignKey(Character, on_delete=models.CASCADE, related_name='stat_rollups')
+    stat_type = models.CharField(max_length=20, choices=STAT_CHOICES)
+    date = models.DateField()
+    last_value = models.PositiveIntegerField(help_text="그날 마지막 스탯 값")
+    change_count = models.PositiveIntegerField(default=0, help_text="그날 스탯 변화 횟수")
+    total_gain = models.IntegerField(default=0, help_text="그날 스탯 증가량 합계")
+
+    class Meta:
+        db_table = 'stat_daily_rollups'
+        verbose_name = '일일 스탯 요약'
+        verbose_name_plural = '일일 스탯 요약들'
+        unique_together = ('character', 'stat_type', 'date')
+
+    def __str__(self):
+        return f"{self.character.name} {self.stat_type} {self.date}: {self.last_value}"
+
+
+CURRENCY_CHOICES = [
+    ('gold', '골드'),
+    ('gems', '젬'),
+]
+
+
+class CurrencyTransaction(models.Model):
+    """골드/젬 변동 원장 (추가만 하고 수정/삭제하지 않음)"""
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='currency_transactions'
+    )
+    currency = models.CharField(max_length=10, choices=CURRENCY_CHOICES)
+    amount = models.IntegerField(help_text="증감량 (지출은 음수)")
+    kind = models.CharField(
+        max_length=20,
+        choices=[
+            ('opening', '기초 잔액'),
+            ('quest', '퀘스트 보상'),
+            ('achievement', '업적 보상'),
+            ('purchase', '구매'),
+            ('adjustment', '조정'),
+        ]
+    )
+    reason = models.CharField(max_length=100, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'currency_transactions'
+        verbose_name = '화폐 거래 기록'
+        verbose_name_plural = '화폐 거래 기록들'
+        indexes = [
+            models.Index(fields=['user', 'currency', 'id'], name='currency_tx_user_currency_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.nickname} {self.currency} {self.amount:+d} ({self.kind})"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("화폐 거래 기록은 수정할 수 없습니다.")
+        super().save(*args, **kwargs)
+
+
+class CurrencySnapshot(models.Model):
+    """사용자/화폐별 잔액 스냅샷 (last_transaction_id까지의 원장 합계)"""
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='currency_snapshots'
+    )
+    currency = models.CharField(max_length=10, choices=CURRENCY_CHOICES)
+    balance = models.BigIntegerField(default=0)
+    last_transaction_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'currency_snapshots'
+        verbose_name = '화폐 잔액 스냅샷'
+        verbose_name_plural = '화폐 잔액 스냅샷들'
+        unique_together = ('user', 'currency')
+
+    def __str__(self):
+        return f"{self.user.nickname} {self.currency}: {self.balance}"
+
+
 class NutritionLog(models.Model):
     """사용자 영양 섭취 기록"""
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='nutrition_logs')
@@ -208,6 +325,10 @@ class NutritionLog(models.Model):
     
     # 식사 사진
     meal_image = models.ImageField(upload_to='nutrition/meals/', blank=True, null=True)
+    meal_image_derivatives = models.JSONField(default=dict, blank=True, editable=False)
+    
+    # 저장 시 계산해 두는 영양 점수 (0-100), 필터/정렬/집계에 사용
+    nutrition_score = models.PositiveSmallIntegerField(default=0, editable=False)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -218,37 +339,59 @@ class NutritionLog(models.Model):
         verbose_name_plural = '영양 기록들'
         ordering = ['-date', '-created_at']
         unique_together = ('user', 'date', 'meal_type')
+        indexes = [
+            models.Index(fields=['user', 'date', 'nutrition_score'], name='nutrition_user_date_score_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.nickname} - {self.get_meal_type_display()} ({self.date})"
 
-    @property
-    def nutrition_score(self):
+    def save(self, *args, **kwargs):
+        self.nutrition_score = self.calculate_nutrition_score()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'nutrition_score'}
+        super().save(*args, **kwargs)
+
+    def calculate_nutrition_score(self):
         """영양 점수 계산 (0-100)"""
-        score = 0
-        
-        # 기본 품질 점수
-        quality_scores = {
-            'excellent': 40,
-            'good': 30,
-            'fair': 20,
-            'poor': 10
-        }
-        score += quality_scores.get(self.meal_quality, 0)
-        
-        # 체크리스트 점수 (각각 15점)
-        if self.included_vegetables:
-            score += 15
-        if self.included_protein:
-            score += 15
-        if self.included_grains:
-            score += 15
-        if self.proper_portion:
-            score += 15
-            
+        # 기본 품질 점수 + 체크리스트 점수 (각각 15점)
+        score = QUALITY_SCORES.get(self.meal_quality, 0)
+        score += CHECKLIST_SCORE * sum(getattr(self, field) for field in CHECKLIST_FIELDS)
         return min(100, score)
 
 
+class NutritionDailyRollup(models.Model):
+    """사용자/날짜별 영양 기록 요약 (통계/대시보드용)"""
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='nutrition_rollups'
+    )
+    date = models.DateField()
+    meal_count = models.PositiveIntegerField(default=0)
+    score_sum = models.PositiveIntegerField(default=0, help_text="그날 식사 영양 점수 합계")
+
+    excellent_meals = models.PositiveIntegerField(default=0)
+    good_meals = models.PositiveIntegerField(default=0)
+    fair_meals = models.PositiveIntegerField(default=0)
+    poor_meals = models.PositiveIntegerField(default=0)
+
+    vegetables_count = models.PositiveIntegerField(default=0)
+    protein_count = models.PositiveIntegerField(default=0)
+    grains_count = models.PositiveIntegerField(default=0)
+    proper_portion_count = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'nutrition_daily_rollups'
+        verbose_name = '일일 영양 요약'
+        verbose_name_plural = '일일 영양 요약들'
+        unique_together = ('user', 'date')
+
+    def __str__(self):
+        return f"{self.user_id} {self.date}: {self.meal_count}끼 {self.score_sum}점"
+
+
 class Supplement(models.Model):
     """영양제/보충제 마스터 데이터"""
     name = models.CharField(max_length=100, unique=True)
@@ -0,0 +1,91 @@
+"""영양 점수와 영양 통계 집계
+
+nutrition_score는 식사 품질 점수에 체크리스트 항목마다 15점을 더한 값으로, 저장 시
+NutritionLog.nutrition_score 컬럼에 기록된다. 같은 규칙을 파이썬(모델 저장)과 SQL
+(Case/When 식, save()를 거치지 않는 일괄 갱신용) 양쪽에서 쓰므로 점수표를 여기 한 곳에 둔다.
+통계는 원본 기록 대신 사용자/날짜별 요약(NutritionDailyRollup)을 읽는다.
+"""
+from datetime import timedelta
+
+from django.db.models import Case, IntegerField, Q, Sum, Value, When
+
+QUALITY_SCORES = {
+    'excellent': 40,
+    'good': 30,
+    'fair': 20,
+    'poor': 10,
+}
+
+CHECKLIST_FIELDS = ('included_vegetables', 'included_protein', 'included_grains', 'proper_portion')
+CHECKLIST_SCORE = 15
+
+
+def nutrition_score_expression():
+    """calculate_nutrition_score()와 같은 값을 계산하는 SQL 식"""
+    score = Case(
+        *[When(meal_quality=quality, then=Value(points)) for quality, points in QUALITY_SCORES.items()],
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    for field in CHECKLIST_FIELDS:
+        score += Case(
+            When(**{field: True}, then=Value(CHECKLIST_SCORE)),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    return score
+
+
+def checklist_count_field(field):
+    """체크리스트 필드에 대응하는 일일 요약 개수 필드 (included_vegetables -> vegetables_count)"""
+    return f"{field.replace('included_', '')}_count"
+
+
+ROLLUP_COUNT_FIELDS = (
+    'meal_count', 'score_sum',
+    *(f'{quality}_meals' for quality in QUALITY_SCORES),
+    *(checklist_count_field(field) for field in CHECKLIST_FIELDS),
+)
+
+
+def rollup_contribution(log):
+    """영양 기록 한 건이 일일 요약에 더하는 값 {요약 필드: 값}"""
+    contribution = dict.fromkeys(ROLLUP_COUNT_FIELDS, 0)
+    contribution['meal_count'] = 1
+    contribution['score_sum'] = log.nutrition_score
+    if log.meal_quality in QUALITY_SCORES:
+        contribution[f'{log.meal_quality}_meals'] = 1
+    for field in CHECKLIST_FIELDS:
+        contribution[checklist_count_field(field)] = int(getattr(log, field))
+    return contribution
+
+
+def nutrition_stats(rollups, today):
+    """일일 영양 요약 queryset의 통계를 집계 쿼리 한 번으로 계산
+
+    기간 평균은 기간 내 점수 합계를 식사 수로 나눈 값이므로 원본 기록의 평균과 같다.
+    """
+    periods = {
+        'daily': Q(date=today),
+        'weekly': Q(date__gte=today - timedelta(days=7)),
+        'monthly': Q(date__gte=today - timedelta(days=30)),
+    }
+    aggregates = {f'total_{field}': Sum(field) for field in ROLLUP_COUNT_FIELDS if field != 'score_sum'}
+    for period, condition in periods.items():
+        aggregates[f'{period}_score_sum'] = Sum('score_sum', filter=condition)
+        aggregates[f'{period}_meal_count'] = Sum('meal_count', filter=condition)
+    totals = rollups.aggregate(**aggregates)
+
+    total_logs = totals['total_meal_count'] or 0
+    stats = {}
+    for period in periods:
+        meals = totals[f'{period}_meal_count']
+        stats[f'{period}_average_score'] = round(totals[f'{period}_score_sum'] / meals, 2) if meals else 0
+    stats['total_logs'] = total_logs
+    for quality in QUALITY_SCORES:
+        stats[f'{quality}_meals'] = totals[f'total_{quality}_meals'] or 0
+    for field in CHECKLIST_FIELDS:
+        count = totals[f'total_{checklist_count_field(field)}'] or 0
+        name = field.replace('included_', '')
+        stats[f'{name}_percentage'] = round((count / total_logs * 100) if total_logs else 0, 2)
+    return stats
@@ -0,0 +1,69 @@
+"""연간 영양 히트맵 (GitHub 잔디 형태)
+
+한 해의 날짜별 강도(0-4)를 1월 1일부터 하루 1바이트로 나열한 뒤 base64로 인코딩해
+응답한다. 데이터는 일일 영양 요약에서 한 번에 읽으며, ETag는 그해 요약의 개수와 마지막
+수정 시각으로 만들어 그해 기록이 바뀔 때만 달라진다.
+"""
+import base64
+import hashlib
+from datetime import date
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from .models import NutritionDailyRollup
+
+HEATMAP_LEVELS = 4
+
+# 히트맵 응답 캐시 유지 시간(초), 키에 ETag가 들어가므로 데이터가 바뀌면 새 키를 쓴다
+HEATMAP_CACHE_TTL = 24 * 60 * 60
+
+
+def heatmap_level(meal_count, score_sum):
+    """하루 강도: 기록 없음 0, 평균 영양 점수 25점 구간마다 1-4"""
+    if not meal_count:
+        return 0
+    return 1 + min(HEATMAP_LEVELS - 1, score_sum // meal_count // 25)
+
+
+def year_rollups(user_id, year):
+    return NutritionDailyRollup.objects.filter(
+        user_id=user_id, date__gte=date(year, 1, 1), date__lte=date(year, 12, 31)
+    )
+
+
+def nutrition_heatmap_etag(user_id, year):
+    """그해 요약 개수와 마지막 수정 시각으로 만든 ETag (쿼리 한 번)"""
+    version = year_rollups(user_id, year).aggregate(count=Count('id'), last_updated=Max('updated_at'))
+    digest = hashlib.md5(
+        f"{version['count']}:{version['last_updated']}".encode(), usedforsecurity=False
+    ).hexdigest()[:16]
+    return f'"nutrition-heatmap-{user_id}-{year}-{digest}"'
+
+
+def build_nutrition_heatmap(user_id, year):
+    start = date(year, 1, 1)
+    days = (date(year + 1, 1, 1) - start).days
+    levels = bytearray(days)
+    rows = year_rollups(user_id, year).values_list('date', 'meal_count', 'score_sum')
+    for day, meal_count, score_sum in rows:
+        levels[(day - start).days] = heatmap_level(meal_count, score_sum)
+
+    return {
+        'year': year,
+        'start': start,
+        'days': days,
+        'levels': HEATMAP_LEVELS,
+        'encoding': 'base64',
+        'data': base64.b64encode(bytes(levels)).decode(),
+    }
+
+
+def get_nutrition_heatmap(user_id, year, etag):
+    """ETag별로 캐시된 히트맵 조회, 없으면 생성"""
+    key = f'characters:nutrition_heatmap:{etag.strip(chr(34))}'
+    heatmap = cache.get(key)
+    if heatmap is None:
+        heatmap = build_nutrition_heatmap(user_id, year)
+        cache.set(key, heatmap, HEATMAP_CACHE_TTL)
+    return heatmap
@@ -0,0 +1,131 @@
+"""영양 기록 일괄 가져오기 (CSV / NDJSON)
+
+파일을 한 줄씩 읽어 행 단위로 검증하고, 청크마다 (user, date, meal_type) 기준
+bulk_create(update_conflicts=True) 한 번으로 저장한다. 파일 전체를 메모리에 올리지
+않으므로 파일 크기와 관계없이 청크 크기만큼만 메모리를 쓴다. bulk_create는 save()와
+시그널을 거치지 않으므로 영양 점수는 직접 계산하고, 일일 요약은 청크에 포함된 날짜만
+다시 계산한다.
+"""
+import csv
+import json
+import time
+
+from django.db import transaction
+from rest_framework import serializers
+
+from .models import NutritionLog
+from .nutrition import CHECKLIST_FIELDS
+from .nutrition_rollups import rebuild_daily_rollups
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+IMPORT_CHUNK_SIZE = 1000
+
+# 응답에 담는 행 오류 수 상한 (오류 개수는 모두 센다)
+MAX_REPORTED_ERRORS = 100
+
+UPDATE_FIELDS = (
+    'meal_quality', *CHECKLIST_FIELDS, 'notes', 'calories_estimate', 'nutrition_score', 'updated_at'
+)
+
+
+class NutritionLogRowSerializer(serializers.ModelSerializer):
+    """가져오기 파일의 한 행"""
+
+    class Meta:
+        model = NutritionLog
+        fields = ('date', 'meal_type', 'meal_quality', *CHECKLIST_FIELDS, 'notes', 'calories_estimate')
+        extra_kwargs = {'date': {'required': True}}
+
+
+def guess_format(filename):
+    if filename.lower().endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    return 'csv'
+
+
+UNPARSABLE_ROW = '행을 해석할 수 없습니다.'
+
+
+def iter_rows(stream, file_format):
+    """텍스트 스트림에서 (행 번호, 행 dict, 해석 오류) 순서대로 읽기 (해석에 실패하면 행은 None)
+
+    CSV 헤더를 해석할 수 없으면 csv.Error를 그대로 올린다 (파일 전체를 읽을 수 없음).
+    """
+    if file_format == 'csv':
+        reader = csv.DictReader(stream)
+        # 헤더를 먼저 읽어, 헤더를 해석할 수 없으면 행 오류가 아닌 파일 오류로 올림
+        if reader.fieldnames is None:
+            return
+        number = 0
+        while True:
+            number += 1
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as error:
+                # 잘못된 따옴표, 너무 긴 필드 등은 해당 행만 실패로 처리하고 다음 줄부터 계속 읽음
+                yield number, None, f'{UNPARSABLE_ROW} ({error})'
+                continue
+            # 빈 칸은 기본값을 쓰도록 제외
+            yield number, {key: value for key, value in row.items() if key and value not in ('', None)}, None
+
+    number = 0
+    for line in stream:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        if isinstance(row, dict):
+            yield number, row, None
+        else:
+            yield number, None, UNPARSABLE_ROW
+
+
+def import_nutrition_logs(user, stream, file_format, chunk_size=IMPORT_CHUNK_SIZE):
+    """스트림의 영양 기록을 사용자 기록으로 upsert 하고 결과 요약 반환"""
+    started = time.monotonic()
+    report = {'rows': 0, 'imported': 0, 'failed': 0, 'errors': []}
+    chunk = {}
+
+    def flush():
+        logs = list(chunk.values())
+        chunk.clear()
+        for log in logs:
+            log.nutrition_score = log.calculate_nutrition_score()
+        with transaction.atomic():
+            NutritionLog.objects.bulk_create(
+                logs,
+                update_conflicts=True,
+                unique_fields=['user', 'date', 'meal_type'],
+                update_fields=UPDATE_FIELDS,
+            )
+            rebuild_daily_rollups([user.pk], {log.date for log in logs})
+        report['imported'] += len(logs)
+
+    for number, row, parse_error in iter_rows(stream, file_format):
+        report['rows'] += 1
+        serializer = NutritionLogRowSerializer(data=row) if row is not None else None
+        if serializer is None or not serializer.is_valid():
+            report['failed'] += 1
+            if len(report['errors']) < MAX_REPORTED_ERRORS:
+                errors = serializer.errors if serializer is not None else {'non_field_errors': [parse_error]}
+                report['errors'].append({'row': number, 'errors': errors})
+            continue
+
+        log = NutritionLog(user=user, **serializer.validated_data)
+        # 같은 청크에 같은 식사가 여러 번 있으면 마지막 행을 사용 (한 upsert에서 같은 행을 두 번 갱신할 수 없음)
+        chunk[(log.date, log.meal_type)] = log
+        if len(chunk) >= chunk_size:
+            flush()
+
+    if chunk:
+        flush()
+
+    elapsed = time.monotonic() - started
+    report['elapsed_seconds'] = round(elapsed, 3)
+    report['rows_per_second'] = round(report['rows'] / elapsed) if elapsed else report['rows']
+    return report
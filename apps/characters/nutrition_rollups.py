@@ -0,0 +1,108 @@
+"""영양 기록 일일 요약 증분 갱신
+
+영양 기록이 저장/삭제되면 해당 사용자/날짜의 NutritionDailyRollup에 기록 한 건의 기여분
+(식사 수, 점수, 품질/체크리스트 개수)을 F() 증감으로 반영한다. 수정 전 기여분은 기록을
+DB에서 읽을 때 기억해 두며, 알 수 없으면 (필드 일부만 읽은 경우 등) 그날 기록으로 다시
+계산한다. save()를 거치지 않는 일괄 쓰기 뒤에는 rebuild_daily_rollups로 다시 맞춘다.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import NutritionDailyRollup, NutritionLog
+from .nutrition import (
+    CHECKLIST_FIELDS, QUALITY_SCORES, ROLLUP_COUNT_FIELDS, checklist_count_field, rollup_contribution
+)
+
+ROLLUP_SOURCE_FIELDS = ('user_id', 'date', 'meal_quality', 'nutrition_score', *CHECKLIST_FIELDS)
+
+
+def rollup_state(log):
+    """기록이 반영된 요약 위치와 기여분 (user_id, date, contribution)"""
+    return log.user_id, log.date, rollup_contribution(log)
+
+
+def daily_rollups(logs):
+    """영양 기록 queryset을 사용자/날짜별로 집계한 요약 (저장하지 않음)"""
+    rows = logs.values('user_id', 'date').annotate(
+        meal_count=Count('id'),
+        score_sum=Sum('nutrition_score'),
+        **{f'{quality}_meals': Count('id', filter=Q(meal_quality=quality)) for quality in QUALITY_SCORES},
+        **{checklist_count_field(field): Count('id', filter=Q(**{field: True})) for field in CHECKLIST_FIELDS},
+    ).order_by()
+    return [NutritionDailyRollup(**row) for row in rows]
+
+
+def rebuild_daily_rollups(user_ids, days=None):
+    """사용자들의 (days가 있으면 해당 날짜들만) 일일 요약을 원본 기록으로 다시 생성"""
+    logs = NutritionLog.objects.filter(user_id__in=user_ids)
+    rollups = NutritionDailyRollup.objects.filter(user_id__in=user_ids)
+    if days is not None:
+        logs = logs.filter(date__in=days)
+        rollups = rollups.filter(date__in=days)
+
+    built = daily_rollups(logs)
+    with transaction.atomic():
+        rollups.delete()
+        NutritionDailyRollup.objects.bulk_create(built, batch_size=1000)
+    return len(built)
+
+
+def apply_rollup_delta(user_id, day, delta):
+    """사용자/날짜 요약에 증감 반영 (요약이 없으면 생성)"""
+    changes = {field: F(field) + value for field, value in delta.items() if value}
+    if not changes:
+        return
+    rollup = NutritionDailyRollup.objects.filter(user_id=user_id, date=day)
+    if rollup.update(**changes, updated_at=timezone.now()):
+        if delta['meal_count'] < 0:
+            rollup.filter(meal_count=0).delete()
+        return
+
+    if delta['meal_count'] <= 0:
+        # 요약이 빠져 있던 날의 수정/삭제는 그날 기록으로 다시 계산
+        rebuild_daily_rollups([user_id], [day])
+        return
+    try:
+        with transaction.atomic():
+            NutritionDailyRollup.objects.create(user_id=user_id, date=day, **delta)
+    except IntegrityError:
+        # 같은 날 요약이 동시에 생성된 경우 증분으로 반영
+        rollup.update(**changes, updated_at=timezone.now())
+
+
+@receiver(post_init, sender=NutritionLog)
+def remember_rollup_state(sender, instance, **kwargs):
+    """DB에서 읽은 기록의 요약 기여분을 기억 (수정/삭제 시 차감용)"""
+    if instance.pk is None or instance.get_deferred_fields() & set(ROLLUP_SOURCE_FIELDS):
+        instance._rollup_state = None
+    else:
+        instance._rollup_state = rollup_state(instance)
+
+
+@receiver(post_save, sender=NutritionLog)
+def update_rollup_on_save(sender, instance, created, **kwargs):
+    old = None if created else instance._rollup_state
+    if not created and old is None:
+        # 수정 전 기여분을 모르면 그날 요약을 다시 계산
+        rebuild_daily_rollups([instance.user_id], [instance.date])
+        instance._rollup_state = rollup_state(instance)
+        return
+
+    new = rollup_state(instance)
+    if old is not None and old[:2] == new[:2]:
+        apply_rollup_delta(*new[:2], {field: new[2][field] - old[2][field] for field in ROLLUP_COUNT_FIELDS})
+    else:
+        if old is not None:
+            apply_rollup_delta(*old[:2], {field: -value for field, value in old[2].items()})
+        apply_rollup_delta(*new[:2], new[2])
+    instance._rollup_state = new
+
+
+@receiver(post_delete, sender=NutritionLog)
+def update_rollup_on_delete(sender, instance, **kwargs):
+    state = instance._rollup_state or rollup_state(instance)
+    user_id, day, contribution = state
+    apply_rollup_delta(user_id, day, {field: -value for field, value in contribution.items()})
@@ -0,0 +1,136 @@
+"""stat_history 월별 파티션 관리 (PostgreSQL 전용)
+
+stat_history는 created_at 기준 RANGE 파티션 테이블이며 파티션 이름은
+stat_history_YYYYMM 형식이다. 미리 만들어 두지 못한 기간의 행은
+stat_history_default 파티션으로 들어간다.
+"""
+import gzip
+import json
+import os
+from datetime import date, datetime
+
+from django.utils import timezone
+
+PARENT_TABLE = 'stat_history'
+DEFAULT_PARTITION = f'{PARENT_TABLE}_default'
+
+
+def is_supported(connection):
+    return connection.vendor == 'postgresql'
+
+
+def month_start(day):
+    return date(day.year, day.month, 1)
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f'{PARENT_TABLE}_{month:%Y%m}'
+
+
+def partition_bounds(month):
+    """파티션 구간 [해당 월 1일 0시, 다음 달 1일 0시) (현지 시간대)"""
+    start = timezone.make_aware(datetime.combine(month, datetime.min.time()))
+    end = timezone.make_aware(datetime.combine(add_months(month, 1), datetime.min.time()))
+    return start, end
+
+
+def create_partition(cursor, month):
+    """해당 월 파티션 생성 (이미 있으면 무시, 트랜잭션 안에서 호출)
+
+    파티션을 미리 만들지 못한 동안 그 달의 행이 기본 파티션에 들어가 있으면
+    PARTITION OF로는 만들 수 없으므로, 빈 테이블을 만들어 기본 파티션의 해당 구간
+    행을 옮긴 뒤 파티션으로 붙인다. 생성했으면 옮긴 행 수를, 이미 있으면 None을 반환한다.
+    """
+    name = partition_name(month)
+    cursor.execute('SELECT to_regclass(%s)', [f'"{name}"'])
+    if cursor.fetchone()[0] is not None:
+        return None
+
+    start, end = partition_bounds(month)
+    cursor.execute(
+        f'CREATE TABLE "{name}" (LIKE "{PARENT_TABLE}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    )
+    cursor.execute(
+        f'WITH moved AS ('
+        f'DELETE FROM "{DEFAULT_PARTITION}" WHERE created_at >= %s AND created_at < %s RETURNING *'
+        f') INSERT INTO "{name}" SELECT * FROM moved',
+        [start, end]
+    )
+    moved = cursor.rowcount
+    cursor.execute(
+        f'ALTER TABLE "{PARENT_TABLE}" ATTACH PARTITION "{name}" FOR VALUES FROM (%s) TO (%s)',
+        [start, end]
+    )
+    return moved
+
+
+def retained_since(connection):
+    """DB에 stat_history가 남아 있는 첫 달 (파티션이 없으면 None, 전체 보관)"""
+    if not is_supported(connection):
+        return None
+    with connection.cursor() as cursor:
+        partitions = list_partitions(cursor)
+    return partitions[0][0] if partitions else None
+
+
+def list_partitions(cursor):
+    """월별 파티션 목록 [(month, name)] (기본 파티션 제외, 오래된 순)"""
+    cursor.execute(
+        """
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = %s
+        """,
+        [PARENT_TABLE]
+    )
+    partitions = []
+    for (name,) in cursor.fetchall():
+        suffix = name[len(PARENT_TABLE) + 1:]
+        if len(suffix) == 6 and suffix.isdigit():
+            partitions.append((date(int(suffix[:4]), int(suffix[4:]), 1), name))
+    return sorted(partitions)
+
+
+def detach_partition(cursor, name):
+    cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{name}"')
+
+
+def archive_table(connection, name, directory, chunk_size=5000):
+    """분리된 파티션을 gzip 압축 NDJSON 파일로 저장하고 저장한 행 수 반환
+
+    임시 파일에 모두 쓴 뒤 이름을 바꾸므로, 중간에 실패해도 불완전한 아카이브가 남지 않는다.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'{name}.ndjson.gz')
+    partial_path = f'{path}.partial'
+
+    rows = 0
+    with connection.chunked_cursor() as cursor, gzip.open(partial_path, 'wt', encoding='utf-8') as archive:
+        cursor.execute(
+            f'SELECT id, character_id, stat_type, old_value, new_value, change_reason, created_at '
+            f'FROM "{name}" ORDER BY created_at, id'
+        )
+        columns = [column[0] for column in cursor.description]
+        while True:
+            chunk = cursor.fetchmany(chunk_size)
+            if not chunk:
+                break
+            for row in chunk:
+                record = dict(zip(columns, row))
+                record['created_at'] = record['created_at'].isoformat()
+                archive.write(json.dumps(record, ensure_ascii=False) + '\n')
+            rows += len(chunk)
+
+    os.replace(partial_path, path)
+    return path, rows
+
+
+def drop_table(cursor, name):
+    cursor.execute(f'DROP TABLE "{name}"')
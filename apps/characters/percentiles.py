@@ -0,0 +1,123 @@
+"""스탯별 백분위 ("심폐 상위 12%")
+
+요청마다 characters 테이블을 스탯별로 COUNT 하지 않도록, 주기 작업이 전체 캐릭터를
+한 번 스트리밍하며 스탯 값별 인원 히스토그램을 만들고 누적 분포를 캐시에 저장한다.
+워커 프로세스는 누적 분포를 메모리에 들고 있다가 작은 버전 키가 바뀔 때만 캐시에서
+다시 읽으므로, 백분위 조회는 메모리의 누적 분포에서 인덱스 하나를 읽는 것으로 끝난다.
+"""
+import logging
+import time
+from itertools import islice
+
+import numpy as np
+import redis
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import Character, STAT_FIELDS
+
+logger = logging.getLogger(__name__)
+
+STAT_HISTOGRAMS_KEY = 'characters:stat_histograms'
+STAT_HISTOGRAMS_VERSION_KEY = 'characters:stat_histograms:version'
+
+# 주기 작업이 멈춰도 오래된 분포를 계속 쓰지 않도록 하는 유지 시간(초)
+STAT_HISTOGRAMS_TTL = 6 * 60 * 60
+
+# 캐시의 분포 버전을 다시 확인하기까지의 간격(초)
+VERSION_CHECK_INTERVAL = 30
+
+
+class StatHistogramCache:
+    """버전 키가 바뀔 때만 캐시에서 다시 읽는 프로세스 내 누적 분포"""
+
+    def __init__(self):
+        self._histograms = None
+        self._version = None
+        self._checked_at = None
+
+    def get(self):
+        """현재 누적 분포 (아직 없으면 None, Redis 장애 중에는 이미 읽은 분포를 계속 씀)"""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < VERSION_CHECK_INTERVAL:
+            return self._histograms
+
+        try:
+            version = cache.get(STAT_HISTOGRAMS_VERSION_KEY)
+            if version is None:
+                # 주기 작업이 멈춰 유지 시간이 지난 분포는 버림
+                self._histograms = self._version = None
+            elif version != self._version:
+                self._histograms = cache.get(STAT_HISTOGRAMS_KEY)
+                self._version = version if self._histograms is not None else None
+        except redis.RedisError:
+            logger.warning('스탯 분포 조회 실패', exc_info=True)
+        self._checked_at = now
+        return self._histograms
+
+    def clear(self):
+        self._histograms = None
+        self._version = None
+        self._checked_at = None
+
+
+stat_histograms = StatHistogramCache()
+
+
+def build_stat_histograms(chunk_size=5000):
+    """전체 캐릭터를 한 번 읽어 스탯별 누적 분포를 만들고 캐시에 저장
+
+    스탯 값은 0 이상의 정수이므로 값 자체를 구간으로 쓰는 bincount로 센다.
+    at_or_below[stat][v]는 해당 스탯이 v 이하인 캐릭터 수다.
+    """
+    counts = np.zeros((len(STAT_FIELDS), 1), dtype=np.int64)
+    total = 0
+
+    rows = Character.objects.order_by().values_list(*STAT_FIELDS).iterator(chunk_size=chunk_size)
+    while True:
+        chunk = np.array(list(islice(rows, chunk_size)), dtype=np.int64)
+        if not len(chunk):
+            break
+        total += len(chunk)
+
+        width = max(counts.shape[1], int(chunk.max()) + 1)
+        if width > counts.shape[1]:
+            counts = np.pad(counts, ((0, 0), (0, width - counts.shape[1])))
+        for index in range(len(STAT_FIELDS)):
+            counts[index] += np.bincount(chunk[:, index], minlength=width)
+
+    histograms = {
+        'total': total,
+        'built_at': timezone.now(),
+        'at_or_below': {
+            stat: np.cumsum(counts[index]) for index, stat in enumerate(STAT_FIELDS)
+        },
+    }
+    # 분포를 먼저 저장한 뒤 버전을 바꿔, 새 버전을 본 워커가 항상 새 분포를 읽게 함
+    cache.set(STAT_HISTOGRAMS_KEY, histograms, STAT_HISTOGRAMS_TTL)
+    cache.set(STAT_HISTOGRAMS_VERSION_KEY, int(time.time() * 1000), STAT_HISTOGRAMS_TTL)
+    stat_histograms.clear()
+    return histograms
+
+
+def get_stat_histograms():
+    return stat_histograms.get()
+
+
+def stat_percentiles(character, histograms):
+    """캐릭터의 스탯별 상위 비율 {stat: {'value', 'top_percent'}}
+
+    top_percent는 자신보다 스탯이 높은 캐릭터 수에 자신을 더한 비율이다 (상위 N%).
+    """
+    total = histograms['total']
+    percentiles = {}
+    for stat in STAT_FIELDS:
+        value = getattr(character, stat)
+        at_or_below = histograms['at_or_below'][stat]
+        # 집계 이후 최고값을 넘어선 경우 1등으로 취급
+        higher = total - int(at_or_below[min(value, len(at_or_below) - 1)])
+        percentiles[stat] = {
+            'value': value,
+            'top_percent': min(round((higher + 1) / total * 100, 1), 100.0) if total else None,
+        }
+    return percentiles
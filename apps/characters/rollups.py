@@ -0,0 +1,78 @@
+"""스탯 변화 일일 요약
+
+StatHistory는 퀘스트 완료마다 스탯별로 한 행씩 쌓이므로, 그래프는 캐릭터/스탯/날짜별
+요약 행(StatDailyRollup)을 읽는다. 요약은 스탯 기록을 저장하는 같은 트랜잭션 안에서
+증분 갱신하며, 캐릭터 행이 잠긴 상태에서 호출되므로 읽고 쓰는 사이에 경합이 없다.
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .models import StatDailyRollup, StatHistory
+
+SERIES_BUCKETS = ('day', 'week', 'month')
+
+
+def record_stat_changes(character, history, now=None):
+    """스탯 기록 저장과 일일 요약 증분 갱신 (캐릭터 행 잠금 상태에서 호출)"""
+    if not history:
+        return
+    StatHistory.objects.bulk_create(history)
+
+    today = timezone.localdate(now)
+    rollups = {
+        rollup.stat_type: rollup
+        for rollup in StatDailyRollup.objects.filter(
+            character=character,
+            date=today,
+            stat_type__in={entry.stat_type for entry in history}
+        )
+    }
+    existing = set(rollups)
+
+    for entry in history:
+        rollup = rollups.get(entry.stat_type)
+        if rollup is None:
+            rollup = rollups[entry.stat_type] = StatDailyRollup(
+                character=character, stat_type=entry.stat_type, date=today, last_value=entry.new_value
+            )
+        fold_entry(rollup, entry)
+
+    StatDailyRollup.objects.bulk_create([r for stat, r in rollups.items() if stat not in existing])
+    updated = [r for stat, r in rollups.items() if stat in existing]
+    if updated:
+        StatDailyRollup.objects.bulk_update(updated, ['last_value', 'change_count', 'total_gain'])
+
+
+def fold_entry(rollup, entry):
+    """스탯 기록 한 건을 일일 요약에 반영 (시간 순으로 호출)"""
+    rollup.last_value = entry.new_value
+    rollup.change_count += 1
+    rollup.total_gain += entry.new_value - entry.old_value
+
+
+def bucket_start(day, bucket):
+    if bucket == 'week':
+        return day - timedelta(days=day.weekday())
+    if bucket == 'month':
+        return day.replace(day=1)
+    return day
+
+
+def build_series(rollups, bucket):
+    """날짜순 일일 요약을 일/주/월 구간으로 묶은 시계열
+
+    구간 값은 구간 마지막 날의 스탯 값이며, 변화 횟수와 증가량은 합산한다.
+    """
+    series = []
+    for rollup in rollups:
+        start = bucket_start(rollup.date, bucket)
+        if series and series[-1]['date'] == start:
+            point = series[-1]
+        else:
+            point = {'date': start, 'value': 0, 'changes': 0, 'gain': 0}
+            series.append(point)
+        point['value'] = rollup.last_value
+        point['changes'] += rollup.change_count
+        point['gain'] += rollup.total_gain
+    return series
@@ -1,6 +1,9 @@
 from rest_framework import serializers
+from apps.images.serializers import ImageDerivativesField
+from .nutrition_import import IMPORT_FORMATS
+from .rollups import SERIES_BUCKETS
 from .models import (
-    Character, Achievement, UserAchievement, StatHistory,
+    STAT_FIELDS, Character, Achievement, UserAchievement, StatHistory, CurrencyTransaction,
     NutritionLog, Supplement, UserSupplement, SupplementLog
 )
 
@@ -12,13 +15,28 @@ class CharacterSerializer(serializers.ModelSerializer):
     class Meta:
         model = Character
         fields = (
-            'id', 'name', 'level', 'experience_points',
+            'id', 'name', 'level', 'experience_points', 'quests_completed',
             'stamina', 'strength', 'mental', 'endurance',
-            'cardio', 'flexibility', 'nutrition', 'recovery',
+            'cardio', 'flexibility', 'nutrition', 'recovery', 'unspent_stat_points',
             'gold', 'gems', 'skin', 'avatar_url',
             'health_score', 'total_stats', 'created_at', 'updated_at'
         )
-        read_only_fields = ('id', 'user', 'level', 'experience_points', 'gold', 'gems', 'created_at', 'updated_at')
+        # 스탯은 스탯 포인트 배분 API로만 변경
+        read_only_fields = (
+            'id', 'user', 'level', 'experience_points', 'quests_completed',
+            *STAT_FIELDS, 'unspent_stat_points',
+            'gold', 'gems', 'created_at', 'updated_at'
+        )
+
+    def validate(self, attrs):
+        # 읽기 전용 스탯이 조용히 무시되지 않도록 배분 API를 안내하며 거절
+        stats = [stat for stat in STAT_FIELDS if stat in self.initial_data]
+        if stats:
+            raise serializers.ValidationError({
+                stat: '스탯은 스탯 포인트 배분 API(/api/characters/stats/allocate/)로만 변경할 수 있습니다.'
+                for stat in stats
+            })
+        return attrs
 
 
 class StatHistorySerializer(serializers.ModelSerializer):
@@ -28,6 +46,54 @@ class StatHistorySerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'character', 'created_at')
 
 
+class CurrencyTransactionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CurrencyTransaction
+        fields = ('id', 'currency', 'amount', 'kind', 'reason', 'created_at')
+
+
+class StatAllocationSerializer(serializers.Serializer):
+    """스탯 포인트 배분 요청 {stat: points}"""
+    stamina = serializers.IntegerField(min_value=0, default=0)
+    strength = serializers.IntegerField(min_value=0, default=0)
+    mental = serializers.IntegerField(min_value=0, default=0)
+    endurance = serializers.IntegerField(min_value=0, default=0)
+    cardio = serializers.IntegerField(min_value=0, default=0)
+    flexibility = serializers.IntegerField(min_value=0, default=0)
+    nutrition = serializers.IntegerField(min_value=0, default=0)
+    recovery = serializers.IntegerField(min_value=0, default=0)
+
+    def validate(self, attrs):
+        allocation = {stat: points for stat, points in attrs.items() if points}
+        if not allocation:
+            raise serializers.ValidationError("배분할 스탯 포인트를 입력해주세요.")
+        return allocation
+
+
+class StatSeriesQuerySerializer(serializers.Serializer):
+    """스탯 시계열 조회 조건"""
+    stat = serializers.ChoiceField(choices=STAT_FIELDS)
+    bucket = serializers.ChoiceField(choices=SERIES_BUCKETS, default='day')
+    days = serializers.IntegerField(min_value=1, max_value=3650, default=365)
+
+
+class NutritionImportSerializer(serializers.Serializer):
+    """영양 기록 가져오기 파일 (형식을 생략하면 확장자로 판단)"""
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=IMPORT_FORMATS, required=False)
+
+
+class NutritionHeatmapQuerySerializer(serializers.Serializer):
+    """영양 히트맵 조회 연도 (기본값 올해)"""
+    year = serializers.IntegerField(min_value=2000, max_value=2100, required=False)
+
+
+class LeaderboardQuerySerializer(serializers.Serializer):
+    """리더보드 조회 구간"""
+    offset = serializers.IntegerField(min_value=0, default=0)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
+
+
 class AchievementSerializer(serializers.ModelSerializer):
     class Meta:
         model = Achievement
@@ -44,7 +110,7 @@ class UserAchievementSerializer(serializers.ModelSerializer):
 
 
 class NutritionLogSerializer(serializers.ModelSerializer):
-    nutrition_score = serializers.ReadOnlyField()
+    meal_image_urls = ImageDerivativesField('meal_image')
     meal_type_display = serializers.CharField(source='get_meal_type_display', read_only=True)
     meal_quality_display = serializers.CharField(source='get_meal_quality_display', read_only=True)
     
@@ -55,7 +121,7 @@ class NutritionLogSerializer(serializers.ModelSerializer):
             'meal_quality', 'meal_quality_display',
             'included_vegetables', 'included_protein', 
             'included_grains', 'proper_portion',
-            'notes', 'calories_estimate', 'meal_image',
+            'notes', 'calories_estimate', 'meal_image', 'meal_image_urls',
             'nutrition_score', 'created_at', 'updated_at'
         )
         read_only_fields = ('id', 'user', 'nutrition_score', 'created_at', 'updated_at')
@@ -0,0 +1,69 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .achievements import achievement_entries, achievement_progress, grant_achievements
+from .leaderboards import sync_leaderboards_on_commit
+from .ledger import record_transactions
+from .models import Character, StatHistory, STAT_FIELDS
+from .rollups import record_stat_changes
+from .stats_cache import invalidate_character_stats
+
+
+class InsufficientStatPoints(Exception):
+    """배분 가능한 스탯 포인트 부족"""
+
+
+def allocate_stat_points(user, allocation):
+    """스탯 포인트 배분을 UPDATE 한 번으로 적용하고 갱신된 캐릭터 반환
+
+    allocation은 {stat: points} 이다. 남은 포인트 조건을 UPDATE에 함께 걸어
+    동시 요청이 있어도 적립된 포인트 이상으로 배분되지 않는다. 배분으로 넘어선
+    스탯 업적은 같은 트랜잭션에서 부여하고 보상을 지급한다.
+    """
+    spent = sum(allocation.values())
+    now = timezone.now()
+
+    with transaction.atomic():
+        updated = Character.objects.filter(
+            user=user,
+            unspent_stat_points__gte=spent
+        ).update(
+            unspent_stat_points=F('unspent_stat_points') - spent,
+            updated_at=now,
+            **{stat: F(stat) + points for stat, points in allocation.items()}
+        )
+        if not updated:
+            raise InsufficientStatPoints(spent)
+
+        # UPDATE로 잠긴 행이므로 다시 읽은 값이 이번 배분 직후의 값이다
+        character = Character.objects.get(user=user)
+        history = []
+        for stat, points in allocation.items():
+            new_value = getattr(character, stat)
+            history.append(StatHistory(
+                character=character,
+                stat_type=stat,
+                old_value=new_value - points,
+                new_value=new_value,
+                change_reason="스탯 포인트 배분"
+            ))
+        record_stat_changes(character, history, now)
+
+        # 배분 전 값은 잠긴 행에서 배분한 포인트를 빼서 구함 (UPDATE 전에 읽은 값은 낡았을 수 있음)
+        after = achievement_progress(character)
+        before = {
+            **after,
+            'stat_level': max(getattr(character, stat) - allocation.get(stat, 0) for stat in STAT_FIELDS),
+        }
+        granted = grant_achievements(user, character, before, after)
+        if granted:
+            character.save(update_fields=[
+                'level', 'experience_points', 'unspent_stat_points', 'gold', 'gems', 'updated_at'
+            ])
+            record_transactions(achievement_entries(user.pk, granted))
+
+        invalidate_character_stats([user.pk])
+        sync_leaderboards_on_commit([user.pk])
+
+    return character
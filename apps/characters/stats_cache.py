@@ -0,0 +1,109 @@
+"""캐릭터 스탯 응답 캐시
+
+대시보드가 주기적으로 호출하는 스탯 응답을 캐시(Redis)에 저장한다. 캐시 키와
+ETag에는 사용자별 스탯 버전이 들어가며, 캐릭터가 저장되면 커밋 이후 버전 키를
+1 올려 다음 요청이 새 버전으로 다시 만들게 한다. 버전 키는 지우지 않으므로 같은
+버전이 다시 발급되지 않는다. 버전만으로 ETag를 만들 수 있으므로
+If-None-Match 재검증은 캐릭터를 읽지 않고 응답한다. Redis 장애 중에는 기록만 하고
+캐시 없이 (ETag 없이) 응답한다.
+"""
+import logging
+import time
+
+import redis
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Character, STAT_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# 스탯 응답 캐시 유지 시간(초), 버전이 바뀌면 이전 응답은 더 이상 읽히지 않는다
+STATS_CACHE_TTL = 60 * 60
+
+
+def stats_version_key(user_id):
+    return f'characters:stats:version:{user_id}'
+
+
+def get_stats_version(user_id):
+    """사용자의 현재 스탯 버전 (키가 없을 때만 시간 기반 값으로 처음 발급, Redis 장애 시 None)"""
+    key = stats_version_key(user_id)
+    try:
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, int(time.time() * 1000), timeout=None)
+            version = cache.get(key)
+    except redis.RedisError:
+        logger.warning('스탯 버전 조회 실패', exc_info=True)
+        return None
+    return version
+
+
+def stats_etag(user_id, version):
+    return f'"stats-{user_id}-{version}"'
+
+
+def build_character_stats(character):
+    """스탯 API 응답 데이터"""
+    stats = {stat: getattr(character, stat) for stat in STAT_FIELDS}
+    stats.update({
+        'total_stats': character.total_stats,
+        'health_score': character.health_score,
+        'level': character.level,
+        'experience_points': character.experience_points,
+        'unspent_stat_points': character.unspent_stat_points,
+    })
+    return stats
+
+
+def get_character_stats(user_id, version, load_character):
+    """버전별로 캐시된 스탯 응답 조회, 없으면 load_character()로 읽어 생성
+
+    버전이 없거나 (Redis 장애) 캐시를 읽고 쓸 수 없으면 캐시 없이 생성한다.
+    """
+    if version is None:
+        return build_character_stats(load_character())
+
+    key = f'characters:stats:{user_id}:{version}'
+    try:
+        stats = cache.get(key)
+    except redis.RedisError:
+        logger.warning('스탯 캐시 조회 실패', exc_info=True)
+        return build_character_stats(load_character())
+    if stats is None:
+        stats = build_character_stats(load_character())
+        try:
+            cache.set(key, stats, STATS_CACHE_TTL)
+        except redis.RedisError:
+            logger.warning('스탯 캐시 저장 실패', exc_info=True)
+    return stats
+
+
+def bump_stats_versions(keys):
+    """스탯 버전 1 올림 (커밋 이후 실행되므로 Redis 오류는 기록만 하고 다른 커밋 훅을 막지 않음)"""
+    try:
+        for key in keys:
+            try:
+                cache.incr(key)
+            except ValueError:
+                # 아직 발급되지 않은 버전은 다음 조회 때 새로 발급된다
+                pass
+    except redis.RedisError:
+        logger.exception('스탯 버전 갱신 실패')
+
+
+def invalidate_character_stats(user_ids):
+    """스탯이 바뀐 사용자들의 스탯 버전을 커밋 이후 1 올림"""
+    keys = [stats_version_key(user_id) for user_id in user_ids]
+    if keys:
+        transaction.on_commit(lambda: bump_stats_versions(keys))
+
+
+@receiver(post_save, sender=Character)
+@receiver(post_delete, sender=Character)
+def invalidate_saved_character_stats(sender, instance, **kwargs):
+    """보상 지급, 캐릭터 수정, 관리자 변경 등 캐릭터 저장 시 스탯 캐시 무효화"""
+    invalidate_character_stats([instance.user_id])
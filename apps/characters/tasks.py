@@ -0,0 +1,16 @@
+from celery import shared_task
+from .ledger import take_currency_snapshots
+from .percentiles import build_stat_histograms
+
+
+@shared_task
+def build_stat_histograms_task():
+    """스탯별 백분위 계산용 히스토그램 갱신"""
+    histograms = build_stat_histograms()
+    return histograms['total']
+
+
+@shared_task
+def take_currency_snapshots_task():
+    """원장 잔액 스냅샷 갱신"""
+    return take_currency_snapshots()
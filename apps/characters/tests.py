@@ -1,12 +1,46 @@
-from django.test import TestCase
+import base64
+import csv
+import json
+import os
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
+import redis
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
-from .models import Character, Achievement, UserAchievement, StatHistory
+from .achievements import get_achievement_index, invalidate_achievement_index
+from .partitions import add_months, partition_name
+from . import leaderboards
+from .leaderboards import leaderboard_scores, sync_leaderboards
+from . import percentiles
+from .percentiles import build_stat_histograms, get_stat_histograms, stat_histograms, stat_percentiles
+from .ledger import currency_balances, currency_entries, record_transactions, take_currency_snapshots
+from .nutrition import ROLLUP_COUNT_FIELDS, nutrition_score_expression
+from .nutrition_rollups import daily_rollups
+from .leveling import level_for_experience, required_exp, total_experience
+from .models import (
+    Character, Achievement, UserAchievement, StatDailyRollup, StatHistory, CurrencySnapshot,
+    NutritionLog, NutritionDailyRollup
+)
+from .rollups import build_series, record_stat_changes
+from .stats_cache import get_stats_version, invalidate_character_stats
 
 User = get_user_model()
 
+# 테스트에서는 Redis 대신 프로세스 메모리 캐시 사용
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
 
 class CharacterModelTest(TestCase):
     """캐릭터 모델 테스트"""
@@ -114,18 +148,39 @@ class CharacterModelTest(TestCase):
         self.assertEqual(character.level, 2)
         self.assertEqual(character.experience_points, 10)  # 레벨업 후 남은 경험치
     
-    def test_distribute_stat_points(self):
-        """스탯 포인트 분배 테스트"""
+    def test_gain_experience_multiple_levels(self):
+        """한 번에 여러 레벨이 오르는 경험치 획득 테스트"""
         character = Character.objects.create(
             user=self.user,
             name='테스트 캐릭터'
         )
         
-        initial_total = character.total_stats
-        character.distribute_stat_points(8)  # 8포인트 분배
+        # 레벨 1→2: 100, 2→3: 229, 3→4: 373 (총 702)
+        character.gain_experience(702 + 5)
+        self.assertEqual(character.level, 4)
+        self.assertEqual(character.experience_points, 5)
         
-        # 모든 스탯이 1씩 증가했는지 확인 (8개 스탯)
-        self.assertEqual(character.total_stats, initial_total + 8)
+        # 레벨당 2포인트 적립 (스탯은 사용자가 직접 배분)
+        self.assertEqual(character.unspent_stat_points, 6)
+        self.assertEqual(character.stamina, 10)
+        self.assertEqual(character.strength, 10)
+
+
+class LevelCurveTest(TestCase):
+    """레벨 곡선 테스트"""
+    
+    def test_level_for_experience_matches_required_exp(self):
+        """누적 경험치 테이블이 레벨별 필요 경험치와 일치하는지 테스트"""
+        total = 0
+        for level in range(1, 50):
+            self.assertEqual(level_for_experience(total), (level, 0))
+            self.assertEqual(level_for_experience(total + required_exp(level) - 1), (level, required_exp(level) - 1))
+            total += required_exp(level)
+    
+    def test_total_experience_round_trip(self):
+        """(레벨, 경험치) ↔ 누적 경험치 변환 테스트"""
+        self.assertEqual(total_experience(1, 0), 0)
+        self.assertEqual(level_for_experience(total_experience(37, 120)), (37, 120))
 
 
 class AchievementModelTest(TestCase):
@@ -161,6 +216,49 @@ class AchievementModelTest(TestCase):
         self.assertEqual(str(achievement), '첫 걸음')
 
 
+class AchievementIndexTest(TestCase):
+    """업적 인덱스 테스트"""
+    
+    def setUp(self):
+        self.addCleanup(invalidate_achievement_index)
+        for value in (1, 10, 50):
+            Achievement.objects.create(
+                name=f'퀘스트 {value}회 완료',
+                description='퀘스트 완료',
+                requirement_type='quest_count',
+                requirement_value=value
+            )
+        Achievement.objects.create(
+            name='레벨 5 달성',
+            description='레벨 달성',
+            requirement_type='level',
+            requirement_value=5
+        )
+    
+    def test_crossed_returns_only_new_thresholds(self):
+        """새로 넘어선 임계값만 반환하는지 테스트"""
+        index = get_achievement_index()
+        
+        self.assertEqual([a.requirement_value for a in index.crossed('quest_count', 0, 1)], [1])
+        self.assertEqual([a.requirement_value for a in index.crossed('quest_count', 1, 49)], [10])
+        self.assertEqual([a.requirement_value for a in index.crossed('quest_count', 0, 100)], [1, 10, 50])
+        self.assertEqual(index.crossed('quest_count', 10, 10), [])
+        self.assertEqual(index.crossed('streak', 0, 100), [])
+    
+    def test_index_reloads_after_achievement_change(self):
+        """업적이 추가되면 인덱스가 갱신되는지 테스트"""
+        get_achievement_index()
+        Achievement.objects.create(
+            name='퀘스트 5회 완료',
+            description='퀘스트 완료',
+            requirement_type='quest_count',
+            requirement_value=5
+        )
+        
+        crossed = get_achievement_index().crossed('quest_count', 1, 9)
+        self.assertEqual([a.requirement_value for a in crossed], [5])
+
+
 class UserAchievementModelTest(TestCase):
     """사용자 업적 모델 테스트"""
     
@@ -338,4 +436,843 @@ class CharacterAPITest(APITestCase):
     def test_unauthorized_access(self):
         """인증되지 않은 접근 테스트"""
         response = self.client.get(self.character_url)
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CharacterProvisioningTest(APITestCase):
+    """캐릭터 생성/요청 단위 조회 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            username='testuser',
+            nickname='테스트유저',
+            password='testpass123'
+        )
+
+    def test_character_loaded_once_per_request(self):
+        """요청 안에서 캐릭터를 한 번만 조회하는지 테스트"""
+        Character.create_for_user(self.user)
+        self.client.force_authenticate(user=self.user)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('character_stats'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_missing_character_created_on_access(self):
+        """가입 이전 사용자는 첫 접근 시 캐릭터가 생성되는지 테스트"""
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(reverse('character_detail'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Character.objects.get(user=self.user).name, '테스트유저의 캐릭터')
+
+    def test_create_missing_characters_command(self):
+        """캐릭터가 없는 사용자만 백필하는지 테스트"""
+        other = User.objects.create_user(
+            email='other@example.com',
+            username='other',
+            nickname='다른유저',
+            password='testpass123'
+        )
+        Character.objects.create(user=other, name='기존 캐릭터')
+
+        call_command('create_missing_characters', chunk_size=1, stdout=StringIO())
+
+        self.assertEqual(Character.objects.get(user=self.user).name, '테스트유저의 캐릭터')
+        self.assertEqual(Character.objects.get(user=other).name, '기존 캐릭터')
+
+        # bulk_create로 만든 캐릭터도 기초 잔액이 원장에 남고, 기존 캐릭터는 중복 기록되지 않음
+        self.assertEqual(currency_balances(self.user), {'gold': 100, 'gems': 0})
+        self.assertEqual(currency_balances(other), {'gold': 100, 'gems': 0})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CharacterStatsCacheTest(APITestCase):
+    """캐릭터 스탯 캐시/ETag 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            username='testuser',
+            nickname='테스트유저',
+            password='testpass123'
+        )
+        self.character = Character.create_for_user(self.user)
+        self.client.force_authenticate(user=self.user)
+
+    def test_cached_stats_skip_database(self):
+        """두 번째 조회는 캐시에서 응답하는지 테스트"""
+        first = self.client.get(reverse('character_stats'))
+
+        with self.assertNumQueries(0):
+            second = self.client.get(reverse('character_stats'))
+
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(first['ETag'], second['ETag'])
+
+    def test_if_none_match_returns_not_modified(self):
+        """ETag가 일치하면 캐릭터를 읽지 않고 304를 반환하는지 테스트"""
+        etag = self.client.get(reverse('character_stats'))['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('character_stats'), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_character_save_changes_etag(self):
+        """캐릭터가 저장되면 ETag와 스탯이 갱신되는지 테스트"""
+        etag = self.client.get(reverse('character_stats'))['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.character.stamina = 42
+            self.character.save()
+        response = self.client.get(reverse('character_stats'), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['stamina'], 42)
+
+    def test_invalidation_increments_version(self):
+        """무효화가 버전 키를 지우지 않고 1씩 올리는지 테스트 (같은 버전 재발급 없음)"""
+        version = get_stats_version(self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_character_stats([self.user.pk])
+            invalidate_character_stats([self.user.pk])
+
+        self.assertEqual(get_stats_version(self.user.pk), version + 2)
+
+    def test_redis_outage_serves_uncached_stats(self):
+        """Redis 장애 중에도 캐릭터 저장과 스탯 조회가 실패하지 않는지 테스트"""
+        with mock.patch.object(cache, 'incr', side_effect=redis.ConnectionError), \
+                self.assertLogs('apps.characters.stats_cache', level='ERROR'):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.character.stamina = 42
+                self.character.save()
+
+        with mock.patch.object(cache, 'get', side_effect=redis.ConnectionError):
+            response = self.client.get(reverse('character_stats'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['stamina'], 42)
+        self.assertNotIn('ETag', response)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class StatRollupTest(APITestCase):
+    """일일 스탯 요약/시계열 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            username='testuser',
+            nickname='테스트유저',
+            password='testpass123'
+        )
+        self.character = Character.create_for_user(self.user)
+
+    def record(self, stat, old_value, new_value):
+        record_stat_changes(self.character, [StatHistory(
+            character=self.character,
+            stat_type=stat,
+            old_value=old_value,
+            new_value=new_value,
+            change_reason='퀘스트 완료: 테스트'
+        )])
+
+    def test_record_updates_daily_rollup(self):
+        """같은 날의 스탯 변화가 요약 한 행에 누적되는지 테스트"""
+        self.record('cardio', 10, 12)
+        self.record('cardio', 12, 15)
+        self.record('mental', 10, 11)
+
+        rollup = StatDailyRollup.objects.get(character=self.character, stat_type='cardio')
+        self.assertEqual(rollup.last_value, 15)
+        self.assertEqual(rollup.change_count, 2)
+        self.assertEqual(rollup.total_gain, 5)
+        self.assertEqual(StatDailyRollup.objects.filter(character=self.character).count(), 2)
+
+    def test_build_series_by_month(self):
+        """일일 요약이 월 단위로 묶이는지 테스트"""
+        rollups = [
+            StatDailyRollup(date=date(2026, 1, 5), last_value=12, change_count=1, total_gain=2),
+            StatDailyRollup(date=date(2026, 1, 20), last_value=15, change_count=2, total_gain=3),
+            StatDailyRollup(date=date(2026, 2, 1), last_value=16, change_count=1, total_gain=1),
+        ]
+
+        series = build_series(rollups, 'month')
+
+        self.assertEqual(series, [
+            {'date': date(2026, 1, 1), 'value': 15, 'changes': 3, 'gain': 5},
+            {'date': date(2026, 2, 1), 'value': 16, 'changes': 1, 'gain': 1},
+        ])
+
+    def test_series_endpoint(self):
+        """시계열 API 테스트"""
+        self.record('cardio', 10, 12)
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(reverse('stat_history_series'), {'stat': 'cardio', 'bucket': 'week'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['series'][0]['value'], 12)
+        self.assertEqual(response.json()['series'][0]['gain'], 2)
+
+        response = self.client.get(reverse('stat_history_series'), {'stat': 'luck'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_rebuild_command_matches_incremental_rollups(self):
+        """재구축 결과가 증분 갱신 결과와 같은지 테스트"""
+        self.record('cardio', 10, 12)
+        self.record('cardio', 12, 15)
+        expected = list(StatDailyRollup.objects.values_list('stat_type', 'last_value', 'change_count', 'total_gain'))
+
+        StatDailyRollup.objects.all().delete()
+        call_command('rebuild_stat_rollups', stdout=StringIO())
+
+        self.assertEqual(
+            list(StatDailyRollup.objects.values_list('stat_type', 'last_value', 'change_count', 'total_gain')),
+            expected
+        )
+
+    def test_rebuild_command_keeps_rollups_before_since(self):
+        """--since 이전(기록이 아카이브된 기간)의 요약은 재구축에서 지워지지 않는지 테스트"""
+        self.record('cardio', 10, 12)
+        today = timezone.localdate()
+        StatDailyRollup.objects.create(
+            character=self.character, stat_type='mental', date=date(2020, 1, 1),
+            last_value=11, change_count=1, total_gain=1
+        )
+
+        call_command('rebuild_stat_rollups', since=today.replace(day=1).isoformat(), stdout=StringIO())
+
+        self.assertTrue(StatDailyRollup.objects.filter(date=date(2020, 1, 1)).exists())
+        self.assertEqual(StatDailyRollup.objects.get(date=today).last_value, 12)
+
+
+class StatHistoryPartitionTest(TestCase):
+    """스탯 기록 파티션 헬퍼 테스트"""
+
+    def test_add_months_crosses_year(self):
+        """월 계산이 연도 경계를 넘는지 테스트"""
+        self.assertEqual(add_months(date(2026, 11, 1), 3), date(2027, 2, 1))
+        self.assertEqual(add_months(date(2026, 1, 1), -12), date(2025, 1, 1))
+
+    def test_partition_name(self):
+        """파티션 이름 형식 테스트"""
+        self.assertEqual(partition_name(date(2026, 3, 1)), 'stat_history_202603')
+
+    def test_command_requires_postgresql(self):
+        """PostgreSQL이 아니면 명령이 실패하는지 테스트"""
+        if connection.vendor == 'postgresql':
+            self.skipTest('PostgreSQL에서는 파티션 명령이 동작함')
+        with self.assertRaises(CommandError):
+            call_command('manage_stat_history_partitions', stdout=StringIO())
+
+
+class LeaderboardTest(TestCase):
+    """리더보드 점수 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            username='testuser',
+            nickname='테스트유저',
+            password='testpass123'
+        )
+        self.character = Character.create_for_user(self.user)
+
+    def test_scores_for_every_board(self):
+        """보드별 점수 계산 테스트"""
+        self.character.cardio = 25
+        scores = leaderboard_scores(self.character)
+
+        self.assertEqual(scores['cardio'], 25)
+        self.assertEqual(scores['total_stats'], self.character.total_stats)
+        self.assertEqual(len(scores), 10)
+
+    def test_level_score_orders_by_experience_within_level(self):
+        """같은 레벨에서는 경험치가 많을수록 점수가 높은지 테스트"""
+        low = leaderboard_scores(Character(level=5, experience_points=10))
+        high = leaderboard_scores(Character(level=5, experience_points=90))
+        next_level = leaderboard_scores(Character(level=6, experience_points=0))
+
+        self.assertLess(low['level'], high['level'])
+        self.assertLess(high['level'], next_level['level'])
+
+    @override_settings(REDIS_URL='redis://127.0.0.1:1/0')
+    def test_sync_ignores_redis_errors(self):
+        """Redis를 사용할 수 없어도 예외가 전파되지 않는지 테스트"""
+        # 닫힌 포트로 접속하는 새 클라이언트 사용
+        leaderboards._client = None
+        self.addCleanup(setattr, leaderboards, '_client', None)
+
+        with self.assertLogs('apps.characters.leaderboards', level='ERROR'):
+            sync_leaderboards([self.character])
+
+
+class FakeSortedSetRedis:
+    """리더보드 테스트용 메모리 sorted set (리더보드가 쓰는 명령만 지원)"""
+
+    def __init__(self):
+        self.sets = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.sets.pop(key, None)
+
+    def rename(self, source, destination):
+        self.sets[destination] = self.sets.pop(source)
+
+    def zadd(self, key, mapping):
+        self.sets.setdefault(key, {}).update({str(member): float(score) for member, score in mapping.items()})
+
+    def zrem(self, key, member):
+        self.sets.get(key, {}).pop(str(member), None)
+
+    def zscore(self, key, member):
+        return self.sets.get(key, {}).get(str(member))
+
+    def zcard(self, key):
+        return len(self.sets.get(key, {}))
+
+    def zrevrange(self, key, start, end, withscores=False):
+        ordered = sorted(self.sets.get(key, {}).items(), key=lambda item: (item[1], item[0]), reverse=True)
+        return [(member.encode(), score) for member, score in ordered[start:end + 1]]
+
+    def zrevrank(self, key, member):
+        members = [entry.decode() for entry, _ in self.zrevrange(key, 0, self.zcard(key))]
+        return members.index(str(member)) if str(member) in members else None
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+        return lambda *args, **kwargs: self.commands.append((method, args, kwargs))
+
+    def execute(self):
+        commands, self.commands = self.commands, []
+        return [method(*args, **kwargs) for method, args, kwargs in commands]
+
+
+class LeaderboardAPITest(APITestCase):
+    """리더보드 조회 API/재구축 테스트"""
+
+    def setUp(self):
+        self.redis = FakeSortedSetRedis()
+        leaderboards._client = self.redis
+        self.addCleanup(setattr, leaderboards, '_client', None)
+
+        self.characters = []
+        for index in range(3):
+            user = User.objects.create_user(
+                email=f'user{index}@example.com',
+                username=f'user{index}',
+                nickname=f'유저{index}',
+                password='testpass123'
+            )
+            character = Character.create_for_user(user)
+            character.cardio = 10 + index * 5
+            character.save()
+            self.characters.append(character)
+        sync_leaderboards(self.characters)
+        self.client.force_authenticate(user=self.characters[0].user)
+
+    def test_leaderboard_paging(self):
+        """offset/limit 구간의 순위와 전체 인원 테스트"""
+        response = self.client.get(
+            reverse('leaderboard', args=['cardio']), {'offset': 1, 'limit': 1}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['total'], 3)
+        self.assertEqual(response.json()['results'], [{
+            'rank': 2,
+            'user_id': self.characters[1].user_id,
+            'nickname': '유저1',
+            'character_name': self.characters[1].name,
+            'level': self.characters[1].level,
+            'score': 15,
+        }])
+
+    def test_unknown_board_returns_404(self):
+        """없는 보드 조회 시 404 테스트"""
+        response = self.client.get(reverse('leaderboard', args=['luck']))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(reverse('my_leaderboard_rank', args=['luck']))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_my_rank(self):
+        """내 순위 조회와 보드에 없는 사용자의 순위 테스트"""
+        response = self.client.get(reverse('my_leaderboard_rank', args=['cardio']))
+        self.assertEqual(response.json(), {'board': 'cardio', 'rank': 3, 'score': 10})
+
+        newcomer = User.objects.create_user(
+            email='new@example.com',
+            username='newcomer',
+            nickname='신규유저',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=newcomer)
+        response = self.client.get(reverse('my_leaderboard_rank', args=['cardio']))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {'board': 'cardio', 'rank': None, 'score': None})
+
+    def test_rebuild_replays_changes_made_during_rebuild(self):
+        """재구축 중 바뀐 점수가 보드 교체 후에도 남는지 테스트"""
+        from apps.characters.management.commands import rebuild_leaderboards
+        add_to_leaderboards = rebuild_leaderboards.add_to_leaderboards
+        changed = self.characters[0]
+
+        def add_then_change(pipeline, characters, **kwargs):
+            add_to_leaderboards(pipeline, characters, **kwargs)
+            # 첫 청크를 읽은 직후 보상 지급으로 점수가 바뀐 상황
+            if 'key' in kwargs:
+                Character.objects.filter(pk=changed.pk).update(cardio=99, updated_at=timezone.now())
+
+        with mock.patch.object(rebuild_leaderboards, 'add_to_leaderboards', side_effect=add_then_change):
+            call_command('rebuild_leaderboards', chunk_size=10, stdout=StringIO())
+
+        self.assertEqual(self.redis.zscore('leaderboard:cardio', changed.user_id), 99)
+        self.assertEqual(self.redis.zrevrank('leaderboard:cardio', changed.user_id), 0)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class StatPercentileTest(APITestCase):
+    """스탯 백분위 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        stat_histograms.clear()
+        self.characters = []
+        for index, cardio in enumerate([10, 20, 20, 30, 40]):
+            user = User.objects.create_user(
+                email=f'user{index}@example.com',
+                username=f'user{index}',
+                nickname=f'유저{index}',
+                password='testpass123'
+            )
+            self.characters.append(Character.objects.create(user=user, name='캐릭터', cardio=cardio))
+
+    def test_percentiles_from_histogram(self):
+        """히스토그램으로 상위 비율을 계산하는지 테스트"""
+        histograms = build_stat_histograms(chunk_size=2)
+
+        self.assertEqual(histograms['total'], 5)
+        self.assertEqual(stat_percentiles(self.characters[4], histograms)['cardio']['top_percent'], 20.0)
+        self.assertEqual(stat_percentiles(self.characters[1], histograms)['cardio']['top_percent'], 60.0)
+        self.assertEqual(stat_percentiles(self.characters[0], histograms)['cardio']['top_percent'], 100.0)
+
+        # 집계 이후 최고값을 넘어선 경우
+        self.characters[0].cardio = 99
+        self.assertEqual(stat_percentiles(self.characters[0], histograms)['cardio']['top_percent'], 20.0)
+
+    def test_percentile_endpoint(self):
+        """백분위 API 테스트"""
+        self.client.force_authenticate(user=self.characters[3].user)
+        response = self.client.get(reverse('stat_percentiles'))
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        build_stat_histograms()
+        response = self.client.get(reverse('stat_percentiles'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['stats']['cardio'], {'value': 30, 'top_percent': 40.0})
+
+    def test_histograms_kept_in_process(self):
+        """분포를 프로세스 메모리에 두고 Redis 장애 중에도 계속 쓰는지 테스트"""
+        build_stat_histograms()
+        self.assertEqual(get_stat_histograms()['total'], 5)
+
+        with mock.patch.object(cache, 'get', side_effect=redis.ConnectionError) as cache_get:
+            # 확인 간격 안에서는 캐시를 읽지 않음
+            self.assertEqual(get_stat_histograms()['total'], 5)
+            self.assertFalse(cache_get.called)
+
+            with mock.patch.object(percentiles, 'VERSION_CHECK_INTERVAL', 0), \
+                    self.assertLogs('apps.characters.percentiles', level='WARNING'):
+                self.assertEqual(get_stat_histograms()['total'], 5)
+
+    def test_endpoint_without_redis(self):
+        """분포를 한 번도 읽지 못했고 Redis도 쓸 수 없으면 503을 반환하는지 테스트"""
+        self.client.force_authenticate(user=self.characters[0].user)
+
+        with mock.patch.object(cache, 'get', side_effect=redis.ConnectionError):
+            response = self.client.get(reverse('stat_percentiles'))
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class StatAllocationTest(APITestCase):
+    """스탯 포인트 배분 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            username='testuser',
+            nickname='테스트유저',
+            password='testpass123'
+        )
+        self.character = Character.objects.create(user=self.user, name='캐릭터', unspent_stat_points=5)
+        self.client.force_authenticate(user=self.user)
+
+    def test_allocate_stat_points(self):
+        """배분한 만큼 스탯이 오르고 포인트가 차감되는지 테스트"""
+        response = self.client.post(
+            reverse('allocate_stat_points'), {'cardio': 3, 'mental': 2}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['cardio'], 13)
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.unspent_stat_points, 0)
+        self.assertEqual(self.character.mental, 12)
+        self.assertEqual(
+            StatHistory.objects.get(character=self.character, stat_type='cardio').old_value, 10
+        )
+
+    def test_allocation_grants_stat_achievement(self):
+        """배분으로 스탯 업적 임계값을 넘으면 업적과 보상이 지급되는지 테스트"""
+        achievement = Achievement.objects.create(
+            name='강심장', description='스탯 13 달성', category='stats',
+            requirement_type='stat_level', requirement_value=13, reward_gold=50
+        )
+
+        self.client.post(reverse('allocate_stat_points'), {'cardio': 3}, format='json')
+
+        self.assertTrue(UserAchievement.objects.filter(user=self.user, achievement=achievement).exists())
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.gold, 150)
+        self.assertEqual(currency_balances(self.user)['gold'], 150)
+
+    def test_over_allocation_is_rejected(self):
+        """적립된 포인트보다 많이 배분하면 아무것도 바뀌지 않는지 테스트"""
+        response = self.client.post(reverse('allocate_stat_points'), {'cardio': 6}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.unspent_stat_points, 5)
+        self.assertEqual(self.character.cardio, 10)
+
+    def test_invalid_allocation(self):
+        """음수/빈 배분 요청 검증 테스트"""
+        for payload in ({'cardio': -1}, {}):
+            response = self.client.post(reverse('allocate_stat_points'), payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_character_update_cannot_change_stats(self):
+        """캐릭터 수정 API로 스탯을 보내면 무시하지 않고 거절하는지 테스트"""
+        response = self.client.patch(reverse('character_detail'), {'name': '새 이름', 'cardio': 99}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('cardio', response.json())
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.cardio, 10)
+        self.assertEqual(self.character.name, '캐릭터')
+
+        response = self.client.patch(reverse('character_detail'), {'name': '새 이름'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.name, '새 이름')
+
+
+class CurrencyLedgerTest(TestCase):
+    """골드/젬 원장 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            username='testuser',
+            nickname='테스트유저',
+            password='testpass123'
+        )
+        self.character = Character.create_for_user(self.user)
+
+    def test_opening_balance_recorded_on_create(self):
+        """캐릭터 생성 시 초기 골드가 기초 잔액으로 기록되는지 테스트"""
+        self.assertEqual(currency_balances(self.user), {'gold': 100, 'gems': 0})
+
+    def test_snapshot_plus_deltas(self):
+        """스냅샷 이후 증감만 더해 잔액을 계산하는지 테스트"""
+        record_transactions(currency_entries(self.user.pk, 'quest', gold=30, gems=2))
+        later = timezone.now() + timedelta(hours=1)
+
+        self.assertEqual(take_currency_snapshots(now=later), 2)
+        self.assertEqual(CurrencySnapshot.objects.get(user=self.user, currency='gold').balance, 130)
+
+        record_transactions(currency_entries(self.user.pk, 'purchase', gold=-50))
+        with self.assertNumQueries(2):
+            self.assertEqual(currency_balances(self.user), {'gold': 80, 'gems': 2})
+
+        # 새 기록이 있는 화폐만 스냅샷 갱신, 이후에는 다시 쓰지 않음
+        self.assertEqual(take_currency_snapshots(now=later), 1)
+        self.assertEqual(take_currency_snapshots(now=later), 0)
+        self.assertEqual(currency_balances(self.user), {'gold': 80, 'gems': 2})
+
+    def test_snapshot_reads_only_new_entries_for_gold_only_user(self):
+        """젬 기록이 없는 사용자도 다음 스냅샷부터는 마지막 스냅샷 이후 원장만 읽는지 테스트"""
+        later = timezone.now() + timedelta(hours=1)
+        self.assertEqual(take_currency_snapshots(now=later), 2)
+
+        gold = CurrencySnapshot.objects.get(user=self.user, currency='gold')
+        gems = CurrencySnapshot.objects.get(user=self.user, currency='gems')
+        self.assertEqual((gems.balance, gems.last_transaction_id), (0, gold.last_transaction_id))
+
+        record_transactions(currency_entries(self.user.pk, 'quest', gold=30))
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(take_currency_snapshots(now=later), 1)
+
+        ledger_reads = [
+            query['sql'] for query in queries
+            if query['sql'].startswith('SELECT') and 'FROM "currency_transactions"' in query['sql']
+        ]
+        self.assertIn(f'> {gold.last_transaction_id}', ledger_reads[-1])
+        self.assertEqual(currency_balances(self.user), {'gold': 130, 'gems': 0})
+
+    def test_reconcile_reports_and_fixes_mismatch(self):
+        """원장과 잔액이 다르면 보고하고 --fix로 보정하는지 테스트"""
+        Character.objects.filter(pk=self.character.pk).update(gold=150)
+
+        out = StringIO()
+        call_command('reconcile_currency', stdout=out)
+        self.assertIn('gold +50', out.getvalue())
+
+        call_command('reconcile_currency', fix=True, stdout=StringIO())
+        self.assertEqual(currency_balances(self.user)['gold'], 150)
+
+
+class NutritionStatsTest(APITestCase):
+    """영양 통계 집계 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            username='testuser',
+            nickname='테스트유저',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def create_logs(self):
+        today = timezone.now().date()
+        NutritionLog.objects.create(
+            user=self.user, date=today, meal_type='breakfast', meal_quality='excellent',
+            included_vegetables=True, included_protein=True, included_grains=True, proper_portion=True
+        )
+        NutritionLog.objects.create(
+            user=self.user, date=today, meal_type='lunch', meal_quality='fair', included_protein=True
+        )
+        NutritionLog.objects.create(
+            user=self.user, date=today - timedelta(days=10), meal_type='dinner', meal_quality='poor'
+        )
+        NutritionLog.objects.create(
+            user=self.user, date=today - timedelta(days=60), meal_type='snack', meal_quality='good',
+            included_vegetables=True
+        )
+
+    def test_score_expression_matches_stored_score(self):
+        """SQL 점수 식이 저장된 점수와 같은 값을 내는지 테스트"""
+        self.create_logs()
+        for log in NutritionLog.objects.annotate(score=nutrition_score_expression()):
+            self.assertEqual(log.score, log.nutrition_score)
+            self.assertEqual(log.score, log.calculate_nutrition_score())
+
+    def test_score_updated_on_partial_save(self):
+        """update_fields로 저장해도 점수가 갱신되는지 테스트"""
+        self.create_logs()
+        log = NutritionLog.objects.get(meal_type='dinner')
+        log.meal_quality = 'excellent'
+        log.save(update_fields=['meal_quality'])
+
+        self.assertEqual(NutritionLog.objects.get(pk=log.pk).nutrition_score, 40)
+
+    def test_min_score_filter(self):
+        """최소 점수 필터 테스트"""
+        self.create_logs()
+        response = self.client.get(reverse('nutrition-logs-list'), {'min_score': 35})
+
+        scores = sorted(log['nutrition_score'] for log in response.data['results'])
+        self.assertEqual(scores, [35, 45, 100])
+
+    def test_stats_in_single_query(self):
+        """영양 통계를 쿼리 한 번으로 계산하는지 테스트"""
+        self.create_logs()
+        url = reverse('nutrition-logs-stats')
+
+        self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['daily_average_score'], 67.5)
+        self.assertEqual(response.data['weekly_average_score'], 67.5)
+        self.assertEqual(response.data['monthly_average_score'], 48.33)
+        self.assertEqual(response.data['total_logs'], 4)
+        self.assertEqual(response.data['excellent_meals'], 1)
+        self.assertEqual(response.data['good_meals'], 1)
+        self.assertEqual(response.data['vegetables_percentage'], 50.0)
+        self.assertEqual(response.data['protein_percentage'], 50.0)
+        self.assertEqual(response.data['grains_percentage'], 25.0)
+
+    def test_stats_without_logs(self):
+        """기록이 없으면 0으로 응답하는지 테스트"""
+        response = self.client.get(reverse('nutrition-logs-stats'))
+        self.assertEqual(response.data['daily_average_score'], 0)
+        self.assertEqual(response.data['proper_portion_percentage'], 0)
+
+    def assert_rollups_match_logs(self):
+        expected = {
+            (rollup.user_id, rollup.date): {field: getattr(rollup, field) for field in ROLLUP_COUNT_FIELDS}
+            for rollup in daily_rollups(NutritionLog.objects.all())
+        }
+        actual = {
+            (rollup.user_id, rollup.date): {field: getattr(rollup, field) for field in ROLLUP_COUNT_FIELDS}
+            for rollup in NutritionDailyRollup.objects.all()
+        }
+        self.assertEqual(actual, expected)
+
+    def test_rollups_follow_create_update_delete(self):
+        """영양 기록 생성/수정/삭제가 일일 요약에 증분 반영되는지 테스트"""
+        self.create_logs()
+        self.assert_rollups_match_logs()
+
+        log = NutritionLog.objects.get(meal_type='lunch')
+        log.meal_quality = 'good'
+        log.included_grains = True
+        log.save()
+        self.assert_rollups_match_logs()
+
+        # 날짜를 옮기면 이전 날짜에서 빼고 새 날짜에 더함
+        log.date = log.date - timedelta(days=1)
+        log.save()
+        self.assert_rollups_match_logs()
+
+        NutritionLog.objects.get(meal_type='dinner').delete()
+        self.assert_rollups_match_logs()
+        self.assertEqual(NutritionDailyRollup.objects.filter(user=self.user).count(), 3)
+
+    def test_save_without_loaded_state_rebuilds_day(self):
+        """일부 필드만 읽은 기록을 저장해도 요약이 맞는지 테스트"""
+        self.create_logs()
+        log = NutritionLog.objects.only('id', 'user_id', 'date').get(meal_type='breakfast')
+        log.meal_quality = 'poor'
+        log.save()
+        self.assert_rollups_match_logs()
+
+    def test_rebuild_command(self):
+        """일일 영양 요약 재구축 명령 테스트"""
+        self.create_logs()
+        NutritionDailyRollup.objects.all().delete()
+
+        out = StringIO()
+        call_command('rebuild_nutrition_rollups', stdout=out)
+
+        self.assertIn('일일 영양 요약 3개', out.getvalue())
+        self.assert_rollups_match_logs()
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_heatmap_encoding_and_etag(self):
+        """연간 히트맵 인코딩과 ETag 재검증 테스트"""
+        self.create_logs()
+        today = timezone.now().date()
+        url = reverse('nutrition-logs-heatmap')
+
+        response = self.client.get(url, {'year': today.year})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        levels = base64.b64decode(response.data['data'])
+        self.assertEqual(len(levels), response.data['days'])
+        # 오늘: 평균 (100 + 35) / 2 = 67점 -> 3단계
+        self.assertEqual(levels[today.timetuple().tm_yday - 1], 3)
+
+        etag = response['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {'year': today.year}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # 다른 해의 기록은 ETag를 바꾸지 않고, 그해 기록은 바꿈
+        NutritionLog.objects.create(user=self.user, date=date(today.year - 2, 5, 1), meal_type='lunch')
+        self.assertEqual(self.client.get(url, {'year': today.year})['ETag'], etag)
+        NutritionLog.objects.filter(date=today, meal_type='lunch').delete()
+        self.assertNotEqual(self.client.get(url, {'year': today.year})['ETag'], etag)
+
+    def test_import_csv_upserts_and_reports_errors(self):
+        """CSV 가져오기가 같은 식사를 덮어쓰고 행 오류를 보고하는지 테스트"""
+        self.create_logs()
+        today = timezone.now().date()
+        content = (
+            'date,meal_type,meal_quality,included_vegetables,notes\n'
+            f'{today},breakfast,poor,false,덮어쓰기\n'
+            f'{today - timedelta(days=1)},dinner,good,true,\n'
+            f'{today - timedelta(days=1)},brunch,good,true,\n'
+            'not-a-date,lunch,good,,\n'
+        )
+        upload = SimpleUploadedFile('meals.csv', content.encode('utf-8-sig'), content_type='text/csv')
+
+        response = self.client.post(reverse('nutrition-logs-import-logs'), {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['rows'], 4)
+        self.assertEqual(response.data['imported'], 2)
+        self.assertEqual([error['row'] for error in response.data['errors']], [3, 4])
+
+        breakfast = NutritionLog.objects.get(user=self.user, date=today, meal_type='breakfast')
+        self.assertEqual(breakfast.notes, '덮어쓰기')
+        self.assertEqual(breakfast.nutrition_score, 10)
+        self.assertEqual(NutritionLog.objects.filter(user=self.user).count(), 5)
+        self.assert_rollups_match_logs()
+
+    def test_import_csv_reports_malformed_rows(self):
+        """CSV 해석 오류는 해당 행 오류로, 헤더 해석 오류는 400으로 응답하는지 테스트"""
+        # 필드 길이 제한을 줄여 csv.Error가 나는 행을 만듦
+        self.addCleanup(csv.field_size_limit, csv.field_size_limit(20))
+        today = timezone.now().date()
+        content = (
+            'date,meal_type,notes\n'
+            f'{today},breakfast,{"가" * 30}\n'
+            f'{today},lunch,짧은 메모\n'
+        )
+        upload = SimpleUploadedFile('meals.csv', content.encode('utf-8'), content_type='text/csv')
+
+        response = self.client.post(reverse('nutrition-logs-import-logs'), {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['rows'], response.data['imported']), (2, 1))
+        self.assertEqual(response.data['errors'][0]['row'], 1)
+
+        upload = SimpleUploadedFile('meals.csv', f'date,{"x" * 30}\n'.encode('utf-8'), content_type='text/csv')
+        response = self.client.post(reverse('nutrition-logs-import-logs'), {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_ndjson_command(self):
+        """NDJSON 가져오기 명령 테스트 (청크 경계 포함)"""
+        lines = [
+            json.dumps({'date': str(date(2024, 1, 1) + timedelta(days=day)), 'meal_type': 'lunch', 'meal_quality': 'good'})
+            for day in range(5)
+        ]
+        lines.insert(2, '{broken')
+        with tempfile.NamedTemporaryFile('w', suffix='.ndjson', delete=False) as handle:
+            handle.write('\n'.join(lines) + '\n')
+
+        out = StringIO()
+        call_command('import_nutrition_logs', handle.name, user=self.user.email, chunk_size=2, stdout=out)
+        os.unlink(handle.name)
+
+        self.assertIn('6행 중 5건 저장, 실패 1건', out.getvalue())
+        self.assertEqual(NutritionDailyRollup.objects.filter(user=self.user).count(), 5)
+        self.assert_rollups_match_logs()
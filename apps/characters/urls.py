@@ -12,7 +12,13 @@ router.register(r'supplement-logs', views.SupplementLogViewSet, basename='supple
 urlpatterns = [
     path('', views.CharacterDetailView.as_view(), name='character_detail'),
     path('stats/', views.character_stats_view, name='character_stats'),
+    path('stats/percentiles/', views.stat_percentiles_view, name='stat_percentiles'),
+    path('stats/allocate/', views.allocate_stat_points_view, name='allocate_stat_points'),
     path('stats-history/', views.StatHistoryListView.as_view(), name='stat_history'),
+    path('stats-history/series/', views.stat_history_series_view, name='stat_history_series'),
+    path('leaderboards/<str:board>/', views.leaderboard_view, name='leaderboard'),
+    path('leaderboards/<str:board>/me/', views.my_leaderboard_rank_view, name='my_leaderboard_rank'),
+    path('wallet/', views.wallet_view, name='wallet'),
     path('achievements/', views.UserAchievementListView.as_view(), name='user_achievements'),
     
     # 영양 관련 API
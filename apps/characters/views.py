@@ -1,17 +1,33 @@
 from rest_framework import generics, permissions, status, viewsets
 from rest_framework.decorators import api_view, permission_classes, action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
-from django.db.models import Count, Avg, Q
+from django.db.models import Q
 from django.utils import timezone
+from django.utils.http import parse_etags
 from datetime import timedelta
+import csv
+import io
+import redis
+from .ledger import currency_balances
+from .nutrition import nutrition_stats
+from .nutrition_heatmap import get_nutrition_heatmap, nutrition_heatmap_etag
+from .nutrition_import import guess_format, import_nutrition_logs
+from .percentiles import get_stat_histograms, stat_percentiles
+from .leaderboards import LEADERBOARDS, leaderboard_page, leaderboard_rank
+from .rollups import build_series
 from .models import (
-    Character, StatHistory, UserAchievement,
-    NutritionLog, Supplement, UserSupplement, SupplementLog
+    Character, CurrencyTransaction, StatDailyRollup, StatHistory, UserAchievement,
+    NutritionLog, NutritionDailyRollup, Supplement, UserSupplement, SupplementLog
 )
+from .services import InsufficientStatPoints, allocate_stat_points
+from .stats_cache import build_character_stats, get_character_stats, get_stats_version, stats_etag
 from .serializers import (
     CharacterSerializer, StatHistorySerializer, UserAchievementSerializer,
     NutritionLogSerializer, SupplementSerializer, UserSupplementSerializer,
-    SupplementLogSerializer, NutritionStatsSerializer
+    SupplementLogSerializer, NutritionStatsSerializer, StatSeriesQuerySerializer,
+    LeaderboardQuerySerializer, StatAllocationSerializer, CurrencyTransactionSerializer,
+    NutritionHeatmapQuerySerializer, NutritionImportSerializer
 )
 
 
@@ -21,40 +37,62 @@ class CharacterDetailView(generics.RetrieveUpdateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_object(self):
-        character, created = Character.objects.get_or_create(
-            user=self.request.user,
-            defaults={
-                'name': f"{self.request.user.nickname}의 캐릭터"
-            }
-        )
-        return character
+        return self.request.character
 
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def character_stats_view(request):
-    """캐릭터 스탯 조회"""
-    character = Character.objects.get_or_create(
-        user=request.user,
-        defaults={'name': f"{request.user.nickname}의 캐릭터"}
-    )[0]
-    
-    stats = {
-        'stamina': character.stamina,
-        'strength': character.strength,
-        'mental': character.mental,
-        'endurance': character.endurance,
-        'cardio': character.cardio,
-        'flexibility': character.flexibility,
-        'nutrition': character.nutrition,
-        'recovery': character.recovery,
-        'total_stats': character.total_stats,
-        'health_score': character.health_score,
-        'level': character.level,
-        'experience_points': character.experience_points,
-    }
-    
-    return Response(stats)
+    """캐릭터 스탯 조회 (캐시 + ETag 재검증)"""
+    user_id = request.user.pk
+    version = get_stats_version(user_id)
+    if version is None:
+        # Redis 장애 중에는 재검증할 버전이 없으므로 캐시와 ETag 없이 응답
+        return Response(build_character_stats(request.character))
+    etag = stats_etag(user_id, version)
+
+    # 클라이언트가 가진 버전이 최신이면 캐릭터를 읽지 않고 304 응답
+    if etag in parse_etags(request.headers.get('If-None-Match', '')):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+    stats = get_character_stats(user_id, version, lambda: request.character)
+    return Response(stats, headers={'ETag': etag})
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def allocate_stat_points_view(request):
+    """스탯 포인트 배분"""
+    serializer = StatAllocationSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    try:
+        character = allocate_stat_points(request.user, serializer.validated_data)
+    except InsufficientStatPoints:
+        return Response(
+            {'error': '배분 가능한 스탯 포인트가 부족합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return Response(build_character_stats(character))
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def stat_percentiles_view(request):
+    """스탯별 상위 비율 조회 (주기적으로 갱신되는 히스토그램 기반)"""
+    histograms = get_stat_histograms()
+    if histograms is None:
+        return Response(
+            {'error': '스탯 분포를 집계하는 중입니다. 잠시 후 다시 시도해주세요.'},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+    return Response({
+        'total_characters': histograms['total'],
+        'updated_at': histograms['built_at'],
+        'stats': stat_percentiles(request.character, histograms),
+    })
 
 
 class StatHistoryListView(generics.ListAPIView):
@@ -63,11 +101,104 @@ class StatHistoryListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        character = Character.objects.get_or_create(
-            user=self.request.user,
-            defaults={'name': f"{self.request.user.nickname}의 캐릭터"}
-        )[0]
-        return StatHistory.objects.filter(character=character)
+        return StatHistory.objects.filter(character=self.request.character)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def stat_history_series_view(request):
+    """스탯 변화 시계열 조회 (일일 요약 기반, 일/주/월 단위)"""
+    params = StatSeriesQuerySerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    stat = params.validated_data['stat']
+    bucket = params.validated_data['bucket']
+    since = timezone.localdate() - timedelta(days=params.validated_data['days'] - 1)
+
+    rollups = StatDailyRollup.objects.filter(
+        character__user=request.user,
+        stat_type=stat,
+        date__gte=since
+    ).only('date', 'last_value', 'change_count', 'total_gain').order_by('date')
+
+    return Response({
+        'stat': stat,
+        'bucket': bucket,
+        'series': build_series(rollups, bucket),
+    })
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def leaderboard_view(request, board):
+    """리더보드 상위 순위 조회"""
+    if board not in LEADERBOARDS:
+        return Response({'error': '존재하지 않는 리더보드입니다.'}, status=status.HTTP_404_NOT_FOUND)
+    params = LeaderboardQuerySerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+
+    try:
+        entries, total = leaderboard_page(board, **params.validated_data)
+    except redis.RedisError:
+        return Response(
+            {'error': '리더보드를 일시적으로 사용할 수 없습니다.'},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+    # 순위 구간의 캐릭터 정보는 한 번에 조회
+    characters = {
+        row['user_id']: row
+        for row in Character.objects.filter(
+            user_id__in=[user_id for _, user_id, _ in entries]
+        ).values('user_id', 'name', 'level', 'user__nickname')
+    }
+    results = []
+    for rank, user_id, score in entries:
+        character = characters.get(user_id)
+        if character is None:
+            continue
+        results.append({
+            'rank': rank,
+            'user_id': user_id,
+            'nickname': character['user__nickname'],
+            'character_name': character['name'],
+            'level': character['level'],
+            'score': int(score),
+        })
+
+    return Response({'board': board, 'total': total, 'results': results})
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def my_leaderboard_rank_view(request, board):
+    """내 리더보드 순위 조회"""
+    if board not in LEADERBOARDS:
+        return Response({'error': '존재하지 않는 리더보드입니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+    try:
+        rank, score = leaderboard_rank(board, request.user.pk)
+    except redis.RedisError:
+        return Response(
+            {'error': '리더보드를 일시적으로 사용할 수 없습니다.'},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+    return Response({
+        'board': board,
+        'rank': rank,
+        'score': int(score) if score is not None else None,
+    })
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def wallet_view(request):
+    """원장 기준 골드/젬 잔액과 최근 거래 기록"""
+    recent = CurrencyTransaction.objects.filter(user=request.user).order_by('-id')[:20]
+    return Response({
+        'balances': currency_balances(request.user),
+        'recent_transactions': CurrencyTransactionSerializer(recent, many=True).data,
+    })
 
 
 class UserAchievementListView(generics.ListAPIView):
@@ -97,6 +228,11 @@ class NutritionLogViewSet(viewsets.ModelViewSet):
         if meal_type:
             queryset = queryset.filter(meal_type=meal_type)
         
+        # 최소 영양 점수 필터링
+        min_score = self.request.query_params.get('min_score')
+        if min_score and min_score.isdigit():
+            queryset = queryset.filter(nutrition_score__gte=int(min_score))
+        
         return queryset.order_by('-date', '-created_at')
 
     def perform_create(self, serializer):
@@ -105,61 +241,52 @@ class NutritionLogViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """영양 통계 조회"""
-        user = request.user
-        now = timezone.now()
-        
-        # 기간별 통계
-        daily_logs = NutritionLog.objects.filter(
-            user=user,
-            date=now.date()
-        )
-        
-        weekly_logs = NutritionLog.objects.filter(
-            user=user,
-            date__gte=now.date() - timedelta(days=7)
+        # 원본 기록 대신 일일 요약을 집계 쿼리 한 번으로 읽어 계산
+        stats_data = nutrition_stats(
+            NutritionDailyRollup.objects.filter(user=request.user), timezone.now().date()
         )
         
-        monthly_logs = NutritionLog.objects.filter(
-            user=user,
-            date__gte=now.date() - timedelta(days=30)
-        )
-        
-        all_logs = NutritionLog.objects.filter(user=user)
-        
-        # 평균 점수 계산
-        daily_avg = sum(log.nutrition_score for log in daily_logs) / len(daily_logs) if daily_logs else 0
-        weekly_avg = sum(log.nutrition_score for log in weekly_logs) / len(weekly_logs) if weekly_logs else 0
-        monthly_avg = sum(log.nutrition_score for log in monthly_logs) / len(monthly_logs) if monthly_logs else 0
-        
-        # 품질별 통계
-        quality_stats = all_logs.values('meal_quality').annotate(count=Count('id'))
-        quality_counts = {item['meal_quality']: item['count'] for item in quality_stats}
-        
-        # 체크리스트 통계
-        total_logs = all_logs.count()
-        vegetables_count = all_logs.filter(included_vegetables=True).count()
-        protein_count = all_logs.filter(included_protein=True).count()
-        grains_count = all_logs.filter(included_grains=True).count()
-        proper_portion_count = all_logs.filter(proper_portion=True).count()
-        
-        stats_data = {
-            'daily_average_score': round(daily_avg, 2),
-            'weekly_average_score': round(weekly_avg, 2),
-            'monthly_average_score': round(monthly_avg, 2),
-            'total_logs': total_logs,
-            'excellent_meals': quality_counts.get('excellent', 0),
-            'good_meals': quality_counts.get('good', 0),
-            'fair_meals': quality_counts.get('fair', 0),
-            'poor_meals': quality_counts.get('poor', 0),
-            'vegetables_percentage': round((vegetables_count / total_logs * 100) if total_logs else 0, 2),
-            'protein_percentage': round((protein_count / total_logs * 100) if total_logs else 0, 2),
-            'grains_percentage': round((grains_count / total_logs * 100) if total_logs else 0, 2),
-            'proper_portion_percentage': round((proper_portion_count / total_logs * 100) if total_logs else 0, 2),
-        }
-        
         serializer = NutritionStatsSerializer(stats_data)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'])
+    def heatmap(self, request):
+        """연간 영양 히트맵 조회 (하루 1바이트 강도, base64)"""
+        params = NutritionHeatmapQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        year = params.validated_data.get('year') or timezone.localdate().year
+
+        user_id = request.user.pk
+        etag = nutrition_heatmap_etag(user_id, year)
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+        return Response(get_nutrition_heatmap(user_id, year, etag), headers={'ETag': etag})
+
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser])
+    def import_logs(self, request):
+        """CSV/NDJSON 파일로 영양 기록 일괄 가져오기 (같은 날짜/식사는 덮어씀)"""
+        serializer = NutritionImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data['file']
+        file_format = serializer.validated_data.get('format') or guess_format(upload.name)
+
+        # 업로드 파일을 줄 단위로 읽으며 처리 (BOM이 있는 CSV도 허용)
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        try:
+            report = import_nutrition_logs(request.user, stream, file_format)
+        except UnicodeDecodeError:
+            return Response(
+                {'error': 'UTF-8 파일만 가져올 수 있습니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except csv.Error as error:
+            return Response(
+                {'error': f'CSV 헤더를 해석할 수 없습니다. ({error})'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(report)
+
 
 class SupplementViewSet(viewsets.ReadOnlyModelViewSet):
     """영양제 마스터 데이터 조회"""
@@ -0,0 +1,140 @@
+"""업로드 이미지 파생본 (WebP 썸네일)
+
+사용자가 올린 카메라 원본 대신 목록 화면에서 쓸 고정 크기 WebP 파생본을 Celery 작업으로
+만든다. 원본은 EXIF 방향대로 회전한 뒤 EXIF 없이 다시 인코딩하며, 만든 파일 경로는 모델의
+<필드>_derivatives JSON 컬럼에 {'source': 원본 경로, 'sizes': {크기: 경로}} 형태로 기록한다.
+
+각 앱은 AppConfig.ready에서 track_image_derivatives(모델, 필드)로 이미지 필드를 등록하며,
+저장 시 원본이 바뀌었으면 커밋 이후 작업이 예약된다. save()를 거치지 않는 쓰기
+(bulk_update 등) 뒤에는 schedule_image_derivatives를 직접 호출한다.
+"""
+import logging
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models.signals import post_save
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+# 파생본 크기별 긴 변 길이(px)
+DERIVATIVE_SIZES = {
+    'thumb': 160,
+    'medium': 640,
+}
+WEBP_QUALITY = 80
+DERIVATIVES_DIR = 'derivatives'
+
+# 파생본을 만드는 (모델, 이미지 필드) 목록
+TRACKED_IMAGE_FIELDS = []
+
+
+def derivatives_field_name(field_name):
+    return f'{field_name}_derivatives'
+
+
+def derivative_path(source, size):
+    return f'{DERIVATIVES_DIR}/{os.path.splitext(source)[0]}_{size}.webp'
+
+
+def needs_derivatives(instance, field_name):
+    """원본과 기록된 파생본이 다른지 (원본이 지워진 경우 포함)"""
+    image = getattr(instance, field_name)
+    derivatives = getattr(instance, derivatives_field_name(field_name)) or {}
+    return (image.name or '') != derivatives.get('source', '')
+
+
+def schedule_image_derivatives(instances, field_name):
+    """원본이 바뀐 인스턴스들의 파생본 생성을 커밋 이후 예약"""
+    from .tasks import generate_image_derivatives_task
+
+    for instance in instances:
+        if needs_derivatives(instance, field_name):
+            label, pk = instance._meta.label, instance.pk
+            transaction.on_commit(
+                lambda label=label, pk=pk: generate_image_derivatives_task.delay(label, pk, field_name)
+            )
+
+
+def track_image_derivatives(model, field_name):
+    """모델 이미지 필드를 파생본 생성 대상으로 등록"""
+    TRACKED_IMAGE_FIELDS.append((model, field_name))
+
+    def schedule_on_save(sender, instance, update_fields=None, **kwargs):
+        if update_fields is None or field_name in update_fields:
+            schedule_image_derivatives([instance], field_name)
+
+    post_save.connect(
+        schedule_on_save, sender=model, weak=False,
+        dispatch_uid=f'image_derivatives:{model._meta.label}.{field_name}'
+    )
+
+
+def render_derivatives(image_file):
+    """원본 이미지로 크기별 WebP 바이트 생성 {크기: bytes}"""
+    with Image.open(image_file) as original:
+        # EXIF 방향 정보를 픽셀에 반영 (저장 시 EXIF는 넘기지 않으므로 제거됨)
+        image = ImageOps.exif_transpose(original)
+        image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+
+        rendered = {}
+        for size, edge in DERIVATIVE_SIZES.items():
+            derivative = image.copy()
+            derivative.thumbnail((edge, edge), Image.LANCZOS)
+            buffer = BytesIO()
+            derivative.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=4)
+            rendered[size] = buffer.getvalue()
+        return rendered
+
+
+def generate_derivatives(instance, field_name):
+    """인스턴스 이미지의 파생본을 만들고 경로 기록, 기록한 파생본 반환
+
+    작업이 늦게 실행되는 사이 원본이 다시 바뀌었으면 기록하지 않는다 (새 원본 작업이 기록).
+    """
+    model = type(instance)
+    column = derivatives_field_name(field_name)
+    image = getattr(instance, field_name)
+    previous = getattr(instance, column) or {}
+    source = image.name or ''
+
+    derivatives = {}
+    if source:
+        try:
+            with default_storage.open(source) as image_file:
+                rendered = render_derivatives(image_file)
+        except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+            logger.warning('이미지 파생본 생성 실패: %s', source, exc_info=True)
+            rendered = {}
+
+        sizes = {}
+        for size, content in rendered.items():
+            path = derivative_path(source, size)
+            if default_storage.exists(path):
+                default_storage.delete(path)
+            sizes[size] = default_storage.save(path, ContentFile(content))
+        derivatives = {'source': source, 'sizes': sizes}
+
+    recorded = model.objects.filter(pk=instance.pk, **{field_name: source}).update(**{column: derivatives})
+    if not recorded:
+        for path in derivatives.get('sizes', {}).values():
+            default_storage.delete(path)
+        return None
+    setattr(instance, column, derivatives)
+
+    # 이전 원본의 파생본 정리
+    for path in set(previous.get('sizes', {}).values()) - set(derivatives.get('sizes', {}).values()):
+        default_storage.delete(path)
+    return derivatives
+
+
+def derivative_urls(derivatives, request=None):
+    """파생본 크기별 URL {크기: url} (요청이 있으면 절대 URL)"""
+    urls = {}
+    for size, path in (derivatives or {}).get('sizes', {}).items():
+        url = default_storage.url(path)
+        urls[size] = request.build_absolute_uri(url) if request is not None else url
+    return urls
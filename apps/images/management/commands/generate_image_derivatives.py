@@ -0,0 +1,47 @@
+import time
+from django.core.management.base import BaseCommand
+from apps.images.derivatives import (
+    TRACKED_IMAGE_FIELDS, derivatives_field_name, generate_derivatives, needs_derivatives
+)
+from apps.images.tasks import generate_image_derivatives_task
+
+
+class Command(BaseCommand):
+    help = '파생본이 없거나 원본과 다른 업로드 이미지의 WebP 파생본 생성'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help='한 번에 확인할 행 수')
+        parser.add_argument('--sync', action='store_true', help='Celery 작업 대신 직접 생성')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+
+        started = time.monotonic()
+        scheduled = 0
+
+        for model, field_name in TRACKED_IMAGE_FIELDS:
+            last_id = 0
+            while True:
+                instances = list(
+                    model.objects.filter(pk__gt=last_id)
+                    .exclude(**{field_name: ''})
+                    .exclude(**{f'{field_name}__isnull': True})
+                    .order_by('pk')
+                    .only('pk', field_name, derivatives_field_name(field_name))[:chunk_size]
+                )
+                if not instances:
+                    break
+                last_id = instances[-1].pk
+
+                for instance in instances:
+                    if not needs_derivatives(instance, field_name):
+                        continue
+                    if options['sync']:
+                        generate_derivatives(instance, field_name)
+                    else:
+                        generate_image_derivatives_task.delay(instance._meta.label, instance.pk, field_name)
+                    scheduled += 1
+
+        elapsed = time.monotonic() - started
+        action = '생성' if options['sync'] else '예약'
+        self.stdout.write(self.style.SUCCESS(f'이미지 {scheduled}개 파생본 {action} ({elapsed:.2f}초)'))
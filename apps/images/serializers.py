@@ -0,0 +1,13 @@
+from rest_framework import serializers
+from .derivatives import derivative_urls, derivatives_field_name
+
+
+class ImageDerivativesField(serializers.ReadOnlyField):
+    """이미지 파생본 크기별 URL {크기: url} (아직 생성 전이면 빈 dict)"""
+
+    def __init__(self, image_field, **kwargs):
+        kwargs['source'] = derivatives_field_name(image_field)
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return derivative_urls(value, self.context.get('request'))
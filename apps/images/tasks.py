@@ -0,0 +1,13 @@
+from celery import shared_task
+from django.apps import apps
+from .derivatives import generate_derivatives
+
+
+@shared_task(acks_late=True)
+def generate_image_derivatives_task(model_label, pk, field_name):
+    """업로드 이미지의 WebP 파생본 생성"""
+    model = apps.get_model(model_label)
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None:
+        return None
+    return generate_derivatives(instance, field_name)
@@ -0,0 +1,106 @@
+import shutil
+import tempfile
+from datetime import date
+from io import BytesIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from apps.characters.models import NutritionLog
+from apps.characters.serializers import NutritionLogSerializer
+from .derivatives import DERIVATIVE_SIZES, generate_derivatives
+
+User = get_user_model()
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def jpeg_upload(name='meal.jpg', size=(1200, 800), orientation=None):
+    """EXIF 방향 정보가 있는 JPEG 업로드 파일"""
+    image = Image.new('RGB', size, 'green')
+    exif = Image.Exif()
+    exif[0x010F] = 'TestCamera'
+    if orientation:
+        exif[0x0112] = orientation
+    buffer = BytesIO()
+    image.save(buffer, 'JPEG', exif=exif)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/jpeg')
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ImageDerivativesTest(TestCase):
+    """업로드 이미지 WebP 파생본 테스트"""
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            username='testuser',
+            nickname='테스트유저',
+            password='testpass123'
+        )
+
+    def create_log(self, **kwargs):
+        return NutritionLog.objects.create(
+            user=self.user, date=date(2024, 1, 1), meal_type='lunch', **kwargs
+        )
+
+    def test_upload_schedules_derivatives_on_commit(self):
+        """사진이 바뀔 때만 파생본 생성이 예약되는지 테스트"""
+        with self.captureOnCommitCallbacks() as callbacks:
+            log = self.create_log(meal_image=jpeg_upload())
+        self.assertEqual(len(callbacks), 1)
+
+        generate_derivatives(log, 'meal_image')
+        with self.captureOnCommitCallbacks() as callbacks:
+            log.notes = '사진 그대로'
+            log.save()
+        self.assertEqual(len(callbacks), 0)
+
+    def test_generates_oriented_webp_without_exif(self):
+        """방향을 바로잡고 EXIF 없는 WebP 파생본을 크기별로 만드는지 테스트"""
+        # 6: 시계 방향 90도 회전이 필요한 세로 사진
+        log = self.create_log(meal_image=jpeg_upload(orientation=6))
+
+        derivatives = generate_derivatives(log, 'meal_image')
+
+        self.assertEqual(derivatives['source'], log.meal_image.name)
+        self.assertEqual(set(derivatives['sizes']), set(DERIVATIVE_SIZES))
+        with default_storage.open(derivatives['sizes']['medium']) as handle, Image.open(handle) as image:
+            self.assertEqual(image.format, 'WEBP')
+            self.assertEqual(image.size, (427, 640))
+            self.assertFalse(image.getexif())
+
+        log.refresh_from_db()
+        urls = NutritionLogSerializer(log).data['meal_image_urls']
+        self.assertTrue(urls['thumb'].endswith('_thumb.webp'))
+
+    def test_replaced_image_cleans_old_derivatives(self):
+        """사진을 바꾸면 이전 파생본을 지우는지 테스트"""
+        log = self.create_log(meal_image=jpeg_upload('first.jpg'))
+        old_paths = generate_derivatives(log, 'meal_image')['sizes'].values()
+
+        log.meal_image = jpeg_upload('second.jpg')
+        log.save()
+        generate_derivatives(log, 'meal_image')
+
+        for path in old_paths:
+            self.assertFalse(default_storage.exists(path))
+
+    def test_stale_task_does_not_overwrite(self):
+        """작업 실행 전 사진이 다시 바뀌면 기록하지 않는지 테스트"""
+        log = self.create_log(meal_image=jpeg_upload('first.jpg'))
+        stale = NutritionLog.objects.get(pk=log.pk)
+        log.meal_image = jpeg_upload('second.jpg')
+        log.save()
+
+        self.assertIsNone(generate_derivatives(stale, 'meal_image'))
+        log.refresh_from_db()
+        self.assertEqual(log.meal_image_derivatives, {})
@@ -3,4 +3,12 @@ from django.apps import AppConfig
 
 class QuestsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.quests'
\ No newline at end of file
+    name = 'apps.quests'
+
+    def ready(self):
+        # 퀘스트 상태 변경 시 오늘의 퀘스트 요약 캐시, 템플릿 변경 시 카탈로그 무효화 시그널 등록
+        from . import catalog, summary  # noqa: F401
+        from apps.images.derivatives import track_image_derivatives
+
+        # 인증 사진 WebP 파생본 생성
+        track_image_derivatives(self.get_model('Quest'), 'verification_image')
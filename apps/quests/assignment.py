@@ -0,0 +1,121 @@
+"""일일 퀘스트 할당 엔진
+
+활성 퀘스트 템플릿 중 사용자 레벨/카테고리/시간대 조건에 맞는 템플릿을 골라
+사용자별 오늘의 퀘스트를 생성한다. 사용자는 id 기준 키셋 페이지네이션으로
+청크 단위로 읽고, 퀘스트는 청크마다 bulk_create로 저장한다.
+사용자 id를 partitions로 나눈 나머지로 분할하므로 여러 프로세스나
+Celery 작업이 겹치지 않게 나눠서 처리할 수 있다.
+"""
+import random
+import time
+from bisect import bisect_right
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db.models.functions import Mod
+from django.utils import timezone
+
+from .catalog import template_catalog
+from .models import Quest
+from .summary import day_bounds, invalidate_daily_summaries
+
+User = get_user_model()
+
+DAILY_QUEST_COUNT = 3
+
+
+class TemplatePool:
+    """할당 후보 템플릿 (필요 레벨 순 정렬)"""
+
+    def __init__(self, templates):
+        self.templates = sorted(templates, key=lambda t: (t.required_level, t.pk))
+        self.levels = [template.required_level for template in self.templates]
+
+    @classmethod
+    def load(cls, categories=None, time_of_day=None):
+        """템플릿 카탈로그에서 조건에 맞는 활성 템플릿 선택 (DB 조회 없음)"""
+        templates = template_catalog.active()
+        if categories:
+            templates = [t for t in templates if t.category in categories]
+        if time_of_day:
+            templates = [t for t in templates if t.time_of_day in (time_of_day, 'any')]
+        return cls(templates)
+
+    def pick(self, user_id, level, day, count):
+        """레벨 조건을 만족하는 템플릿 중 사용자/날짜별로 고정된 무작위 선택"""
+        eligible = self.templates[:bisect_right(self.levels, level)]
+        if len(eligible) <= count:
+            return eligible
+        return random.Random(f"{day.isoformat()}:{user_id}").sample(eligible, count)
+
+
+def build_quest(user_id, template, due_date):
+    """템플릿의 기본 보상/목표 스탯을 복사한 퀘스트 생성 (저장하지 않음)"""
+    return Quest(
+        user_id=user_id,
+        template=template,
+        target_stats=dict(template.target_stats),
+        experience_reward=template.base_experience,
+        gold_reward=template.base_gold,
+        gems_reward=template.base_gems,
+        due_date=due_date,
+    )
+
+
+def assign_daily_quests(day=None, partition=0, partitions=1, chunk_size=1000,
+                        per_user=DAILY_QUEST_COUNT, categories=None, time_of_day=None):
+    """한 파티션의 사용자들에게 일일 퀘스트 할당
+
+    이미 해당 날짜에 마감되는 퀘스트가 있는 사용자는 건너뛰므로 여러 번
+    실행해도 중복 할당되지 않는다. 처리 결과(사용자 수, 생성 수, 소요 시간)를 반환한다.
+    """
+    day = day or timezone.localdate()
+    start, end = day_bounds(day)
+    due_date = end - timedelta(microseconds=1)
+    pool = TemplatePool.load(categories=categories, time_of_day=time_of_day)
+
+    users = User.objects.filter(is_active=True)
+    if partitions > 1:
+        users = users.annotate(partition=Mod('id', partitions)).filter(partition=partition)
+
+    started = time.monotonic()
+    last_id = 0
+    scanned = 0
+    created = 0
+
+    while pool.templates:
+        rows = list(
+            users.filter(id__gt=last_id)
+            .order_by('id')
+            .values_list('id', 'character__level')[:chunk_size]
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        scanned += len(rows)
+
+        assigned = set(
+            Quest.objects.filter(
+                user_id__in=[user_id for user_id, _ in rows],
+                due_date__gte=start,
+                due_date__lt=end
+            ).order_by().values_list('user_id', flat=True).distinct()
+        )
+
+        quests = [
+            build_quest(user_id, template, due_date)
+            for user_id, level in rows
+            if user_id not in assigned
+            for template in pool.pick(user_id, level or 1, day, per_user)
+        ]
+        Quest.objects.bulk_create(quests, batch_size=chunk_size)
+        invalidate_daily_summaries({(quest.user_id, due_date) for quest in quests})
+        created += len(quests)
+
+    return {
+        'date': day,
+        'partition': partition,
+        'users': scanned,
+        'quests': created,
+        'elapsed': time.monotonic() - started,
+    }
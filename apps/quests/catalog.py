@@ -0,0 +1,110 @@
+"""퀘스트 템플릿 카탈로그 캐시
+
+템플릿은 관리자만 수정하고 대부분 읽기만 하므로, 워커 프로세스마다 전체
+템플릿을 메모리 딕셔너리로 들고 있는다. 캐시(Redis)에 저장된 카탈로그 버전이
+바뀌었을 때만 DB에서 다시 읽으며, 템플릿이 저장/삭제되면 커밋 이후 버전을 올려
+모든 워커가 새 카탈로그를 읽게 한다. Redis 장애 중에는 이미 읽은 카탈로그를 계속
+쓰고, 아직 읽은 적이 없으면 DB에서 직접 읽는다.
+"""
+import logging
+import time
+
+import redis
+from django.apps import apps
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION_KEY = 'quests:template_catalog:version'
+
+# 캐시의 카탈로그 버전을 다시 확인하기까지의 간격(초)
+VERSION_CHECK_INTERVAL = 5
+
+
+class TemplateCatalog:
+    """버전 기반으로 갱신되는 프로세스 내 템플릿 카탈로그"""
+
+    def __init__(self):
+        self._templates = {}
+        self._version = None
+        self._loaded = False
+        self._checked_at = 0
+
+    def _current_version(self):
+        version = cache.get(CATALOG_VERSION_KEY)
+        if version is None:
+            cache.add(CATALOG_VERSION_KEY, int(time.time() * 1000), timeout=None)
+            version = cache.get(CATALOG_VERSION_KEY)
+        return version
+
+    def _load(self, version):
+        QuestTemplate = apps.get_model('quests', 'QuestTemplate')
+        self._templates = QuestTemplate.objects.in_bulk()
+        self._version = version
+        self._loaded = True
+
+    def _refresh(self):
+        now = time.monotonic()
+        if self._loaded and now - self._checked_at < VERSION_CHECK_INTERVAL:
+            return
+
+        try:
+            version = self._current_version()
+        except redis.RedisError:
+            logger.warning('템플릿 카탈로그 버전 조회 실패', exc_info=True)
+            self._checked_at = now
+            if not self._loaded:
+                # 버전 없이 읽은 카탈로그는 Redis가 복구되면 다시 읽는다
+                self._load(None)
+            return
+
+        self._checked_at = now
+        if not self._loaded or version != self._version:
+            # 버전을 먼저 읽고 DB를 읽으므로, 그 사이의 변경은 다음 확인 때 반영된다
+            self._load(version)
+
+    def get(self, template_id):
+        """템플릿 조회 (카탈로그에 아직 없는 새 템플릿만 DB에서 읽음)"""
+        self._refresh()
+        template = self._templates.get(template_id)
+        if template is None:
+            QuestTemplate = apps.get_model('quests', 'QuestTemplate')
+            template = QuestTemplate.objects.get(pk=template_id)
+            self._templates[template_id] = template
+        return template
+
+    def all(self):
+        self._refresh()
+        return list(self._templates.values())
+
+    def active(self):
+        return [template for template in self.all() if template.is_active]
+
+    def clear(self):
+        self._templates = {}
+        self._version = None
+        self._loaded = False
+
+
+template_catalog = TemplateCatalog()
+
+
+def bump_catalog_version():
+    """템플릿 변경 후 모든 워커의 카탈로그를 무효화"""
+    template_catalog.clear()
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.set(CATALOG_VERSION_KEY, int(time.time() * 1000), timeout=None)
+    except redis.RedisError:
+        logger.warning('템플릿 카탈로그 버전 갱신 실패', exc_info=True)
+
+
+@receiver(post_save, sender='quests.QuestTemplate')
+@receiver(post_delete, sender='quests.QuestTemplate')
+def invalidate_template_catalog(sender, **kwargs):
+    """관리자, 관리 명령, 셸 등 모든 경로의 템플릿 변경 시 커밋 이후 카탈로그 무효화"""
+    transaction.on_commit(bump_catalog_version)
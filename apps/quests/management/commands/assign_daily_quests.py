@@ -0,0 +1,70 @@
+import time
+from datetime import date
+from multiprocessing import Pool
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from apps.quests.assignment import DAILY_QUEST_COUNT, assign_daily_quests
+
+
+def _run_partition(kwargs):
+    """워커 프로세스에서 파티션 하나 처리"""
+    return assign_daily_quests(**kwargs)
+
+
+class Command(BaseCommand):
+    help = '퀘스트 템플릿으로 사용자별 일일 퀘스트 생성'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='할당 날짜 (YYYY-MM-DD, 기본값: 오늘)')
+        parser.add_argument('--workers', type=int, default=1, help='사용자를 나눠 처리할 프로세스 수')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='한 번에 처리할 사용자 수')
+        parser.add_argument('--per-user', type=int, default=DAILY_QUEST_COUNT, help='사용자당 퀘스트 수')
+        parser.add_argument('--category', action='append', dest='categories', help='템플릿 카테고리 (여러 번 지정 가능)')
+        parser.add_argument('--time-of-day', help='템플릿 시간대 (any 템플릿은 항상 포함)')
+
+    def handle(self, *args, **options):
+        try:
+            day = date.fromisoformat(options['date']) if options['date'] else None
+        except ValueError:
+            raise CommandError('날짜는 YYYY-MM-DD 형식이어야 합니다.')
+
+        workers = max(1, options['workers'])
+        jobs = [
+            {
+                'day': day,
+                'partition': partition,
+                'partitions': workers,
+                'chunk_size': options['chunk_size'],
+                'per_user': options['per_user'],
+                'categories': options['categories'],
+                'time_of_day': options['time_of_day'],
+            }
+            for partition in range(workers)
+        ]
+
+        started = time.monotonic()
+        if workers == 1:
+            results = [_run_partition(jobs[0])]
+        else:
+            # 포크된 프로세스가 부모의 DB 연결을 공유하지 않도록 먼저 닫음
+            connections.close_all()
+            with Pool(workers) as pool:
+                results = pool.map(_run_partition, jobs)
+        elapsed = time.monotonic() - started
+
+        for result in results:
+            self.stdout.write(
+                f"파티션 {result['partition']}: 사용자 {result['users']}명, "
+                f"퀘스트 {result['quests']}개 ({result['elapsed']:.2f}초)"
+            )
+
+        users = sum(result['users'] for result in results)
+        quests = sum(result['quests'] for result in results)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{results[0]['date']} 일일 퀘스트 {quests}개 할당 완료 "
+                f"(사용자 {users}명, {elapsed:.2f}초, "
+                f"{users / elapsed if elapsed else 0:.0f} 사용자/초, "
+                f"{quests / elapsed if elapsed else 0:.0f} 퀘스트/초)"
+            )
+        )
@@ -0,0 +1,17 @@
+import time
+from django.core.management.base import BaseCommand
+from apps.quests.services import expire_overdue_quests
+
+
+class Command(BaseCommand):
+    help = '마감이 지난 진행 중 퀘스트를 만료 상태로 변경'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000, help='UPDATE 한 번에 처리할 퀘스트 수')
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        expired = expire_overdue_quests(chunk_size=options['chunk_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'퀘스트 {expired}개 만료 처리 ({time.monotonic() - started:.2f}초)')
+        )
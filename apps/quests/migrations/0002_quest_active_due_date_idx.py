@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quests', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quest',
+            index=models.Index(condition=models.Q(('status__in', ('assigned', 'in_progress'))), fields=['due_date'], name='quests_active_due_date_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quests', '0002_quest_active_due_date_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quest',
+            index=models.Index(fields=['user', 'due_date'], name='quests_user_due_date_idx'),
+        ),
+    ]
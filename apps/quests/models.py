@@ -2,6 +2,10 @@ from django.db import models
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
+from .catalog import template_catalog
+
+# 진행 중(만료 대상)으로 취급하는 퀘스트 상태
+ACTIVE_QUEST_STATUSES = ('assigned', 'in_progress')
 
 
 class QuestTemplate(models.Model):
@@ -128,6 +132,7 @@ class Quest(models.Model):
     # 퀘스트 검증
     requires_verification = models.BooleanField(default=False)
     verification_image = models.ImageField(upload_to='quest_verifications/', blank=True, null=True)
+    verification_image_derivatives = models.JSONField(default=dict, blank=True, editable=False)
     verification_note = models.TextField(blank=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
@@ -138,18 +143,32 @@ class Quest(models.Model):
         verbose_name = '퀘스트'
         verbose_name_plural = '퀘스트들'
         ordering = ['-created_at']
+        indexes = [
+            # 만료 스위퍼용 부분 인덱스 (진행 중인 퀘스트만 포함)
+            models.Index(
+                fields=['due_date'],
+                name='quests_active_due_date_idx',
+                condition=models.Q(status__in=ACTIVE_QUEST_STATUSES),
+            ),
+            # 오늘의 퀘스트 조회/집계용 (사용자별 마감일 구간 검색)
+            models.Index(fields=['user', 'due_date'], name='quests_user_due_date_idx'),
+        ]
 
     def __str__(self):
-        title = self.custom_title or self.template.title
-        return f"{self.user.nickname} - {title} ({self.status})"
+        return f"{self.user.nickname} - {self.title} ({self.status})"
+
+    @property
+    def catalog_template(self):
+        """템플릿 카탈로그에서 조회한 템플릿 (DB 조회 없음)"""
+        return template_catalog.get(self.template_id)
 
     @property
     def title(self):
-        return self.custom_title or self.template.title
+        return self.custom_title or self.catalog_template.title
 
     @property
     def description(self):
-        return self.custom_description or self.template.description
+        return self.custom_description or self.catalog_template.description
 
     def start_quest(self):
         """퀘스트 시작"""
@@ -158,44 +177,20 @@ class Quest(models.Model):
             self.start_date = timezone.now()
             self.save()
 
-    def complete_quest(self):
-        """퀘스트 완료 처리"""
+    def complete_quest(self, completion_data=None):
+        """퀘스트 완료 처리 (보상 지급 포함)"""
         if self.status == 'in_progress':
-            self.status = 'completed'
-            self.completed_date = timezone.now()
-            self.progress_percentage = 100
-            self.save()
-            
-            # 보상 지급
-            self._give_rewards()
+            from .services import complete_quest
+            return complete_quest(self, completion_data)
 
-    def _give_rewards(self):
-        """보상 지급"""
-        character = self.user.character
-        
-        # 경험치 및 화폐 지급
-        character.gain_experience(self.experience_reward)
-        character.gold += self.gold_reward
-        character.gems += self.gems_reward
-        
-        # 스탯 증가
-        for stat, value in self.target_stats.items():
-            if hasattr(character, stat):
-                old_value = getattr(character, stat)
-                new_value = old_value + value
-                setattr(character, stat, new_value)
-                
-                # 스탯 변화 기록
-                from apps.characters.models import StatHistory
-                StatHistory.objects.create(
-                    character=character,
-                    stat_type=stat,
-                    old_value=old_value,
-                    new_value=new_value,
-                    change_reason=f"퀘스트 완료: {self.title}"
-                )
-        
-        character.save()
+    def is_completable(self, completed_at=None):
+        """완료 처리할 수 있는지 (진행 중, 또는 마감 전에 오프라인으로 완료했지만 동기화 전에 만료된 퀘스트)"""
+        if self.status == 'in_progress':
+            return True
+        return (
+            self.status == 'expired' and self.start_date is not None
+            and completed_at is not None and completed_at <= self.due_date
+        )
 
     def fail_quest(self):
         """퀘스트 실패 처리"""
@@ -259,8 +254,9 @@ class DailyStreak(models.Model):
             self.current_streak = 1
             self.longest_streak = 1
             self.streak_start_date = completion_date
-        elif completion_date == self.last_completion_date:
-            # 같은 날 완료 (중복 처리 방지)
+        elif completion_date <= self.last_completion_date:
+            # 같은 날 완료 (중복 처리 방지), 또는 늦게 전송된 지난 날짜 완료
+            # (이미 기록된 연속 기록을 되돌리지 않음)
             return
         elif completion_date == self.last_completion_date + timezone.timedelta(days=1):
             # 연속 완료
@@ -1,4 +1,7 @@
+from django.utils import timezone
 from rest_framework import serializers
+from apps.images.serializers import ImageDerivativesField
+from .catalog import template_catalog
 from .models import QuestTemplate, Quest, QuestCompletion, DailyStreak
 
 
@@ -9,10 +12,11 @@ class QuestTemplateSerializer(serializers.ModelSerializer):
 
 
 class QuestSerializer(serializers.ModelSerializer):
-    template = QuestTemplateSerializer(read_only=True)
+    template = serializers.SerializerMethodField()
     title = serializers.ReadOnlyField()
     description = serializers.ReadOnlyField()
     is_overdue = serializers.SerializerMethodField()
+    verification_image_urls = ImageDerivativesField('verification_image')
     
     class Meta:
         model = Quest
@@ -21,16 +25,31 @@ class QuestSerializer(serializers.ModelSerializer):
             'title', 'description', 'target_stats', 'experience_reward',
             'gold_reward', 'gems_reward', 'status', 'assigned_date',
             'start_date', 'due_date', 'completed_date', 'progress_percentage',
-            'requires_verification', 'verification_image', 'verification_note',
-            'is_overdue', 'created_at', 'updated_at'
+            'requires_verification', 'verification_image', 'verification_image_urls',
+            'verification_note', 'is_overdue', 'created_at', 'updated_at'
         )
         read_only_fields = (
             'id', 'user', 'assigned_date', 'start_date', 'completed_date',
             'created_at', 'updated_at'
         )
 
+    def get_template(self, obj):
+        return QuestTemplateSerializer(template_catalog.get(obj.template_id)).data
+
     def get_is_overdue(self, obj):
-        return obj.is_overdue()
+        # 마감 시각 비교 대신 만료 스위퍼가 기록한 상태를 사용
+        return obj.status == 'expired'
+
+
+class QuestCompactSerializer(QuestSerializer):
+    """템플릿을 id로만 참조하는 퀘스트 시리얼라이저 (템플릿은 응답에 별도 포함)"""
+    template = None
+    template_id = serializers.IntegerField(read_only=True)
+    
+    class Meta(QuestSerializer.Meta):
+        fields = ('template_id',) + tuple(
+            field for field in QuestSerializer.Meta.fields if field != 'template'
+        )
 
 
 class QuestCompletionSerializer(serializers.ModelSerializer):
@@ -42,6 +61,11 @@ class QuestCompletionSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'completion_time')
 
 
+class QuestCompletionCompactSerializer(QuestCompletionSerializer):
+    """퀘스트 템플릿을 id로만 참조하는 완료 기록 시리얼라이저"""
+    quest = QuestCompactSerializer(read_only=True)
+
+
 class DailyStreakSerializer(serializers.ModelSerializer):
     class Meta:
         model = DailyStreak
@@ -60,4 +84,26 @@ class QuestCompleteSerializer(serializers.Serializer):
     verification_note = serializers.CharField(max_length=500, required=False)
     difficulty_rating = serializers.IntegerField(min_value=1, max_value=5, required=False)
     satisfaction_rating = serializers.IntegerField(min_value=1, max_value=5, required=False)
-    user_notes = serializers.CharField(max_length=1000, required=False)
\ No newline at end of file
+    user_notes = serializers.CharField(max_length=1000, required=False)
+
+
+class QuestBatchCompleteItemSerializer(QuestCompleteSerializer):
+    """일괄 완료 항목 시리얼라이저 (JSON 요청이므로 인증 이미지는 제외)"""
+    quest_id = serializers.IntegerField()
+    verification_image = None
+    # 오프라인에서 실제로 완료한 시각 (생략하면 요청 시각)
+    completed_at = serializers.DateTimeField(required=False)
+
+    def validate_completed_at(self, value):
+        if value > timezone.now():
+            raise serializers.ValidationError("완료 시각은 현재보다 늦을 수 없습니다.")
+        return value
+
+
+class QuestBatchCompleteSerializer(serializers.Serializer):
+    """퀘스트 일괄 완료 시리얼라이저"""
+    completions = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=100
+    )
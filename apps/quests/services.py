@@ -0,0 +1,257 @@
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import OperationalError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.characters.achievements import achievement_entries, achievement_progress, grant_achievements
+from apps.characters.ledger import currency_entries, record_transactions
+from apps.characters.models import Character, StatHistory, STAT_FIELDS
+from apps.characters.rollups import record_stat_changes
+from apps.images.derivatives import schedule_image_derivatives
+from .models import ACTIVE_QUEST_STATUSES, Quest, QuestCompletion, DailyStreak
+from .summary import invalidate_daily_summaries
+
+logger = logging.getLogger(__name__)
+
+# 비동기 후처리가 끝났어야 할 시간 (재시도 5회 * 10초보다 충분히 김)
+STALE_COMPLETION_GRACE = timedelta(minutes=10)
+# 후처리 누락을 다시 찾는 기간 (워커 장애가 이보다 길면 기간을 늘려 수동 실행)
+STALE_COMPLETION_LOOKBACK = timedelta(days=7)
+
+
+class QuestNotCompletable(Exception):
+    """완료 처리할 수 없는 상태의 퀘스트"""
+
+
+def complete_quest(quest, completion_data=None):
+    """퀘스트 완료와 보상 지급을 하나의 트랜잭션으로 처리
+
+    퀘스트 상태 변경, 캐릭터 보상, 스탯 기록, 완료 기록, 연속 기록까지
+    모두 한 번에 커밋하며 갱신된 연속 완료 기록을 반환한다.
+    """
+    return complete_quests(quest.user, [(quest, completion_data)])
+
+
+def complete_quests(user, items):
+    """같은 사용자의 여러 퀘스트를 한 트랜잭션으로 완료 처리
+
+    items는 (quest, completion_data) 목록이다. 보상은 합산해 캐릭터 행에
+    한 번만 쓰고, 스탯 기록과 완료 기록은 bulk INSERT로 저장한다.
+    """
+    with transaction.atomic():
+        _mark_completed([quest for quest, _ in items], timezone.now())
+        return _finish_completions(user, items)
+
+
+def complete_quest_async(quest, completion_data=None):
+    """퀘스트 상태만 완료로 바꾸고 나머지 처리는 Celery 작업으로 넘김
+
+    요청 경로에는 조건부 UPDATE 한 번만 남고, 보상/기록 처리는 커밋 이후
+    process_quest_completion 작업이 수행한다.
+    """
+    from .tasks import process_quest_completion
+
+    with transaction.atomic():
+        _mark_completed([quest], timezone.now())
+        transaction.on_commit(
+            lambda: process_quest_completion.delay(quest.pk, completion_data or {})
+        )
+
+
+def process_completion(quest_id, completion_data=None):
+    """완료 상태로 바뀐 퀘스트의 보상/기록 처리 (멱등)
+
+    퀘스트 행을 잠근 뒤 완료 기록 존재 여부를 확인하므로, 같은 퀘스트에 대해
+    여러 번 호출되어도 보상은 한 번만 지급된다. 완료 기록과 퀘스트의
+    1:1 제약이 멱등성 키 역할을 한다. 처리하지 않았으면 None을 반환한다.
+    """
+    with transaction.atomic():
+        quest = Quest.objects.select_for_update(of=('self',)).select_related('user').get(pk=quest_id)
+
+        if quest.status != 'completed' or QuestCompletion.objects.filter(quest=quest).exists():
+            return None
+
+        return _finish_completions(quest.user, [(quest, completion_data)])
+
+
+def process_stale_completions(now=None, limit=1000):
+    """완료 상태지만 완료 기록이 없는 퀘스트의 후처리를 다시 실행하고 처리한 수 반환
+
+    process_quest_completion이 재시도 한도를 넘겨 포기한 퀘스트를 찾는다. 정상 처리 중인
+    작업과 겹치지 않도록 완료된 지 STALE_COMPLETION_GRACE가 지난 퀘스트만 대상이며,
+    겹치더라도 process_completion이 멱등하므로 보상은 한 번만 지급된다. 요청 때 받은 완료
+    데이터(만족도 등)는 남아 있지 않으므로 완료 기록은 기본값으로 남는다.
+    """
+    now = now or timezone.now()
+    quest_ids = list(
+        Quest.objects.filter(
+            status='completed',
+            updated_at__gte=now - STALE_COMPLETION_LOOKBACK,
+            updated_at__lt=now - STALE_COMPLETION_GRACE,
+            questcompletion__isnull=True,
+        )
+        .order_by('id')
+        .values_list('id', flat=True)[:limit]
+    )
+
+    processed = 0
+    for quest_id in quest_ids:
+        try:
+            if process_completion(quest_id) is not None:
+                processed += 1
+        except OperationalError:
+            # 다음 주기에 다시 시도
+            logger.warning('퀘스트 %s 완료 후처리 재시도 실패', quest_id, exc_info=True)
+    return processed
+
+
+def expire_overdue_quests(now=None, chunk_size=1000):
+    """마감이 지난 진행 중 퀘스트를 청크 단위 UPDATE로 만료 처리
+
+    대상 id는 (due_date) 부분 인덱스로 찾고, UPDATE에도 상태 조건을 다시 걸어
+    그 사이 완료된 퀘스트는 건드리지 않는다. 만료 처리한 퀘스트 수를 반환한다.
+    """
+    now = now or timezone.now()
+    expired = 0
+
+    while True:
+        with transaction.atomic():
+            rows = list(
+                Quest.objects.filter(status__in=ACTIVE_QUEST_STATUSES, due_date__lt=now)
+                .order_by('due_date')
+                .values_list('id', 'user_id', 'due_date')[:chunk_size]
+            )
+            if not rows:
+                break
+            expired += Quest.objects.filter(
+                id__in=[quest_id for quest_id, _, _ in rows],
+                status__in=ACTIVE_QUEST_STATUSES
+            ).update(status='expired', updated_at=now)
+            invalidate_daily_summaries({(user_id, due_date) for _, user_id, due_date in rows})
+
+    return expired
+
+
+def _finish_completions(user, items):
+    """보상 지급, 업적 평가, 완료 기록, 연속 기록 갱신 (트랜잭션 안에서 호출)"""
+    quests = [quest for quest, _ in items]
+    character = _lock_character(user)
+    streak, created = DailyStreak.objects.select_for_update().get_or_create(user=user)
+    before = achievement_progress(character, streak)
+
+    history = _apply_rewards(character, quests)
+    ledger = [
+        entry for quest in quests
+        for entry in currency_entries(
+            user.pk, 'quest', f"퀘스트 완료: {quest.title}", gold=quest.gold_reward, gems=quest.gems_reward
+        )
+    ]
+    # 완료한 날짜마다 순서대로 연속 기록 반영 (오프라인 일괄 완료는 여러 날에 걸칠 수 있음)
+    for day in sorted({timezone.localdate(quest.completed_date) for quest in quests}):
+        streak.update_streak(day)
+
+    # 새로 넘어선 업적 임계값만 평가 (업적 경험치로 인한 레벨업은 다시 평가)
+    granted = grant_achievements(user, character, before, achievement_progress(character, streak))
+    ledger.extend(achievement_entries(user.pk, granted))
+
+    character.save(update_fields=[
+        'level', 'experience_points', 'unspent_stat_points', 'quests_completed',
+        'gold', 'gems', *STAT_FIELDS, 'updated_at'
+    ])
+    record_stat_changes(character, history)
+    record_transactions(ledger)
+
+    completions = []
+    for quest, completion_data in items:
+        completion_data = dict(completion_data or {})
+        if quest.start_date:
+            completion_data.setdefault('actual_duration', quest.completed_date - quest.start_date)
+        completions.append(QuestCompletion(quest=quest, **completion_data))
+    QuestCompletion.objects.bulk_create(completions)
+
+    return streak
+
+
+def _mark_completed(quests, now):
+    """진행 중인 퀘스트만 완료 상태로 전환 (조건부 UPDATE)
+
+    completed_date가 미리 지정된 퀘스트(오프라인 완료 재전송)는 그 시각으로, 나머지는
+    now로 기록한다. 완료 시각별로 UPDATE 한 번씩 실행한다. 마감 전에 완료했지만
+    동기화 전에 만료 처리된 퀘스트도 완료할 수 있다 (Quest.is_completable과 같은 조건).
+    """
+    by_time = defaultdict(list)
+    for quest in quests:
+        by_time[quest.completed_date or now].append(quest.pk)
+
+    updated = 0
+    for completed_at, quest_ids in by_time.items():
+        updated += Quest.objects.filter(
+            Q(status='in_progress')
+            | Q(status='expired', start_date__isnull=False, due_date__gte=completed_at),
+            pk__in=quest_ids,
+        ).update(
+            status='completed',
+            completed_date=completed_at,
+            progress_percentage=100,
+            updated_at=now,
+        )
+    if updated != len(quests):
+        # 동시 요청으로 이미 완료된 경우 보상이 중복 지급되지 않도록 중단
+        raise QuestNotCompletable([quest.pk for quest in quests])
+
+    invalidate_daily_summaries(quests)
+
+    verified = []
+    image_field = Quest._meta.get_field('verification_image')
+    for quest in quests:
+        quest.status = 'completed'
+        quest.completed_date = quest.completed_date or now
+        quest.progress_percentage = 100
+        quest.updated_at = now
+        if quest.verification_image or quest.verification_note:
+            # 업로드된 인증 이미지는 UPDATE 전에 스토리지에 저장
+            image_field.pre_save(quest, add=False)
+            verified.append(quest)
+
+    if verified:
+        Quest.objects.bulk_update(verified, ['verification_image', 'verification_note'])
+        # bulk_update는 저장 시그널을 보내지 않으므로 파생본 생성을 직접 예약
+        schedule_image_derivatives(verified, 'verification_image')
+
+
+def _lock_character(user):
+    """보상 반영 대상 캐릭터 행 잠금"""
+    try:
+        return Character.objects.select_for_update().get(user=user)
+    except Character.DoesNotExist:
+        return Character.create_for_user(user)
+
+
+def _apply_rewards(character, quests):
+    """퀘스트들의 경험치/화폐/스탯 보상을 합산해 캐릭터에 반영하고 스탯 기록 반환"""
+    history = []
+    for quest in quests:
+        character.add_experience(quest.experience_reward)
+        character.gold += quest.gold_reward
+        character.gems += quest.gems_reward
+        character.quests_completed += 1
+
+        change_reason = f"퀘스트 완료: {quest.title}"[:100]
+        for stat, value in quest.target_stats.items():
+            if stat not in STAT_FIELDS:
+                continue
+            old_value = getattr(character, stat)
+            new_value = old_value + value
+            setattr(character, stat, new_value)
+            history.append(StatHistory(
+                character=character,
+                stat_type=stat,
+                old_value=old_value,
+                new_value=new_value,
+                change_reason=change_reason
+            ))
+
+    return history
@@ -0,0 +1,104 @@
+"""오늘의 퀘스트 요약 캐시
+
+홈 화면이 가장 자주 호출하는 오늘의 퀘스트 응답을 사용자/날짜별로 캐시한다.
+퀘스트 목록과 개수는 (user, due_date) 인덱스 구간을 한 번 읽어 함께 만들고,
+퀘스트 상태가 바뀌면 해당 사용자/날짜의 캐시를 커밋 이후 삭제한다. Redis 장애는
+기록만 하고 DB에서 직접 읽은 응답을 준다.
+"""
+import logging
+from datetime import datetime, timedelta
+
+import redis
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import ACTIVE_QUEST_STATUSES, Quest
+
+logger = logging.getLogger(__name__)
+
+# 무효화가 누락되더라도 캐시가 유지되는 최대 시간(초)
+DAILY_SUMMARY_TTL = 300
+
+SUMMARY_MODES = ('full', 'compact')
+
+
+def day_bounds(day):
+    """현지 시간 기준 하루의 [시작, 끝) 구간"""
+    start = timezone.make_aware(datetime.combine(day, datetime.min.time()))
+    return start, start + timedelta(days=1)
+
+
+def daily_summary_key(user_id, day, mode='full'):
+    return f'quests:daily:{user_id}:{day.isoformat()}:{mode}'
+
+
+def load_daily_quests(user, day):
+    """하루 동안 마감되는 진행 중 퀘스트 목록과 개수 (쿼리 한 번)
+
+    total_count는 기존 응답과 같이 진행 중(할당/진행) 퀘스트 수이고,
+    completed_count는 그날 마감 퀘스트 중 완료한 수다.
+    """
+    start, end = day_bounds(day)
+    quests = list(Quest.objects.filter(
+        user=user,
+        due_date__gte=start,
+        due_date__lt=end,
+        status__in=(*ACTIVE_QUEST_STATUSES, 'completed')
+    ))
+    active = [quest for quest in quests if quest.status in ACTIVE_QUEST_STATUSES]
+    return active, {'total_count': len(active), 'completed_count': len(quests) - len(active)}
+
+
+def get_daily_summary(user, day, mode, build):
+    """캐시된 오늘의 퀘스트 응답 조회, 없으면 build(quests)로 생성해 저장
+
+    build는 진행 중인 퀘스트 목록을 받아 응답에 들어갈 퀘스트 데이터를 반환한다.
+    """
+    key = daily_summary_key(user.pk, day, mode)
+    try:
+        summary = cache.get(key)
+    except redis.RedisError:
+        logger.warning('오늘의 퀘스트 캐시 조회 실패', exc_info=True)
+        summary = None
+    if summary is None:
+        quests, counts = load_daily_quests(user, day)
+        summary = {'date': day, **build(quests), **counts}
+        try:
+            cache.set(key, summary, DAILY_SUMMARY_TTL)
+        except redis.RedisError:
+            logger.warning('오늘의 퀘스트 캐시 저장 실패', exc_info=True)
+    return summary
+
+
+def delete_daily_summaries(keys):
+    """요약 캐시 삭제 (커밋 이후 실행되므로 Redis 오류는 기록만 하고 다른 커밋 훅을 막지 않음)"""
+    try:
+        cache.delete_many(keys)
+    except redis.RedisError:
+        logger.exception('오늘의 퀘스트 캐시 삭제 실패')
+
+
+def invalidate_daily_summaries(quests):
+    """상태가 바뀐 퀘스트들의 사용자/마감일 요약 캐시를 커밋 이후 삭제
+
+    quests는 Quest 객체 또는 (user_id, due_date) 쌍의 목록이다.
+    """
+    keys = set()
+    for quest in quests:
+        user_id, due_date = (
+            (quest.user_id, quest.due_date) if isinstance(quest, Quest) else quest
+        )
+        day = timezone.localdate(due_date)
+        keys.update(daily_summary_key(user_id, day, mode) for mode in SUMMARY_MODES)
+    if keys:
+        transaction.on_commit(lambda: delete_daily_summaries(list(keys)))
+
+
+@receiver(post_save, sender=Quest)
+@receiver(post_delete, sender=Quest)
+def invalidate_quest_summary(sender, instance, **kwargs):
+    """퀘스트 저장/삭제(시작, 실패, 관리자 수정 등) 시 요약 캐시 무효화"""
+    invalidate_daily_summaries([instance])
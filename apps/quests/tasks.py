@@ -0,0 +1,54 @@
+from datetime import date
+from celery import shared_task
+from django.db import OperationalError
+from .assignment import assign_daily_quests
+from .services import expire_overdue_quests, process_completion, process_stale_completions
+
+
+@shared_task(bind=True, acks_late=True, max_retries=5, default_retry_delay=10)
+def process_quest_completion(self, quest_id, completion_data=None):
+    """퀘스트 완료 후처리 (보상 지급, 스탯 기록, 완료 기록, 연속 기록)
+
+    process_completion이 멱등하므로 재시도나 중복 전달에도 보상은 한 번만 지급된다.
+    재시도 한도를 넘긴 퀘스트는 process_stale_completions_task가 다시 처리한다.
+    """
+    try:
+        process_completion(quest_id, completion_data)
+    except OperationalError as exc:
+        raise self.retry(exc=exc)
+
+
+@shared_task
+def assign_daily_quests_task(day=None, partitions=4):
+    """일일 퀘스트 할당 (사용자 id 파티션별 작업으로 분산)"""
+    for partition in range(partitions):
+        assign_daily_quests_partition.delay(day, partition, partitions)
+
+
+@shared_task
+def assign_daily_quests_partition(day, partition, partitions):
+    """사용자 파티션 하나에 일일 퀘스트 할당"""
+    result = assign_daily_quests(
+        day=date.fromisoformat(day) if day else None,
+        partition=partition,
+        partitions=partitions
+    )
+    return {
+        'date': result['date'].isoformat(),
+        'partition': partition,
+        'users': result['users'],
+        'quests': result['quests'],
+        'users_per_second': round(result['users'] / result['elapsed'], 1) if result['elapsed'] else None,
+    }
+
+
+@shared_task
+def expire_overdue_quests_task():
+    """마감이 지난 진행 중 퀘스트 만료 처리"""
+    return expire_overdue_quests()
+
+
+@shared_task
+def process_stale_completions_task():
+    """후처리가 누락된 완료 퀘스트 재처리"""
+    return process_stale_completions()
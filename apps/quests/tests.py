@@ -0,0 +1,621 @@
+from datetime import timedelta
+from unittest import mock
+import redis
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from apps.characters.achievements import invalidate_achievement_index
+from apps.characters.ledger import currency_balances
+from apps.characters.models import Achievement, Character, CurrencyTransaction, StatHistory, UserAchievement
+from .assignment import assign_daily_quests
+from .catalog import bump_catalog_version, template_catalog
+from .models import QuestTemplate, Quest, QuestCompletion, DailyStreak
+from .summary import day_bounds, load_daily_quests
+from .services import complete_quest, expire_overdue_quests, process_stale_completions, QuestNotCompletable
+from .tasks import process_quest_completion
+
+User = get_user_model()
+
+# 테스트에서는 Redis 대신 프로세스 메모리 캐시 사용
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class QuestTestMixin:
+    """퀘스트 테스트 공통 데이터"""
+
+    def create_user(self, email='test@example.com', nickname='테스트유저'):
+        user = User.objects.create_user(
+            email=email,
+            username=email.split('@')[0],
+            nickname=nickname,
+            password='testpass123'
+        )
+        Character.objects.create(user=user, name=f"{nickname}의 캐릭터")
+        return user
+
+    def create_template(self, **kwargs):
+        data = {
+            'title': '산책하기',
+            'description': '20분간 산책하세요.',
+            'category': 'evening',
+            'target_stats': {'cardio': 2, 'mental': 1, 'stamina': 1, 'recovery': 1},
+            'base_experience': 30,
+            'base_gold': 25,
+        }
+        data.update(kwargs)
+        template = QuestTemplate.objects.create(**data)
+        bump_catalog_version()
+        return template
+
+    def create_quest(self, user, template, status='in_progress', **kwargs):
+        data = {
+            'user': user,
+            'template': template,
+            'target_stats': template.target_stats,
+            'experience_reward': template.base_experience,
+            'gold_reward': template.base_gold,
+            'gems_reward': 2,
+            'status': status,
+            'start_date': timezone.now() - timedelta(minutes=20),
+            'due_date': timezone.now() + timedelta(hours=6),
+        }
+        data.update(kwargs)
+        return Quest.objects.create(**data)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QuestRewardServiceTest(QuestTestMixin, TestCase):
+    """퀘스트 보상 지급 서비스 테스트"""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.template = self.create_template()
+
+    def test_complete_quest_applies_rewards(self):
+        """완료 시 경험치/화폐/스탯/기록이 모두 반영되는지 테스트"""
+        quest = self.create_quest(self.user, self.template)
+
+        streak = complete_quest(quest, {'difficulty_rating': 3})
+
+        character = Character.objects.get(user=self.user)
+        self.assertEqual(character.experience_points, 30)
+        self.assertEqual(character.gold, 125)
+        self.assertEqual(character.gems, 2)
+        self.assertEqual(character.cardio, 12)
+        self.assertEqual(character.mental, 11)
+
+        quest.refresh_from_db()
+        self.assertEqual(quest.status, 'completed')
+        self.assertEqual(quest.progress_percentage, 100)
+        self.assertEqual(StatHistory.objects.filter(character=character).count(), 4)
+        self.assertEqual(QuestCompletion.objects.get(quest=quest).difficulty_rating, 3)
+        self.assertEqual(streak.current_streak, 1)
+
+    def test_complete_quest_write_count(self):
+        """완료 한 번에 발생하는 쓰기 쿼리 수 회귀 테스트"""
+        DailyStreak.objects.create(user=self.user)
+        quest = Quest.objects.select_related('template', 'user').get(
+            pk=self.create_quest(self.user, self.template).pk
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            complete_quest(quest)
+
+        writes = [
+            q['sql'] for q in ctx.captured_queries
+            if q['sql'].lstrip().upper().startswith(('INSERT', 'UPDATE'))
+        ]
+        # 퀘스트 UPDATE, 캐릭터 UPDATE, 스탯 기록 bulk INSERT, 일일 스탯 요약 INSERT,
+        # 화폐 원장 bulk INSERT, 완료 기록 INSERT, 연속 기록 UPDATE
+        self.assertLessEqual(len(writes), 7)
+
+    def test_already_completed_quest_is_not_rewarded_twice(self):
+        """이미 완료된 퀘스트는 다시 보상되지 않는지 테스트"""
+        quest = self.create_quest(self.user, self.template)
+        stale = Quest.objects.get(pk=quest.pk)
+        complete_quest(quest)
+
+        with self.assertRaises(QuestNotCompletable):
+            complete_quest(stale)
+
+        character = Character.objects.get(user=self.user)
+        self.assertEqual(character.gold, 125)
+        self.assertEqual(QuestCompletion.objects.filter(quest=quest).count(), 1)
+
+    def test_rewards_are_recorded_in_ledger(self):
+        """보상 골드/젬이 원장에 기록되고 원장 잔액이 캐릭터 잔액과 같은지 테스트"""
+        complete_quest(self.create_quest(self.user, self.template))
+
+        character = Character.objects.get(user=self.user)
+        self.assertEqual(currency_balances(self.user), {'gold': character.gold, 'gems': character.gems})
+        self.assertTrue(CurrencyTransaction.objects.filter(user=self.user, kind='quest', amount=25).exists())
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QuestAchievementTest(QuestTestMixin, TestCase):
+    """퀘스트 완료 시 업적 부여 테스트"""
+
+    def setUp(self):
+        self.addCleanup(invalidate_achievement_index)
+        self.user = self.create_user()
+        self.template = self.create_template()
+        self.first_quest = Achievement.objects.create(
+            name='첫 걸음',
+            description='첫 번째 퀘스트를 완료하세요',
+            requirement_type='quest_count',
+            requirement_value=1,
+            reward_gold=100,
+            reward_experience=80
+        )
+        self.level_two = Achievement.objects.create(
+            name='성장의 시작',
+            description='레벨 2를 달성하세요',
+            requirement_type='level',
+            requirement_value=2,
+            reward_gems=5
+        )
+
+    def test_completion_grants_crossed_achievements(self):
+        """임계값을 넘은 업적과 보상이 부여되는지 테스트"""
+        complete_quest(self.create_quest(self.user, self.template))
+
+        achieved = set(UserAchievement.objects.filter(user=self.user).values_list('achievement_id', flat=True))
+        self.assertEqual(achieved, {self.first_quest.pk, self.level_two.pk})
+
+        # 퀘스트 경험치 30 + 업적 경험치 80 → 레벨 2 달성 후 레벨 업적 보상까지 반영
+        character = Character.objects.get(user=self.user)
+        self.assertEqual(character.quests_completed, 1)
+        self.assertEqual(character.level, 2)
+        self.assertEqual(character.gold, 225)
+        self.assertEqual(character.gems, 7)
+
+    def test_achievement_is_granted_once(self):
+        """이미 넘은 임계값은 다시 부여되지 않는지 테스트"""
+        complete_quest(self.create_quest(self.user, self.template))
+        complete_quest(self.create_quest(self.user, self.template))
+
+        self.assertEqual(UserAchievement.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(Character.objects.get(user=self.user).gold, 250)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QuestCompletionTaskTest(QuestTestMixin, TestCase):
+    """퀘스트 완료 후처리 작업 테스트"""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.template = self.create_template()
+
+    def test_task_is_idempotent(self):
+        """작업이 재시도되어도 보상이 한 번만 지급되는지 테스트"""
+        quest = self.create_quest(self.user, self.template, status='completed', completed_date=timezone.now())
+
+        process_quest_completion(quest.pk, {'satisfaction_rating': 4})
+        process_quest_completion(quest.pk, {'satisfaction_rating': 4})
+
+        character = Character.objects.get(user=self.user)
+        self.assertEqual(character.gold, 125)
+        self.assertEqual(QuestCompletion.objects.filter(quest=quest).count(), 1)
+        self.assertEqual(DailyStreak.objects.get(user=self.user).current_streak, 1)
+
+    def test_stale_completion_sweep(self):
+        """재시도 한도를 넘겨 후처리되지 않은 완료 퀘스트를 주기 작업이 다시 처리하는지 테스트"""
+        quest = self.create_quest(self.user, self.template, status='completed', completed_date=timezone.now())
+        processed = self.create_quest(self.user, self.template, status='completed', completed_date=timezone.now())
+        process_quest_completion(processed.pk)
+
+        # 아직 정상 후처리 중일 수 있는 퀘스트는 건너뜀
+        self.assertEqual(process_stale_completions(), 0)
+
+        later = timezone.now() + timedelta(minutes=15)
+        self.assertEqual(process_stale_completions(later), 1)
+        self.assertEqual(process_stale_completions(later), 0)
+
+        self.assertTrue(QuestCompletion.objects.filter(quest=quest).exists())
+        self.assertEqual(Character.objects.get(user=self.user).gold, 150)
+
+    def test_task_skips_quest_not_completed(self):
+        """완료 상태가 아닌 퀘스트는 처리하지 않는지 테스트"""
+        quest = self.create_quest(self.user, self.template)
+
+        process_quest_completion(quest.pk)
+
+        self.assertFalse(QuestCompletion.objects.filter(quest=quest).exists())
+        self.assertEqual(Character.objects.get(user=self.user).gold, 100)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QuestCompleteAPITest(QuestTestMixin, APITestCase):
+    """퀘스트 완료 API 테스트"""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.template = self.create_template()
+        self.client.force_authenticate(user=self.user)
+
+    def test_complete_quest(self):
+        """퀘스트 완료 API 테스트"""
+        quest = self.create_quest(self.user, self.template)
+
+        response = self.client.post(
+            reverse('complete_quest', args=[quest.pk]),
+            data={'satisfaction_rating': 5},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['quest']['status'], 'completed')
+        self.assertEqual(response.json()['streak']['current_streak'], 1)
+
+    @override_settings(QUEST_REWARDS_ASYNC=True)
+    def test_complete_quest_async(self):
+        """비동기 모드에서는 상태만 바꾸고 후처리를 예약하는지 테스트"""
+        quest = self.create_quest(self.user, self.template)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(reverse('complete_quest', args=[quest.pk]), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        # 후처리 작업 예약 + 오늘의 퀘스트 요약 캐시 무효화
+        self.assertEqual(len(callbacks), 2)
+        quest.refresh_from_db()
+        self.assertEqual(quest.status, 'completed')
+        self.assertEqual(Character.objects.get(user=self.user).gold, 100)
+        self.assertFalse(QuestCompletion.objects.filter(quest=quest).exists())
+
+    def test_complete_assigned_quest_fails(self):
+        """시작하지 않은 퀘스트 완료 실패 테스트"""
+        quest = self.create_quest(self.user, self.template, status='assigned')
+
+        response = self.client.post(reverse('complete_quest', args=[quest.pk]), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QuestBatchCompleteAPITest(QuestTestMixin, APITestCase):
+    """퀘스트 일괄 완료 API 테스트"""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.template = self.create_template()
+        self.url = reverse('complete_quests_batch')
+        self.client.force_authenticate(user=self.user)
+
+    def test_batch_complete_aggregates_rewards(self):
+        """여러 퀘스트 보상이 합산되어 반영되는지 테스트"""
+        quests = [self.create_quest(self.user, self.template) for _ in range(3)]
+        payload = {'completions': [
+            {'quest_id': quest.pk, 'satisfaction_rating': 4} for quest in quests
+        ]}
+
+        response = self.client.post(self.url, data=payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data['completed_count'], 3)
+        self.assertEqual(data['rewards']['gold'], 75)
+
+        character = Character.objects.get(user=self.user)
+        self.assertEqual(character.gold, 175)
+        self.assertEqual(character.cardio, 16)
+        self.assertEqual(QuestCompletion.objects.filter(quest__user=self.user).count(), 3)
+        self.assertEqual(Quest.objects.filter(user=self.user, status='completed').count(), 3)
+
+    def test_batch_complete_reports_per_item_errors(self):
+        """잘못된 항목은 개별 오류로 응답하는지 테스트"""
+        quest = self.create_quest(self.user, self.template)
+        assigned = self.create_quest(self.user, self.template, status='assigned')
+        other_user = self.create_user(email='other@example.com', nickname='다른유저')
+        others_quest = self.create_quest(other_user, self.template)
+        payload = {'completions': [
+            {'quest_id': quest.pk},
+            {'quest_id': quest.pk},
+            {'quest_id': assigned.pk},
+            {'quest_id': others_quest.pk},
+            {'quest_id': quest.pk, 'difficulty_rating': 9},
+        ]}
+
+        response = self.client.post(self.url, data=payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        statuses = [result['status'] for result in response.json()['results']]
+        self.assertEqual(statuses, ['completed', 'error', 'error', 'error', 'error'])
+        self.assertEqual(Character.objects.get(user=self.user).gold, 125)
+
+    def test_batch_complete_uses_item_completion_dates(self):
+        """오프라인 완료 시각별로 기록되고 연속 기록이 날짜마다 반영되는지 테스트"""
+        now = timezone.now()
+        quests = [
+            self.create_quest(self.user, self.template, start_date=now - timedelta(days=3))
+            for _ in range(3)
+        ]
+        payload = {'completions': [
+            {'quest_id': quests[0].pk, 'completed_at': (now - timedelta(days=2)).isoformat()},
+            {'quest_id': quests[1].pk, 'completed_at': (now - timedelta(days=1)).isoformat()},
+            {'quest_id': quests[2].pk},
+        ]}
+
+        response = self.client.post(self.url, data=payload, format='json')
+
+        self.assertEqual(response.json()['completed_count'], 3)
+        self.assertEqual(response.json()['streak']['current_streak'], 3)
+        quests[0].refresh_from_db()
+        self.assertEqual(timezone.localdate(quests[0].completed_date), timezone.localdate(now - timedelta(days=2)))
+
+    def test_batch_complete_rejects_time_before_start(self):
+        """시작 전 시각으로 완료할 수 없는지 테스트"""
+        quest = self.create_quest(self.user, self.template)
+        payload = {'completions': [
+            {'quest_id': quest.pk, 'completed_at': (timezone.now() - timedelta(days=1)).isoformat()},
+        ]}
+
+        response = self.client.post(self.url, data=payload, format='json')
+
+        self.assertEqual(response.json()['results'][0]['status'], 'error')
+        self.assertEqual(Character.objects.get(user=self.user).gold, 100)
+
+    def test_batch_complete_after_expiry_sweep(self):
+        """마감 전에 오프라인으로 완료한 퀘스트는 만료 처리 이후에도 동기화되는지 테스트"""
+        now = timezone.now()
+        on_time, late = [
+            self.create_quest(
+                self.user, self.template, start_date=now - timedelta(hours=3), due_date=now - timedelta(hours=1)
+            )
+            for _ in range(2)
+        ]
+        self.assertEqual(expire_overdue_quests(now), 2)
+        payload = {'completions': [
+            {'quest_id': on_time.pk, 'completed_at': (now - timedelta(hours=2)).isoformat()},
+            {'quest_id': late.pk, 'completed_at': (now - timedelta(minutes=30)).isoformat()},
+        ]}
+
+        response = self.client.post(self.url, data=payload, format='json')
+
+        statuses = [result['status'] for result in response.json()['results']]
+        self.assertEqual(statuses, ['completed', 'error'])
+        on_time.refresh_from_db()
+        late.refresh_from_db()
+        self.assertEqual((on_time.status, late.status), ('completed', 'expired'))
+        self.assertEqual(Character.objects.get(user=self.user).gold, 125)
+
+    def test_batch_complete_writes_character_once(self):
+        """일괄 완료 시 캐릭터 행이 한 번만 갱신되는지 테스트"""
+        quests = [self.create_quest(self.user, self.template) for _ in range(5)]
+        payload = {'completions': [{'quest_id': quest.pk} for quest in quests]}
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(self.url, data=payload, format='json')
+
+        character_updates = [
+            q['sql'] for q in ctx.captured_queries
+            if q['sql'].startswith('UPDATE "characters"')
+        ]
+        self.assertEqual(len(character_updates), 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DailyQuestAssignmentTest(QuestTestMixin, TestCase):
+    """일일 퀘스트 할당 엔진 테스트"""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.easy = self.create_template(title='물 마시기', time_of_day='morning')
+        self.walk = self.create_template(title='산책하기', time_of_day='any')
+        self.expert = self.create_template(title='마라톤', required_level=10)
+
+    def test_assigns_quests_from_eligible_templates(self):
+        """레벨 조건에 맞는 템플릿으로 퀘스트가 생성되는지 테스트"""
+        result = assign_daily_quests(per_user=3)
+
+        quests = Quest.objects.filter(user=self.user)
+        self.assertEqual(result['quests'], 2)
+        self.assertEqual({quest.template_id for quest in quests}, {self.easy.pk, self.walk.pk})
+
+        quest = quests.get(template=self.walk)
+        self.assertEqual(quest.status, 'assigned')
+        self.assertEqual(quest.experience_reward, self.walk.base_experience)
+        self.assertEqual(quest.target_stats, self.walk.target_stats)
+        self.assertEqual(timezone.localdate(quest.due_date), timezone.localdate())
+
+    def test_assignment_is_idempotent(self):
+        """같은 날 다시 실행해도 중복 할당되지 않는지 테스트"""
+        assign_daily_quests()
+        result = assign_daily_quests()
+
+        self.assertEqual(result['quests'], 0)
+        self.assertEqual(Quest.objects.filter(user=self.user).count(), 2)
+
+    def test_filters_and_partitions(self):
+        """시간대 필터와 사용자 파티션 분할 테스트"""
+        other = self.create_user(email='other@example.com', nickname='다른유저')
+
+        assign_daily_quests(time_of_day='evening', partition=self.user.pk % 2, partitions=2)
+
+        self.assertEqual(
+            list(Quest.objects.filter(user=self.user).values_list('template_id', flat=True)),
+            [self.walk.pk]
+        )
+        self.assertFalse(Quest.objects.filter(user=other).exists())
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QuestExpiryTest(QuestTestMixin, TestCase):
+    """퀘스트 만료 스위퍼 테스트"""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.template = self.create_template()
+
+    def test_expires_only_overdue_active_quests(self):
+        """마감이 지난 진행 중 퀘스트만 만료되는지 테스트"""
+        past = timezone.now() - timedelta(hours=1)
+        overdue = [
+            self.create_quest(self.user, self.template, status='assigned', due_date=past),
+            self.create_quest(self.user, self.template, status='in_progress', due_date=past),
+            self.create_quest(self.user, self.template, status='assigned', due_date=past),
+        ]
+        completed = self.create_quest(self.user, self.template, status='completed', due_date=past)
+        upcoming = self.create_quest(self.user, self.template, status='assigned')
+
+        expired = expire_overdue_quests(chunk_size=2)
+
+        self.assertEqual(expired, 3)
+        self.assertEqual(
+            set(Quest.objects.filter(status='expired').values_list('id', flat=True)),
+            {quest.pk for quest in overdue}
+        )
+        completed.refresh_from_db()
+        upcoming.refresh_from_db()
+        self.assertEqual(completed.status, 'completed')
+        self.assertEqual(upcoming.status, 'assigned')
+        self.assertEqual(expire_overdue_quests(), 0)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QuestCompactListAPITest(QuestTestMixin, APITestCase):
+    """퀘스트 목록 compact 모드 테스트"""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.client.force_authenticate(user=self.user)
+        self.walk = self.create_template(title='산책하기')
+        self.stretch = self.create_template(title='스트레칭')
+        for template in (self.walk, self.walk, self.stretch, self.walk):
+            self.create_quest(self.user, template, status='assigned')
+
+    def test_compact_list_side_loads_templates(self):
+        """템플릿이 id로 참조되고 응답에 한 번씩만 포함되는지 테스트"""
+        response = self.client.get(reverse('quest_list'), {'compact': 'true'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(len(data['results']), 4)
+        self.assertNotIn('template', data['results'][0])
+        self.assertEqual(set(data['templates']), {str(self.walk.pk), str(self.stretch.pk)})
+        self.assertEqual(data['templates'][str(self.walk.pk)]['title'], '산책하기')
+
+    def test_list_query_count_does_not_grow_with_page(self):
+        """목록 조회 쿼리 수가 퀘스트 수에 비례하지 않는지 테스트"""
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(reverse('quest_list'), {'compact': 'true'})
+        compact_queries = len(ctx.captured_queries)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(reverse('quest_list'))
+
+        self.assertLessEqual(compact_queries, 3)
+        self.assertLessEqual(len(ctx.captured_queries), 3)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TemplateCatalogTest(QuestTestMixin, TestCase):
+    """템플릿 카탈로그 캐시 테스트"""
+
+    def setUp(self):
+        self.template = self.create_template(title='산책하기')
+
+    def test_lookup_does_not_query_database(self):
+        """카탈로그가 로드된 뒤에는 템플릿 조회에 쿼리가 없는지 테스트"""
+        template_catalog.get(self.template.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(template_catalog.get(self.template.pk).title, '산책하기')
+            self.assertEqual(len(template_catalog.active()), 1)
+
+    def test_version_bump_reloads_catalog(self):
+        """버전이 올라가면 변경된 템플릿을 다시 읽는지 테스트"""
+        template_catalog.get(self.template.pk)
+        QuestTemplate.objects.filter(pk=self.template.pk).update(title='빠르게 걷기')
+        self.assertEqual(template_catalog.get(self.template.pk).title, '산책하기')
+
+        bump_catalog_version()
+
+        self.assertEqual(template_catalog.get(self.template.pk).title, '빠르게 걷기')
+
+    def test_template_save_bumps_version_on_commit(self):
+        """관리자 외 경로의 템플릿 저장도 커밋 이후 카탈로그를 무효화하는지 테스트"""
+        template_catalog.get(self.template.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.template.title = '빠르게 걷기'
+            self.template.save()
+
+        self.assertEqual(template_catalog.get(self.template.pk).title, '빠르게 걷기')
+
+    def test_cache_outage_falls_back_to_database(self):
+        """Redis 장애 중에도 카탈로그를 DB에서 읽는지 테스트"""
+        template_catalog.clear()
+
+        with mock.patch.object(cache, 'get', side_effect=redis.ConnectionError):
+            self.assertEqual(template_catalog.get(self.template.pk).title, '산책하기')
+            self.assertEqual(len(template_catalog.active()), 1)
+
+    def test_new_template_found_before_bump(self):
+        """카탈로그에 없는 새 템플릿은 DB에서 읽어오는지 테스트"""
+        template_catalog.get(self.template.pk)
+        new_template = QuestTemplate.objects.create(
+            title='스트레칭', description='10분간 스트레칭하세요.', category='morning'
+        )
+
+        self.assertEqual(template_catalog.get(new_template.pk).title, '스트레칭')
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DailyQuestSummaryAPITest(QuestTestMixin, APITestCase):
+    """오늘의 퀘스트 요약 API 테스트"""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.template = self.create_template()
+        self.client.force_authenticate(user=self.user)
+        self.due_date = day_bounds(timezone.localdate())[1] - timedelta(minutes=1)
+        self.quest = self.create_quest(self.user, self.template, status='assigned', due_date=self.due_date)
+        self.create_quest(self.user, self.template, status='completed', due_date=self.due_date)
+        self.create_quest(self.user, self.template, status='assigned', due_date=self.due_date + timedelta(days=2))
+
+    def test_summary_counts_today_by_status(self):
+        """오늘 마감 퀘스트 목록과 상태별 개수를 쿼리 한 번으로 읽는지 테스트"""
+        with self.assertNumQueries(1):
+            quests, counts = load_daily_quests(self.user, timezone.localdate())
+
+        self.assertEqual(quests, [self.quest])
+        self.assertEqual(counts, {'total_count': 1, 'completed_count': 1})
+
+    def test_cached_summary_skips_database(self):
+        """두 번째 요청은 캐시에서 응답하는지 테스트"""
+        first = self.client.get(reverse('daily_quests'))
+        with self.assertNumQueries(0):
+            second = self.client.get(reverse('daily_quests'))
+
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(len(first.json()['quests']), 1)
+        self.assertEqual(first.json()['completed_count'], 1)
+
+    def test_state_change_invalidates_summary(self):
+        """퀘스트를 시작하면 캐시된 요약이 갱신되는지 테스트"""
+        self.client.get(reverse('daily_quests'))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('start_quest', args=[self.quest.pk]))
+        response = self.client.get(reverse('daily_quests'))
+
+        self.assertEqual(response.json()['quests'][0]['status'], 'in_progress')
+
+    def test_redis_outage_falls_back_to_database(self):
+        """Redis 장애 중에도 퀘스트 변경이 실패하지 않고 요약을 DB에서 읽는지 테스트"""
+        with mock.patch.object(cache, 'delete_many', side_effect=redis.ConnectionError), \
+                self.assertLogs('apps.quests.summary', level='ERROR'):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.create_quest(self.user, self.template, status='assigned', due_date=self.due_date)
+
+        with mock.patch.object(cache, 'get', side_effect=redis.ConnectionError):
+            response = self.client.get(reverse('daily_quests'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['total_count'], 2)
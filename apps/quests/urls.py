@@ -6,6 +6,7 @@ urlpatterns = [
     path('<int:pk>/', views.QuestDetailView.as_view(), name='quest_detail'),
     path('<int:quest_id>/start/', views.start_quest_view, name='start_quest'),
     path('<int:quest_id>/complete/', views.complete_quest_view, name='complete_quest'),
+    path('complete-batch/', views.complete_quests_batch_view, name='complete_quests_batch'),
     path('daily/', views.daily_quests_view, name='daily_quests'),
     path('streak/', views.user_streak_view, name='user_streak'),
     path('completions/', views.QuestCompletionHistoryView.as_view(), name='quest_completions'),
@@ -1,18 +1,69 @@
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
-from datetime import timedelta
 from .models import Quest, QuestTemplate, QuestCompletion, DailyStreak
 from .serializers import (
     QuestSerializer, QuestTemplateSerializer, QuestCompletionSerializer,
-    DailyStreakSerializer, QuestStartSerializer, QuestCompleteSerializer
+    DailyStreakSerializer, QuestStartSerializer, QuestCompleteSerializer,
+    QuestBatchCompleteSerializer, QuestBatchCompleteItemSerializer,
+    QuestCompactSerializer, QuestCompletionCompactSerializer
 )
+from .catalog import template_catalog
+from .summary import get_daily_summary
+from .services import complete_quest, complete_quest_async, complete_quests, QuestNotCompletable
 
+COMPLETION_FIELDS = ('difficulty_rating', 'satisfaction_rating', 'user_notes')
 
-class QuestListView(generics.ListAPIView):
+
+def is_compact(request):
+    """?compact=true 요청 여부 (템플릿을 id로 참조하고 응답에 한 번만 포함)"""
+    return request.query_params.get('compact', '').lower() in ('1', 'true')
+
+
+def side_load_templates(quests):
+    """퀘스트 목록에서 중복을 제거한 템플릿 맵 {template_id: template} (카탈로그에서 조회)"""
+    return {
+        str(template_id): QuestTemplateSerializer(template_catalog.get(template_id)).data
+        for template_id in {quest.template_id for quest in quests}
+    }
+
+
+class CompactQuestListMixin:
+    """compact 모드에서 템플릿을 side-load 하는 목록 뷰 믹스인"""
+    compact_serializer_class = None
+
+    def get_serializer_class(self):
+        if is_compact(self.request):
+            return self.compact_serializer_class
+        return super().get_serializer_class()
+
+    def get_quests(self, objects):
+        return objects
+
+    def list(self, request, *args, **kwargs):
+        if not is_compact(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        objects = page if page is not None else list(queryset)
+        data = self.get_serializer(objects, many=True).data
+
+        if page is not None:
+            response = self.get_paginated_response(data)
+        else:
+            response = Response({'results': data})
+        response.data['templates'] = side_load_templates(self.get_quests(objects))
+        return response
+
+
+class QuestListView(CompactQuestListMixin, generics.ListAPIView):
     """사용자 퀘스트 목록 조회"""
     serializer_class = QuestSerializer
+    compact_serializer_class = QuestCompactSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
@@ -66,7 +117,7 @@ def start_quest_view(request, quest_id):
 def complete_quest_view(request, quest_id):
     """퀘스트 완료"""
     try:
-        quest = Quest.objects.get(id=quest_id, user=request.user)
+        quest = Quest.objects.select_related('user').get(id=quest_id, user=request.user)
         
         if quest.status != 'in_progress':
             return Response(
@@ -82,26 +133,30 @@ def complete_quest_view(request, quest_id):
             if serializer.validated_data.get('verification_note'):
                 quest.verification_note = serializer.validated_data['verification_note']
             
-            quest.complete_quest()
-            
-            # 완료 기록 생성
+            # 완료 기록 데이터
             completion_data = {
-                'difficulty_rating': serializer.validated_data.get('difficulty_rating'),
-                'satisfaction_rating': serializer.validated_data.get('satisfaction_rating'),
-                'user_notes': serializer.validated_data.get('user_notes'),
+                field: serializer.validated_data[field]
+                for field in COMPLETION_FIELDS
+                if field in serializer.validated_data
             }
             
-            if quest.start_date:
-                completion_data['actual_duration'] = timezone.now() - quest.start_date
-            
-            QuestCompletion.objects.create(
-                quest=quest,
-                **completion_data
-            )
-            
-            # 연속 완료 기록 업데이트
-            streak, created = DailyStreak.objects.get_or_create(user=request.user)
-            streak.update_streak(timezone.now().date())
+            try:
+                if settings.QUEST_REWARDS_ASYNC:
+                    # 상태 변경만 커밋하고 보상/기록 처리는 Celery 작업으로 위임
+                    complete_quest_async(quest, completion_data)
+                    return Response({
+                        'message': '퀘스트를 완료했습니다! 보상이 곧 지급됩니다.',
+                        'quest': QuestSerializer(quest).data,
+                        'streak': None
+                    }, status=status.HTTP_202_ACCEPTED)
+                
+                # 상태 변경, 보상 지급, 완료 기록, 연속 기록을 한 트랜잭션으로 처리
+                streak = complete_quest(quest, completion_data)
+            except QuestNotCompletable:
+                return Response(
+                    {'error': '완료할 수 없는 퀘스트입니다.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
             
             return Response({
                 'message': '퀘스트를 완료했습니다!',
@@ -118,27 +173,93 @@ def complete_quest_view(request, quest_id):
         )
 
 
-@api_view(['GET'])
+@api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
-def daily_quests_view(request):
-    """오늘의 퀘스트 조회"""
-    today = timezone.now().date()
-    tomorrow = today + timedelta(days=1)
+def complete_quests_batch_view(request):
+    """퀘스트 일괄 완료 (오프라인에서 쌓인 완료 요청 재전송용)"""
+    batch_serializer = QuestBatchCompleteSerializer(data=request.data)
+    batch_serializer.is_valid(raise_exception=True)
     
-    quests = Quest.objects.filter(
-        user=request.user,
-        due_date__date=today,
-        status__in=['assigned', 'in_progress']
-    )
+    # 항목별 검증 (잘못된 항목은 개별 오류로 응답)
+    results = []
+    valid_items = []
+    for item in batch_serializer.validated_data['completions']:
+        serializer = QuestBatchCompleteItemSerializer(data=item)
+        if serializer.is_valid():
+            result = {'quest_id': serializer.validated_data['quest_id'], 'status': 'pending'}
+            valid_items.append((result, serializer.validated_data))
+        else:
+            result = {'quest_id': item.get('quest_id'), 'status': 'error', 'errors': serializer.errors}
+        results.append(result)
     
+    with transaction.atomic():
+        # 대상 퀘스트를 한 번의 쿼리로 조회하고 잠금
+        quest_ids = [item['quest_id'] for _, item in valid_items]
+        quests = Quest.objects.select_for_update().filter(
+            user=request.user,
+            id__in=quest_ids
+        ).in_bulk()
+        
+        to_complete = []
+        seen = set()
+        for result, item in valid_items:
+            quest = quests.get(item['quest_id'])
+            if quest is None:
+                result.update(status='error', error='퀘스트를 찾을 수 없습니다.')
+            elif quest.pk in seen or not quest.is_completable(item.get('completed_at')):
+                result.update(status='error', error='완료할 수 없는 퀘스트입니다.')
+            elif item.get('completed_at') and quest.start_date and item['completed_at'] < quest.start_date:
+                result.update(status='error', error='완료 시각이 시작 시각보다 빠릅니다.')
+            else:
+                seen.add(quest.pk)
+                if item.get('completed_at'):
+                    # 오프라인 완료는 실제 완료 시각으로 기록 (연속 기록도 그날 기준)
+                    quest.completed_date = item['completed_at']
+                if item.get('verification_note'):
+                    quest.verification_note = item['verification_note']
+                completion_data = {field: item[field] for field in COMPLETION_FIELDS if field in item}
+                to_complete.append((quest, completion_data))
+                result['status'] = 'completed'
+        
+        streak = None
+        if to_complete:
+            # 보상은 합산되어 캐릭터 행에 한 번만 반영
+            streak = complete_quests(request.user, to_complete)
+    
+    completed = [quest for quest, _ in to_complete]
     return Response({
-        'date': today,
-        'quests': QuestSerializer(quests, many=True).data,
-        'total_count': quests.count(),
-        'completed_count': quests.filter(status='completed').count()
+        'message': f'{len(completed)}개의 퀘스트를 완료했습니다.',
+        'completed_count': len(completed),
+        'failed_count': len(results) - len(completed),
+        'results': results,
+        'rewards': {
+            'experience': sum(quest.experience_reward for quest in completed),
+            'gold': sum(quest.gold_reward for quest in completed),
+            'gems': sum(quest.gems_reward for quest in completed),
+        },
+        'streak': DailyStreakSerializer(streak).data if streak else None
     })
 
 
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def daily_quests_view(request):
+    """오늘의 퀘스트 조회 (사용자/날짜별 캐시)"""
+    today = timezone.localdate()
+
+    if is_compact(request):
+        summary = get_daily_summary(request.user, today, 'compact', lambda quests: {
+            'quests': QuestCompactSerializer(quests, many=True).data,
+            'templates': side_load_templates(quests),
+        })
+    else:
+        summary = get_daily_summary(request.user, today, 'full', lambda quests: {
+            'quests': QuestSerializer(quests, many=True).data,
+        })
+
+    return Response(summary)
+
+
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def user_streak_view(request):
@@ -147,19 +268,25 @@ def user_streak_view(request):
     return Response(DailyStreakSerializer(streak).data)
 
 
-class QuestCompletionHistoryView(generics.ListAPIView):
+class QuestCompletionHistoryView(CompactQuestListMixin, generics.ListAPIView):
     """퀘스트 완료 기록 조회"""
     serializer_class = QuestCompletionSerializer
+    compact_serializer_class = QuestCompletionCompactSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         return QuestCompletion.objects.filter(
             quest__user=self.request.user
-        ).order_by('-completion_time')
+        ).select_related('quest').order_by('-completion_time')
+
+    def get_quests(self, objects):
+        return [completion.quest for completion in objects]
 
 
 class QuestTemplateListView(generics.ListAPIView):
     """퀘스트 템플릿 목록 (관리자용)"""
     serializer_class = QuestTemplateSerializer
     permission_classes = [permissions.IsAdminUser]
-    queryset = QuestTemplate.objects.filter(is_active=True)
\ No newline at end of file
+
+    def get_queryset(self):
+        return sorted(template_catalog.active(), key=lambda template: template.pk)
\ No newline at end of file
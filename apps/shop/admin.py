@@ -0,0 +1,18 @@
+from django.contrib import admin
+from .models import ShopItem, InventoryItem
+
+
+@admin.register(ShopItem)
+class ShopItemAdmin(admin.ModelAdmin):
+    list_display = ('name', 'category', 'price', 'stock', 'is_stackable', 'is_active')
+    list_filter = ('category', 'is_stackable', 'is_active')
+    search_fields = ('name', 'description')
+    readonly_fields = ('created_at', 'updated_at')
+
+
+@admin.register(InventoryItem)
+class InventoryItemAdmin(admin.ModelAdmin):
+    list_display = ('user', 'item', 'quantity', 'acquired_at')
+    list_filter = ('item__category', 'acquired_at')
+    search_fields = ('user__nickname', 'item__name')
+    readonly_fields = ('acquired_at', 'updated_at')
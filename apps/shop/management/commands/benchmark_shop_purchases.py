@@ -0,0 +1,104 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.db.models import Sum
+
+from apps.characters.ledger import record_opening_balances
+from apps.characters.models import Character, CurrencyTransaction
+from apps.shop.models import InventoryItem, ShopItem
+from apps.shop.services import OutOfStock, PurchaseError, purchase_item
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = '한정 수량 아이템에 동시 구매를 몰아 초과 판매가 없는지 검증하고 처리량 측정'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--buyers', type=int, default=300, help='동시 구매자 수')
+        parser.add_argument('--stock', type=int, default=100, help='아이템 재고')
+        parser.add_argument('--price', type=int, default=50, help='아이템 가격 (구매자 골드는 기본 100)')
+        parser.add_argument('--threads', type=int, default=32, help='동시 실행 스레드 수')
+        parser.add_argument('--keep', action='store_true', help='벤치마크 데이터를 지우지 않음')
+
+    def handle(self, *args, **options):
+        if connection.vendor == 'sqlite':
+            # SQLite는 쓰기마다 DB 전체를 잠가 동시성 측정이 의미가 없고 잠금 오류가 난다
+            raise CommandError('PostgreSQL에서 실행해주세요.')
+
+        buyers = options['buyers']
+        stock = options['stock']
+
+        run_id = int(time.time())
+        item = ShopItem.objects.create(
+            name=f'벤치마크 한정 아이템 {run_id}', category='consumable',
+            price=options['price'], stock=stock, is_stackable=True
+        )
+        users = User.objects.bulk_create([
+            User(
+                email=f'shop-bench-{run_id}-{index}@example.com',
+                username=f'shop-bench-{run_id}-{index}',
+                nickname=f'벤치{run_id}-{index}',
+            )
+            for index in range(buyers)
+        ])
+        # bulk_create는 저장 시그널을 보내지 않으므로 캐릭터와 기초 잔액을 직접 생성
+        Character.objects.bulk_create([Character(user=user, name=user.nickname) for user in users])
+        record_opening_balances([user.pk for user in users])
+
+        def buy(user):
+            try:
+                # 같은 사용자가 두 번 눌러도 한 번만 결제되는지 함께 확인
+                results = []
+                for _ in range(2):
+                    try:
+                        purchase_item(user, item)
+                        results.append('ok')
+                    except OutOfStock:
+                        results.append('sold_out')
+                    except PurchaseError:
+                        results.append('rejected')
+                return results
+            finally:
+                connections.close_all()
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=options['threads']) as executor:
+            outcomes = [result for results in executor.map(buy, users) for result in results]
+        elapsed = time.monotonic() - started
+
+        sold = outcomes.count('ok')
+        item.refresh_from_db()
+        owned = InventoryItem.objects.filter(item=item).aggregate(total=Sum('quantity'))['total'] or 0
+        characters = Character.objects.filter(user__in=users)
+        negative_gold = characters.filter(gold__lt=0).count()
+        spent = 100 * buyers - (characters.aggregate(total=Sum('gold'))['total'] or 0)
+
+        checks = {
+            '판매 수 <= 재고': sold <= stock,
+            '남은 재고 = 재고 - 판매 수': item.stock == stock - sold,
+            '인벤토리 합계 = 판매 수': owned == sold,
+            '차감 골드 = 판매 수 x 가격': spent == sold * item.price,
+            '골드 음수 없음': negative_gold == 0,
+        }
+        for label, passed in checks.items():
+            style = self.style.SUCCESS if passed else self.style.ERROR
+            self.stdout.write(style(f'{"OK" if passed else "FAIL"} {label}'))
+
+        if not options['keep']:
+            InventoryItem.objects.filter(item=item).delete()
+            CurrencyTransaction.objects.filter(user__in=users).delete()
+            User.objects.filter(pk__in=[user.pk for user in users]).delete()
+            item.delete()
+
+        attempts = len(outcomes)
+        summary = (
+            f'구매 시도 {attempts}건: 성공 {sold}, 품절 {outcomes.count("sold_out")}, '
+            f'거절 {outcomes.count("rejected")} ({elapsed:.2f}초, {attempts / elapsed:.0f}건/초)'
+        )
+        if not all(checks.values()):
+            raise CommandError(summary)
+        self.stdout.write(self.style.SUCCESS(summary))
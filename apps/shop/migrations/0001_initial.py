@@ -0,0 +1,55 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:53
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShopItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('description', models.TextField(blank=True)),
+                ('category', models.CharField(choices=[('skin', '캐릭터 스킨'), ('consumable', '소모품'), ('decoration', '꾸미기')], default='skin', max_length=20)),
+                ('price', models.PositiveIntegerField(help_text='골드 가격')),
+                ('skin', models.CharField(blank=True, max_length=50)),
+                ('stock', models.PositiveIntegerField(blank=True, null=True)),
+                ('is_stackable', models.BooleanField(default=False, help_text='여러 개 보유 가능 여부')),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '상점 아이템',
+                'verbose_name_plural': '상점 아이템들',
+                'db_table': 'shop_items',
+            },
+        ),
+        migrations.CreateModel(
+            name='InventoryItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.PositiveIntegerField(default=1)),
+                ('acquired_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='shop.shopitem')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inventory', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '보유 아이템',
+                'verbose_name_plural': '보유 아이템들',
+                'db_table': 'inventory_items',
+                'unique_together': {('user', 'item')},
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+from django.db import models
+from django.conf import settings
+
+
+class ShopItem(models.Model):
+    """골드로 구매할 수 있는 상점 아이템"""
+    name = models.CharField(max_length=100, unique=True)
+    description = models.TextField(blank=True)
+    category = models.CharField(
+        max_length=20,
+        choices=[
+            ('skin', '캐릭터 스킨'),
+            ('consumable', '소모품'),
+            ('decoration', '꾸미기'),
+        ],
+        default='skin'
+    )
+    price = models.PositiveIntegerField(help_text="골드 가격")
+
+    # 스킨 아이템이면 장착 시 Character.skin에 들어갈 값
+    skin = models.CharField(max_length=50, blank=True)
+
+    # 한정 수량 (비어 있으면 무제한)
+    stock = models.PositiveIntegerField(null=True, blank=True)
+    is_stackable = models.BooleanField(default=False, help_text="여러 개 보유 가능 여부")
+    is_active = models.BooleanField(default=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'shop_items'
+        verbose_name = '상점 아이템'
+        verbose_name_plural = '상점 아이템들'
+
+    def __str__(self):
+        return f"{self.name} ({self.price}G)"
+
+
+class InventoryItem(models.Model):
+    """사용자가 보유한 아이템"""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='inventory')
+    item = models.ForeignKey(ShopItem, on_delete=models.PROTECT)
+    quantity = models.PositiveIntegerField(default=1)
+    acquired_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'inventory_items'
+        verbose_name = '보유 아이템'
+        verbose_name_plural = '보유 아이템들'
+        unique_together = ('user', 'item')
+
+    def __str__(self):
+        return f"{self.user.nickname} - {self.item.name} x{self.quantity}"
@@ -0,0 +1,29 @@
+from rest_framework import serializers
+from .models import ShopItem, InventoryItem
+
+
+class ShopItemSerializer(serializers.ModelSerializer):
+    sold_out = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ShopItem
+        fields = (
+            'id', 'name', 'description', 'category', 'price', 'skin',
+            'stock', 'is_stackable', 'sold_out'
+        )
+
+    def get_sold_out(self, obj):
+        return obj.stock == 0
+
+
+class InventoryItemSerializer(serializers.ModelSerializer):
+    item = ShopItemSerializer(read_only=True)
+
+    class Meta:
+        model = InventoryItem
+        fields = ('id', 'item', 'quantity', 'acquired_at')
+
+
+class PurchaseSerializer(serializers.Serializer):
+    """아이템 구매 요청"""
+    quantity = serializers.IntegerField(min_value=1, max_value=99, default=1)
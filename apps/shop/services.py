@@ -0,0 +1,72 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.characters.ledger import currency_entries, record_transactions
+from apps.characters.models import Character
+from .models import InventoryItem, ShopItem
+
+
+class PurchaseError(Exception):
+    """구매할 수 없는 요청"""
+    message = '구매할 수 없습니다.'
+
+
+class OutOfStock(PurchaseError):
+    message = '품절된 아이템입니다.'
+
+
+class InsufficientGold(PurchaseError):
+    message = '골드가 부족합니다.'
+
+
+class AlreadyOwned(PurchaseError):
+    message = '이미 보유한 아이템입니다.'
+
+
+def purchase_item(user, item, quantity=1):
+    """아이템 구매 (재고 차감, 골드 차감, 인벤토리 반영을 한 트랜잭션으로 처리)
+
+    재고와 골드는 조건부 UPDATE(stock >= 수량, gold >= 가격)로 차감하므로 행을 미리
+    잠그지 않아도 동시 구매에서 재고나 골드가 음수가 되지 않는다. 조건을 만족하지
+    못하면 예외로 트랜잭션 전체를 되돌린다.
+    """
+    if not item.is_stackable and (
+        quantity > 1 or InventoryItem.objects.filter(user=user, item=item).exists()
+    ):
+        raise AlreadyOwned(item.pk)
+    cost = item.price * quantity
+    now = timezone.now()
+
+    with transaction.atomic():
+        if item.stock is not None:
+            updated = ShopItem.objects.filter(pk=item.pk, stock__gte=quantity).update(
+                stock=F('stock') - quantity, updated_at=now
+            )
+            if not updated:
+                raise OutOfStock(item.pk)
+
+        # 골드 차감 UPDATE가 캐릭터 행을 잠그므로 같은 사용자의 구매는 여기서부터 직렬화된다
+        debited = Character.objects.filter(user=user, gold__gte=cost).update(
+            gold=F('gold') - cost, updated_at=now
+        )
+        if not debited:
+            raise InsufficientGold(item.pk)
+
+        owned = InventoryItem.objects.filter(user=user, item=item)
+        if item.is_stackable and owned.update(quantity=F('quantity') + quantity, updated_at=now):
+            inventory = owned.get()
+        elif owned.exists():
+            # 사전 확인과 골드 차감 사이에 다른 요청이 먼저 구매한 경우
+            raise AlreadyOwned(item.pk)
+        else:
+            inventory = InventoryItem.objects.create(user=user, item=item, quantity=quantity)
+
+        record_transactions(currency_entries(user.pk, 'purchase', f"구매: {item.name}", gold=-cost))
+
+    return inventory
+
+
+def equip_skin(user, inventory_item):
+    """보유한 스킨 아이템을 캐릭터에 적용"""
+    Character.objects.filter(user=user).update(skin=inventory_item.item.skin, updated_at=timezone.now())
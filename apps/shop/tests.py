@@ -0,0 +1,97 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.characters.ledger import currency_balances
+from apps.characters.models import Character
+from .models import ShopItem, InventoryItem
+from .services import AlreadyOwned, InsufficientGold, OutOfStock, purchase_item
+
+User = get_user_model()
+
+
+class PurchaseServiceTest(TestCase):
+    """아이템 구매 서비스 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            username='testuser',
+            nickname='테스트유저',
+            password='testpass123'
+        )
+        self.character = Character.create_for_user(self.user)
+        self.skin = ShopItem.objects.create(name='전사 스킨', price=60, skin='warrior')
+        self.potion = ShopItem.objects.create(
+            name='회복 물약', category='consumable', price=10, stock=3, is_stackable=True
+        )
+
+    def test_purchase_debits_gold_and_records_ledger(self):
+        """구매 시 골드가 차감되고 원장에 기록되는지 테스트"""
+        inventory = purchase_item(self.user, self.skin)
+
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.gold, 40)
+        self.assertEqual(inventory.quantity, 1)
+        self.assertEqual(currency_balances(self.user)['gold'], 40)
+
+    def test_insufficient_gold_rolls_back_stock(self):
+        """골드가 부족하면 재고 차감도 되돌리는지 테스트"""
+        Character.objects.filter(pk=self.character.pk).update(gold=5)
+
+        with self.assertRaises(InsufficientGold):
+            purchase_item(self.user, self.potion)
+
+        self.potion.refresh_from_db()
+        self.assertEqual(self.potion.stock, 3)
+        self.assertFalse(InventoryItem.objects.exists())
+
+    def test_stock_never_goes_negative(self):
+        """재고보다 많이 살 수 없는지 테스트"""
+        purchase_item(self.user, self.potion, quantity=2)
+        with self.assertRaises(OutOfStock):
+            purchase_item(self.user, self.potion, quantity=2)
+        purchase_item(self.user, self.potion)
+
+        self.potion.refresh_from_db()
+        self.assertEqual(self.potion.stock, 0)
+        self.assertEqual(InventoryItem.objects.get(user=self.user, item=self.potion).quantity, 3)
+
+    def test_non_stackable_item_bought_once(self):
+        """중복 보유 불가 아이템은 한 번만 결제되는지 테스트"""
+        purchase_item(self.user, self.skin)
+        with self.assertRaises(AlreadyOwned):
+            purchase_item(self.user, self.skin)
+
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.gold, 40)
+
+
+class ShopAPITest(APITestCase):
+    """상점 API 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            username='testuser',
+            nickname='테스트유저',
+            password='testpass123'
+        )
+        Character.create_for_user(self.user)
+        self.skin = ShopItem.objects.create(name='전사 스킨', price=60, skin='warrior')
+        self.client.force_authenticate(user=self.user)
+
+    def test_purchase_and_equip(self):
+        """구매 후 스킨 장착 테스트"""
+        response = self.client.post(reverse('purchase_item', args=[self.skin.id]))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['gold'], 40)
+
+        response = self.client.post(reverse('purchase_item', args=[self.skin.id]))
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        inventory_item = InventoryItem.objects.get(user=self.user)
+        response = self.client.post(reverse('equip_item', args=[inventory_item.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Character.objects.get(user=self.user).skin, 'warrior')
@@ -0,0 +1,9 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('items/', views.ShopItemListView.as_view(), name='shop_items'),
+    path('items/<int:item_id>/purchase/', views.purchase_item_view, name='purchase_item'),
+    path('inventory/', views.InventoryListView.as_view(), name='inventory'),
+    path('inventory/<int:inventory_id>/equip/', views.equip_item_view, name='equip_item'),
+]
@@ -0,0 +1,80 @@
+from rest_framework import generics, permissions, status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from apps.characters.models import Character
+from .models import ShopItem, InventoryItem
+from .serializers import ShopItemSerializer, InventoryItemSerializer, PurchaseSerializer
+from .services import PurchaseError, equip_skin, purchase_item
+
+
+class ShopItemListView(generics.ListAPIView):
+    """판매 중인 아이템 목록"""
+    serializer_class = ShopItemSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        queryset = ShopItem.objects.filter(is_active=True)
+
+        category = self.request.query_params.get('category')
+        if category:
+            queryset = queryset.filter(category=category)
+
+        return queryset.order_by('category', 'price', 'id')
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def purchase_item_view(request, item_id):
+    """아이템 구매"""
+    serializer = PurchaseSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    try:
+        item = ShopItem.objects.get(id=item_id, is_active=True)
+        inventory = purchase_item(request.user, item, serializer.validated_data['quantity'])
+    except ShopItem.DoesNotExist:
+        return Response(
+            {'error': '아이템을 찾을 수 없습니다.'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    except PurchaseError as exc:
+        return Response({'error': exc.message}, status=status.HTTP_409_CONFLICT)
+
+    return Response({
+        'message': '구매했습니다.',
+        'inventory_item': InventoryItemSerializer(inventory).data,
+        'gold': Character.objects.filter(user=request.user).values_list('gold', flat=True).get(),
+    }, status=status.HTTP_201_CREATED)
+
+
+class InventoryListView(generics.ListAPIView):
+    """보유 아이템 목록"""
+    serializer_class = InventoryItemSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return InventoryItem.objects.filter(
+            user=self.request.user
+        ).select_related('item').order_by('-acquired_at')
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def equip_item_view(request, inventory_id):
+    """보유한 스킨 장착"""
+    try:
+        inventory_item = InventoryItem.objects.select_related('item').get(id=inventory_id, user=request.user)
+    except InventoryItem.DoesNotExist:
+        return Response(
+            {'error': '보유하지 않은 아이템입니다.'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    if inventory_item.item.category != 'skin':
+        return Response(
+            {'error': '장착할 수 없는 아이템입니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    equip_skin(request.user, inventory_item)
+    return Response({'message': '스킨을 장착했습니다.', 'skin': inventory_item.item.skin})
@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 from decouple import config
 from datetime import timedelta
+from celery.schedules import crontab
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -34,6 +35,8 @@ LOCAL_APPS = [
     'apps.accounts',
     'apps.characters',
     'apps.quests',
+    'apps.shop',
+    'apps.images',
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -45,6 +48,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apps.characters.middleware.CharacterMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -170,5 +174,40 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+CELERY_BEAT_SCHEDULE = {
+    # 매일 자정 직후 사용자별 일일 퀘스트 할당
+    'assign-daily-quests': {
+        'task': 'apps.quests.tasks.assign_daily_quests_task',
+        'schedule': crontab(hour=0, minute=5),
+    },
+    # 마감이 지난 퀘스트 만료 처리
+    'expire-overdue-quests': {
+        'task': 'apps.quests.tasks.expire_overdue_quests_task',
+        'schedule': crontab(minute='*/5'),
+    },
+    # 재시도 한도를 넘겨 보상이 지급되지 않은 완료 퀘스트 재처리
+    'process-stale-completions': {
+        'task': 'apps.quests.tasks.process_stale_completions_task',
+        'schedule': crontab(minute='*/10'),
+    },
+    # 스탯 백분위 조회용 히스토그램 갱신
+    'build-stat-histograms': {
+        'task': 'apps.characters.tasks.build_stat_histograms_task',
+        'schedule': crontab(minute=15),
+    },
+    # 골드/젬 원장 잔액 스냅샷 갱신
+    'take-currency-snapshots': {
+        'task': 'apps.characters.tasks.take_currency_snapshots_task',
+        'schedule': crontab(hour=3, minute=0),
+    },
+}
+
+# 퀘스트 완료 후처리(보상, 기록)를 Celery 작업으로 비동기 처리할지 여부
+QUEST_REWARDS_ASYNC = config('QUEST_REWARDS_ASYNC', default=False, cast=bool)
+
+# 스탯 변화 기록 월별 파티션 보관 기간과 분리한 파티션 아카이브 위치
+STAT_HISTORY_RETENTION_MONTHS = config('STAT_HISTORY_RETENTION_MONTHS', default=12, cast=int)
+STAT_HISTORY_ARCHIVE_DIR = config('STAT_HISTORY_ARCHIVE_DIR', default=str(BASE_DIR / 'archives' / 'stat_history'))
+
 # Custom user model
 AUTH_USER_MODEL = 'accounts.User'
\ No newline at end of file
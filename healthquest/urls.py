@@ -8,6 +8,7 @@ urlpatterns = [
     path('api/auth/', include('apps.accounts.urls')),
     path('api/characters/', include('apps.characters.urls')),
     path('api/quests/', include('apps.quests.urls')),
+    path('api/shop/', include('apps.shop.urls')),
 ]
 
 if settings.DEBUG: